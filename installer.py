@@ -3,13 +3,22 @@
 import PyInstaller.__main__
 
 from tft_bot import constants
+from tft_bot.vision.template_pack import build_template_pack
+from tft_bot.vision.template_pack import TEMPLATE_PACK_INDEX_PATH
+from tft_bot.vision.template_pack import TEMPLATE_PACK_PATH
+from tft_bot.vision.templates import TEMPLATES
+
+# Only the template pack is bundled, so the bot memory maps it instead of decoding every capture on start-up.
+build_template_pack(sources=TEMPLATES.get_sources())
 
 PyInstaller.__main__.run(
     [
         "tft.py",
         "--onefile",
         "--add-data",
-        "captures;captures",
+        f"{TEMPLATE_PACK_PATH};captures",
+        "--add-data",
+        f"{TEMPLATE_PACK_INDEX_PATH};captures",
         "--add-data",
         "tft_bot/resources;tft_bot/resources",
         "--add-data",
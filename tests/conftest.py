@@ -0,0 +1,59 @@
+"""
+Shared fixtures of the tests, rendering game windows from captures instead of capturing the screen.
+"""
+
+import cv2
+import numpy
+import pytest
+
+from tft_bot.vision.change import CHANGE_DETECTOR
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.rounds import ROUND_TRACKER
+
+# The window size every capture was made for.
+REFERENCE_WINDOW_SIZE = (1920, 1080)
+# The gray level of the empty game window the captures are pasted onto.
+BACKGROUND_LEVEL = 20
+
+
+def _render_frame(
+    captures: list[tuple[str | numpy.ndarray, int, int]], window_size: tuple[int, int] = REFERENCE_WINDOW_SIZE
+) -> FrameSnapshot:
+    """
+    Render a dark game window with captures pasted onto it.
+
+    Args:
+        captures: A list of (path or BGR pixels, position_x, position_y) to paste,
+          positioned in the reference window size.
+        window_size: The (width, height) of the rendered window. Other sizes than the reference size are rendered
+          at the reference size and then resized, like the game renders a smaller window. Defaults to 1920 x 1080.
+
+    Returns:
+        The frame of the rendered window.
+    """
+    width, height = REFERENCE_WINDOW_SIZE
+    pixels = numpy.full((height, width, 4), BACKGROUND_LEVEL, dtype=numpy.uint8)
+    for source, position_x, position_y in captures:
+        capture = cv2.cvtColor(cv2.imread(source) if isinstance(source, str) else source, cv2.COLOR_BGR2BGRA)
+        max_y = position_y + capture.shape[0]
+        max_x = position_x + capture.shape[1]
+        pixels[position_y:max_y, position_x:max_x] = capture
+
+    if window_size != REFERENCE_WINDOW_SIZE:
+        pixels = cv2.resize(pixels, window_size, interpolation=cv2.INTER_AREA)
+    return FrameSnapshot(
+        pixels=pixels, bounding_box=BoundingBox(0, 0, *window_size), reference_size=REFERENCE_WINDOW_SIZE
+    )
+
+
+@pytest.fixture(name="render_frame")
+def _render_frame_fixture():
+    """
+    Render game windows from captures, starting and ending the test without remembered regions or rounds.
+    """
+    ROUND_TRACKER.reset()
+    CHANGE_DETECTOR.invalidate()
+    yield _render_frame
+    ROUND_TRACKER.reset()
+    CHANGE_DETECTOR.invalidate()
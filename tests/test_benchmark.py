@@ -0,0 +1,56 @@
+"""
+Tests for the detector benchmark over a corpus of recorded frames.
+"""
+
+import json
+
+import cv2
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers import benchmark_helpers
+
+
+@pytest.fixture(name="corpus")
+def _corpus(render_frame, tmp_path):
+    """
+    Record a small corpus of game frames, showing the gold display, the round indicator and a shop trait.
+    """
+    captures = [
+        [(CONSTANTS["game"]["gold"]["3"], 800, 870), (CONSTANTS["game"]["round"]["2-"], 900, 30)],
+        [(CONSTANTS["game"]["gold"]["6"], 800, 870), (next(iter(CONSTANTS["game"]["trait"].values())), 600, 960)],
+    ]
+    for index, frame_captures in enumerate(captures):
+        cv2.imwrite(str(tmp_path / f"frame_{index}.png"), render_frame(frame_captures).bgra)
+    return tmp_path
+
+
+def test_benchmark_writes_a_baseline(corpus):
+    """
+    Benchmarking a corpus without a baseline times every detector on every frame and writes the baseline.
+    """
+    assert benchmark_helpers.main([str(corpus), "--repeat", "1"]) == 0
+    with open(corpus / benchmark_helpers.BASELINE_FILE_NAME, encoding="UTF-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    assert set(baseline) == set(benchmark_helpers.get_detectors())
+    assert baseline["gold_at_least"]["calls"] == 2
+    assert baseline["determine_minimum_round"]["captures_per_call"] == 1.0
+
+
+def test_benchmark_fails_on_a_regression(corpus):
+    """
+    A detector that captures more often than in the baseline fails the run.
+    """
+    baseline_path = corpus / "tight_baseline.json"
+    baseline = {"gold_at_least": {"calls": 2, "p50": 1000.0, "p95": 1000.0, "p99": 1000.0, "captures_per_call": 0.0}}
+    baseline_path.write_text(json.dumps(baseline), encoding="UTF-8")
+
+    assert not benchmark_helpers.run_benchmark(corpus_directory=str(corpus), baseline_path=str(baseline_path), repeat=1)
+
+
+def test_benchmark_fails_without_recorded_frames(tmp_path):
+    """
+    An empty corpus fails the benchmark instead of writing an empty baseline.
+    """
+    assert benchmark_helpers.main([str(tmp_path)]) == 1
+    assert not (tmp_path / benchmark_helpers.BASELINE_FILE_NAME).exists()
@@ -0,0 +1,27 @@
+"""
+Tests that the board scanner returns unit positions in the reference window size for any window size.
+"""
+
+import numpy
+import pytest
+
+from tft_bot.vision.board import BoardScanner
+from tft_bot.vision.geometry import Coordinates
+
+# A green health bar, as drawn above a unit on the board.
+HEALTH_BAR = numpy.full((8, 70, 3), (0, 200, 0), dtype=numpy.uint8)
+
+
+@pytest.mark.parametrize("window_size", [(1920, 1080), (1600, 900), (1280, 720)])
+def test_positions_are_in_reference_size(render_frame, window_size: tuple[int, int]):
+    """
+    A health bar is found at the same reference position, whatever the size of the window.
+    """
+    frame = render_frame([(HEALTH_BAR, 700, 400), (HEALTH_BAR, 1100, 520)], window_size=window_size)
+    positions = sorted(BoardScanner().scan(frame), key=lambda position: position.position_x)
+
+    expected_positions = [Coordinates(position_x=735, position_y=515), Coordinates(position_x=1135, position_y=672)]
+    assert len(positions) == len(expected_positions)
+    for position, expected_position in zip(positions, expected_positions):
+        assert abs(position.position_x - expected_position.position_x) <= 2
+        assert position.position_y == expected_position.position_y
@@ -0,0 +1,52 @@
+"""
+Tests that detectors skipping unchanged regions still notice a single changed glyph.
+"""
+
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.vision.change import CHANGE_DETECTOR
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.gold import GOLD_READER
+from tft_bot.vision.rounds import ROUND_TRACKER
+
+
+@pytest.mark.parametrize("first_gold,second_gold", [(3, 4), (0, 6), (1, 2), (5, 6)])
+def test_gold_digit_change_invalidates_cache(render_frame, first_gold: int, second_gold: int):
+    """
+    A gold display that changes a single digit is read again instead of returning the cached value.
+    """
+    first_frame = render_frame([(CONSTANTS["game"]["gold"][str(first_gold)], 800, 870)])
+    assert GOLD_READER.read(first_frame) == first_gold
+
+    CHANGE_DETECTOR.advance_tick()
+    second_frame = render_frame([(CONSTANTS["game"]["gold"][str(second_gold)], 800, 870)])
+    assert GOLD_READER.read(second_frame) == second_gold
+
+
+def test_unchanged_gold_is_cached(render_frame):
+    """
+    A gold display that did not change re-uses the cached value.
+    """
+    first_frame = render_frame([(CONSTANTS["game"]["gold"]["3"], 800, 870)])
+    assert GOLD_READER.read(first_frame) == 3
+    first_tick = CHANGE_DETECTOR.tick
+
+    CHANGE_DETECTOR.advance_tick()
+    second_frame = render_frame([(CONSTANTS["game"]["gold"]["3"], 800, 870)])
+    assert GOLD_READER.read(second_frame) == 3
+    assert CHANGE_DETECTOR.unchanged_since(name="gold", frame=second_frame, region=BoundingBox(780, 850, 970, 920)) == (
+        first_tick
+    )
+
+
+def test_round_change_invalidates_cache(render_frame):
+    """
+    A round indicator going from the second to the third major round is read again.
+    """
+    first_frame = render_frame([(CONSTANTS["game"]["round"]["2-"], 900, 30)])
+    assert ROUND_TRACKER.update(first_frame) == 2
+
+    CHANGE_DETECTOR.advance_tick()
+    second_frame = render_frame([(CONSTANTS["game"]["round"]["3-"], 900, 30)])
+    assert ROUND_TRACKER.update(second_frame) == 3
@@ -0,0 +1,56 @@
+"""
+Tests that the gold reader reads every digit it has a capture for, in any window size,
+and never misreads a digit it has no capture for.
+"""
+
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.vision.gold import GoldReader
+from tft_bot.vision.templates import TemplateBank
+
+# Window sizes smaller than the reference size.
+SCALED_WINDOW_SIZES = [(1280, 720), (1366, 768), (1600, 900)]
+
+
+@pytest.mark.parametrize("gold", list(CONSTANTS["game"]["gold"]))
+def test_digit_with_capture_is_read(render_frame, gold: str):
+    """
+    A digit with a capture is read as itself.
+    """
+    frame = render_frame([(CONSTANTS["game"]["gold"][gold], 800, 870)])
+    assert GoldReader(TemplateBank.from_constants()).read(frame) == int(gold)
+
+
+@pytest.mark.parametrize("window_size", SCALED_WINDOW_SIZES)
+@pytest.mark.parametrize("gold", list(CONSTANTS["game"]["gold"]))
+def test_digit_is_read_in_scaled_window(render_frame, window_size: tuple[int, int], gold: str):
+    """
+    A digit with a capture is read as itself in a window smaller than the reference size,
+    wherever the display lands between two pixels.
+    """
+    gold_reader = GoldReader(TemplateBank.from_constants())
+    for offset in range(3):
+        frame = render_frame([(CONSTANTS["game"]["gold"][gold], 800 + offset, 870 + offset)], window_size=window_size)
+        assert gold_reader.read(frame) == int(gold)
+
+
+@pytest.mark.parametrize("window_size", SCALED_WINDOW_SIZES)
+@pytest.mark.parametrize("gold", list(CONSTANTS["game"]["gold"]))
+def test_digit_without_capture_is_not_misread_in_scaled_window(render_frame, window_size: tuple[int, int], gold: str):
+    """
+    A digit without a capture is read as None in a window smaller than the reference size.
+    """
+    sources = {f"game.gold.{digit}": path for digit, path in CONSTANTS["game"]["gold"].items() if digit != gold}
+    frame = render_frame([(CONSTANTS["game"]["gold"][gold], 800, 870)], window_size=window_size)
+    assert GoldReader(TemplateBank(sources)).read(frame) is None
+
+
+@pytest.mark.parametrize("gold", list(CONSTANTS["game"]["gold"]))
+def test_digit_without_capture_is_not_misread(render_frame, gold: str):
+    """
+    A digit without a capture is read as None instead of the closest other digit.
+    """
+    sources = {f"game.gold.{digit}": path for digit, path in CONSTANTS["game"]["gold"].items() if digit != gold}
+    frame = render_frame([(CONSTANTS["game"]["gold"][gold], 800, 870)])
+    assert GoldReader(TemplateBank(sources)).read(frame) is None
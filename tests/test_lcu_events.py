@@ -0,0 +1,258 @@
+"""
+Tests for the LCU event listener against a local stub of the LCU WebSocket.
+"""
+
+import base64
+import hashlib
+import json
+import queue
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from tft_bot.league_api import lcu_events
+from tft_bot.league_api.lcu_events import LCUEventListener
+
+# The GUID every WebSocket server appends to the client key, see RFC 6455.
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+SEARCH_STATE_URI = "/lol-lobby/v2/lobby/matchmaking/search-state"
+
+
+class StubLCUServer:
+    """
+    A plain-text WebSocket server that accepts one connection at a time, records what the client sends
+    and lets tests push LCU events to it.
+    """
+
+    def __init__(self):
+        """
+        Init method to start listening on a free local port.
+        """
+        self._server_socket = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server_socket.getsockname()[1]
+        self.received: queue.Queue = queue.Queue()
+        self.connections: queue.Queue = queue.Queue()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        """
+        Accept clients and answer their WebSocket handshake until the server is closed.
+        """
+        while True:
+            try:
+                connection, _ = self._server_socket.accept()
+            except OSError:
+                return
+
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += connection.recv(1024)
+            headers = dict(line.split(": ", 1) for line in request.decode().split("\r\n")[1:] if ": " in line)
+            accept_key = base64.b64encode(
+                hashlib.sha1((headers["Sec-WebSocket-Key"] + WEBSOCKET_GUID).encode()).digest()
+            ).decode()
+            connection.sendall(
+                (
+                    "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                    f"Sec-WebSocket-Accept: {accept_key}\r\n\r\n"
+                ).encode()
+            )
+            self.connections.put(connection)
+            threading.Thread(target=self._read, args=(connection,), daemon=True).start()
+
+    def _read(self, connection: socket.socket) -> None:
+        """
+        Read the masked frames a client sends and record their text.
+
+        Args:
+            connection: The connected client.
+        """
+        try:
+            while True:
+                first_byte, second_byte = _receive_exactly(connection, 2)
+                length = second_byte & 0x7F
+                if length == 126:
+                    (length,) = struct.unpack(">H", _receive_exactly(connection, 2))
+                elif length == 127:
+                    (length,) = struct.unpack(">Q", _receive_exactly(connection, 8))
+                mask = _receive_exactly(connection, 4)
+                payload = bytes(
+                    byte ^ mask[index % 4] for index, byte in enumerate(_receive_exactly(connection, length))
+                )
+                if first_byte & 0x0F == 0x8:
+                    # Answer the close frame, like the LCU does.
+                    connection.sendall(bytes([0x88, 0]))
+                    return
+                self.received.put(payload.decode())
+        except OSError:
+            return
+
+    def send_event(self, connection: socket.socket, uri: str, data: dict | None, event_type: str = "Update") -> None:
+        """
+        Push an LCU event for an endpoint.
+
+        Args:
+            connection: The connected client.
+            uri: The path of the endpoint.
+            data: The new data of the endpoint.
+            event_type: The type of the event: Create, Update or Delete. Defaults to Update.
+        """
+        payload = json.dumps(
+            [8, lcu_events.get_event_name(uri), {"uri": uri, "eventType": event_type, "data": data}]
+        ).encode()
+        if len(payload) < 126:
+            header = bytes([0x81, len(payload)])
+        else:
+            header = bytes([0x81, 126]) + struct.pack(">H", len(payload))
+        connection.sendall(header + payload)
+
+    def close(self) -> None:
+        """
+        Stop accepting clients.
+        """
+        self._server_socket.close()
+
+
+def _receive_exactly(connection: socket.socket, length: int) -> bytes:
+    """
+    Receive an exact amount of bytes from a socket.
+
+    Args:
+        connection: The socket to receive from.
+        length: The amount of bytes to receive.
+
+    Returns:
+        The received bytes.
+    """
+    data = b""
+    while len(data) < length:
+        chunk = connection.recv(length - len(data))
+        if not chunk:
+            raise OSError("Connection closed")
+        data += chunk
+    return data
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    """
+    Wait until a condition holds.
+
+    Args:
+        condition: A function returning whether the condition holds.
+        timeout: The maximum time to wait, in seconds. Defaults to 5.0.
+
+    Returns:
+        True if the condition held within the timeout, False if not.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture(name="stub_server")
+def _stub_server(monkeypatch):
+    """
+    Start a stub LCU server and point the listener at it over plain text.
+    """
+    monkeypatch.setattr(lcu_events, "WEBSOCKET_URL", "ws://127.0.0.1:{port}/")
+    monkeypatch.setattr(lcu_events, "RECONNECT_DELAY", 0.05)
+    server = StubLCUServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture(name="listener")
+def _listener(stub_server: StubLCUServer):
+    """
+    Start a listener connected to the stub LCU server.
+    """
+    listener = LCUEventListener()
+    listener.start(port=stub_server.port, auth_token="token", certificate="unused.pem")
+    assert _wait_until(lambda: listener.connected)
+    yield listener
+    listener.stop()
+
+
+def test_subscribes_to_every_tracked_endpoint(stub_server: StubLCUServer, listener: LCUEventListener):
+    """
+    The listener subscribes to the event of every tracked endpoint once connected.
+    """
+    assert listener.connected
+    subscriptions = {stub_server.received.get(timeout=5) for _ in lcu_events.TRACKED_URIS}
+    assert subscriptions == {
+        json.dumps([lcu_events.SUBSCRIBE_OPCODE, lcu_events.get_event_name(uri)]) for uri in lcu_events.TRACKED_URIS
+    }
+
+
+def test_update_is_stored_and_wakes_waiters(stub_server: StubLCUServer, listener: LCUEventListener):
+    """
+    An event updates the state of its endpoint and wakes up everything waiting for a change.
+    """
+    connection = stub_server.connections.get(timeout=5)
+    assert listener.get_state(SEARCH_STATE_URI) == (False, None)
+
+    threading.Timer(0.1, stub_server.send_event, args=(connection, SEARCH_STATE_URI, {"searchState": "Found"})).start()
+    started_at = time.monotonic()
+    assert listener.wait_for_event(timeout=3)
+    assert time.monotonic() - started_at < 1
+    assert _wait_until(lambda: listener.get_state(SEARCH_STATE_URI) == (True, {"searchState": "Found"}))
+
+    stub_server.send_event(connection, SEARCH_STATE_URI, None, event_type="Delete")
+    assert _wait_until(lambda: listener.get_state(SEARCH_STATE_URI) == (True, None))
+
+
+def test_disconnect_drops_state_and_reconnects(stub_server: StubLCUServer, listener: LCUEventListener):
+    """
+    A closed WebSocket drops all state, and the listener connects again.
+    """
+    connection = stub_server.connections.get(timeout=5)
+    stub_server.send_event(connection, SEARCH_STATE_URI, {"searchState": "Searching"})
+    assert _wait_until(lambda: listener.get_state(SEARCH_STATE_URI)[0])
+
+    connection.shutdown(socket.SHUT_RDWR)
+    connection.close()
+    assert _wait_until(lambda: listener.get_state(SEARCH_STATE_URI) == (False, None))
+    assert stub_server.connections.get(timeout=5) is not None
+    assert _wait_until(lambda: listener.connected)
+
+
+def test_primed_state_is_only_trusted_for_a_poll_interval(listener: LCUEventListener, monkeypatch):
+    """
+    Polled data of an endpoint without events goes stale after PRIMED_MAX_AGE, event data after max_age.
+    """
+    monkeypatch.setattr(lcu_events, "PRIMED_MAX_AGE", 0.1)
+    listener.prime(SEARCH_STATE_URI, {"searchState": "Searching"})
+    assert listener.get_state(SEARCH_STATE_URI) == (True, {"searchState": "Searching"})
+
+    time.sleep(0.2)
+    assert listener.get_state(SEARCH_STATE_URI) == (False, None)
+
+
+def test_polling_fallback_without_websocket(monkeypatch):
+    """
+    Without a reachable WebSocket, no state is handed out and polled data is not kept, so callers keep polling.
+    """
+    monkeypatch.setattr(lcu_events, "WEBSOCKET_URL", "ws://127.0.0.1:{port}/")
+    server = StubLCUServer()
+    port = server.port
+    server.close()
+
+    listener = LCUEventListener()
+    listener.start(port=port, auth_token="token", certificate="unused.pem")
+    try:
+        time.sleep(0.2)
+        assert not listener.connected
+        listener.prime(SEARCH_STATE_URI, {"searchState": "Found"})
+        assert listener.get_state(SEARCH_STATE_URI) == (False, None)
+
+        started_at = time.monotonic()
+        assert not listener.wait_for_event(timeout=0.1)
+        assert time.monotonic() - started_at >= 0.1
+    finally:
+        listener.stop()
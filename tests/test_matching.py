@@ -0,0 +1,104 @@
+"""
+Tests that templates are found at their precision in smaller 16:9 windows, not only in the reference window size.
+"""
+
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.vision.matching import match_template
+from tft_bot.vision.shop import SHOP_REGION
+from tft_bot.vision.shop import ShopReader
+
+WINDOW_SIZES = [(1920, 1080), (1600, 900), (1366, 768), (1280, 720)]
+# Positions in the reference window size, a few pixels apart to land on different sub-pixel phases when resized.
+POSITIONS = [(900, 30), (901, 31), (903, 33)]
+TRAIT = next(iter(CONSTANTS["game"]["trait"]))
+
+
+def _assert_found_at(frame, search_result, position_x: int, position_y: int) -> None:
+    """
+    Assert that a template was found at a position of the reference window size, give or take the resizing.
+
+    Args:
+        frame: The frame the template was searched in.
+        search_result: The search result to check.
+        position_x: The expected x position in the reference window size.
+        position_y: The expected y position in the reference window size.
+    """
+    assert search_result is not None
+    assert abs(search_result.position_x - frame.scale.scale_x(position_x)) <= 2
+    assert abs(search_result.position_y - frame.scale.scale_y(position_y)) <= 2
+
+
+@pytest.mark.parametrize("window_size", WINDOW_SIZES)
+@pytest.mark.parametrize("position_x,position_y", POSITIONS)
+@pytest.mark.parametrize("current_round", ["1-1", "2-2", "2-5"])
+def test_round_display_is_found(render_frame, window_size, position_x: int, position_y: int, current_round: str):
+    """
+    A round display is found at the default precision in its region.
+    """
+    frame = render_frame([(CONSTANTS["game"]["round"][current_round], position_x, position_y)], window_size)
+
+    _assert_found_at(frame, match_template(frame, CONSTANTS["game"]["round"][current_round]), position_x, position_y)
+
+
+@pytest.mark.parametrize("window_size", WINDOW_SIZES)
+@pytest.mark.parametrize("position_x,position_y", [(860, 700), (861, 701), (863, 703)])
+def test_exit_now_is_found(render_frame, window_size, position_x: int, position_y: int):
+    """
+    The original exit now button is found at the default precision in the center dialog.
+    """
+    path = CONSTANTS["game"]["exit_now"]["original"]
+    frame = render_frame([(path, position_x, position_y)], window_size)
+
+    _assert_found_at(frame, match_template(frame, path), position_x, position_y)
+
+
+@pytest.mark.parametrize("window_size", WINDOW_SIZES)
+@pytest.mark.parametrize("position_x,position_y", POSITIONS)
+def test_draft_active_is_found(render_frame, window_size, position_x: int, position_y: int):
+    """
+    The active draft is found at the precision the game loop checks it with.
+    """
+    path = CONSTANTS["game"]["round"]["draft_active"]
+    frame = render_frame([(path, position_x, position_y)], window_size)
+
+    _assert_found_at(frame, match_template(frame, path, precision=0.95), position_x, position_y)
+
+
+@pytest.mark.parametrize("window_size", WINDOW_SIZES)
+@pytest.mark.parametrize("position_x,position_y", [(800, 100), (801, 101), (803, 103)])
+def test_choose_an_augment_is_found(render_frame, window_size, position_x: int, position_y: int):
+    """
+    The augment choice is found coarse-to-fine at the precision the game loop checks it with.
+    """
+    path = CONSTANTS["game"]["gamelogic"]["choose_an_augment"]
+    frame = render_frame([(path, position_x, position_y)], window_size)
+
+    _assert_found_at(frame, match_template(frame, path, precision=0.95), position_x, position_y)
+
+
+@pytest.mark.parametrize("window_size", WINDOW_SIZES)
+@pytest.mark.parametrize("offset_x", [0, 1, 3])
+def test_trait_is_found_in_shop(render_frame, window_size, offset_x: int):
+    """
+    A trait icon is found in the shop at the shop reader's precision.
+    """
+    position_x = SHOP_REGION.min_x + 100 + offset_x
+    position_y = SHOP_REGION.min_y + 40
+    frame = render_frame([(CONSTANTS["game"]["trait"][TRAIT], position_x, position_y)], window_size)
+    shop = ShopReader().read(frame=frame, traits=[TRAIT])
+
+    assert list(shop) == [0]
+    _assert_found_at(frame, shop[0][TRAIT], position_x, position_y)
+
+
+@pytest.mark.parametrize("window_size", WINDOW_SIZES)
+def test_other_round_display_is_not_found(render_frame, window_size):
+    """
+    The relaxed precision of smaller windows does not mistake one round display for another.
+    """
+    frame = render_frame([(CONSTANTS["game"]["round"]["2-2"], 900, 30)], window_size)
+
+    assert match_template(frame, CONSTANTS["game"]["round"]["2-5"]) is None
+    assert match_template(frame, CONSTANTS["game"]["round"]["draft_active"], precision=0.95) is None
@@ -0,0 +1,27 @@
+"""
+Tests that the round tracker follows the major round and keeps it while no marker is visible.
+"""
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.vision.rounds import ROUND_TRACKER
+
+
+def test_round_display_is_tracked(render_frame):
+    """
+    The major round of the round display is confirmed, and the next one is picked up.
+    """
+    assert ROUND_TRACKER.update(render_frame([(CONSTANTS["game"]["round"]["2-"], 900, 30)])) == 2
+    assert ROUND_TRACKER.update(render_frame([(CONSTANTS["game"]["round"]["3-"], 900, 30)])) == 3
+    assert ROUND_TRACKER.major_round == 3
+
+
+def test_miss_keeps_the_last_confirmed_round(render_frame):
+    """
+    A frame without any marker returns the last confirmed major round, 0 only before one was confirmed.
+    """
+    assert ROUND_TRACKER.update(render_frame([])) == 0
+    assert ROUND_TRACKER.update(render_frame([(CONSTANTS["game"]["round"]["2-"], 900, 30)])) == 2
+    assert ROUND_TRACKER.update(render_frame([])) == 2
+
+    ROUND_TRACKER.reset()
+    assert ROUND_TRACKER.update(render_frame([])) == 0
@@ -0,0 +1,28 @@
+"""
+Tests that the shop reader finds trait icons on the border of two shop slots exactly once.
+"""
+
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.vision.shop import SHOP_REGION
+from tft_bot.vision.shop import ShopReader
+
+TRAIT = next(iter(CONSTANTS["game"]["trait"]))
+# The border of the first and the second shop slot.
+SLOT_BORDER_X = SHOP_REGION.min_x + SHOP_REGION.get_width() // 5
+
+
+@pytest.mark.parametrize(
+    "offset_x,slot",
+    [(-60, 0), (-18, 0), (-11, 0), (-9, 1), (-2, 1), (40, 1)],
+)
+def test_trait_icon_on_slot_border_is_found_once(render_frame, offset_x: int, slot: int):
+    """
+    A trait icon is found in exactly one slot, the one holding its center, even if it straddles a slot border.
+    """
+    frame = render_frame([(CONSTANTS["game"]["trait"][TRAIT], SLOT_BORDER_X + offset_x, SHOP_REGION.min_y + 40)])
+    shop = ShopReader().read(frame=frame, traits=[TRAIT])
+
+    assert list(shop) == [slot]
+    assert shop[slot][TRAIT].position_x == SLOT_BORDER_X + offset_x
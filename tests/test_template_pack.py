@@ -0,0 +1,66 @@
+"""
+Tests that the template pack carries the statistics, regions and pyramid levels of its templates into the bot.
+"""
+
+from functools import partial
+
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.constants import template_regions
+from tft_bot.vision import template_pack
+from tft_bot.vision import templates
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.regions import RegionRegistry
+from tft_bot.vision.templates import TemplateBank
+
+SOURCES = {
+    "game.gamelogic.choose_an_augment": CONSTANTS["game"]["gamelogic"]["choose_an_augment"],
+    "game.round.2-2": CONSTANTS["game"]["round"]["2-2"],
+}
+
+
+@pytest.fixture(name="pack_paths")
+def _pack_paths(tmp_path):
+    """
+    Build a template pack of SOURCES, returning the paths of the pack and its index.
+    """
+    pack_path = str(tmp_path / "template_pack.npy")
+    index_path = str(tmp_path / "template_pack.json")
+    assert template_pack.build_template_pack(sources=SOURCES, pack_path=pack_path, index_path=index_path) == 2
+    return pack_path, index_path
+
+
+def test_pack_holds_statistics_regions_and_pyramid_levels(pack_paths):
+    """
+    Every packed template is loaded with the statistics, region and pyramid levels it was packed with.
+    """
+    pack_path, index_path = pack_paths
+    packed_templates = template_pack.load_template_pack(pack_path=pack_path, index_path=index_path)
+
+    augment = packed_templates["game.gamelogic.choose_an_augment"]
+    assert augment.region == template_regions[augment.path]
+    assert augment.pyramid_levels == 2
+    assert augment.mean == pytest.approx(float(augment.image.mean()), abs=0.001)
+    assert augment.standard_deviation == pytest.approx(float(augment.image.std()), abs=0.001)
+    assert packed_templates["game.round.2-2"].pyramid_levels == 0
+
+
+def test_template_bank_reads_regions_and_pyramid_levels_from_pack(pack_paths, monkeypatch):
+    """
+    Loading the template bank hands the packed regions to the region registry and the pyramid levels to templates.
+    """
+    pack_path, index_path = pack_paths
+    monkeypatch.setattr(
+        templates, "load_template_pack", partial(template_pack.load_template_pack, pack_path, index_path)
+    )
+    region_registry = RegionRegistry(regions={})
+    template_bank = TemplateBank(SOURCES)
+    template_bank.load(region_registry=region_registry)
+
+    augment_path = SOURCES["game.gamelogic.choose_an_augment"]
+    assert template_bank.get("game.gamelogic.choose_an_augment").pyramid_levels == 2
+    assert region_registry.get_region(augment_path) == BoundingBox(*template_regions[augment_path])
+    assert region_registry.get_region(SOURCES["game.round.2-2"]) == BoundingBox(
+        *template_regions[SOURCES["game.round.2-2"]]
+    )
@@ -0,0 +1,147 @@
+"""
+Tests for the circuit breaker of the HTTP transport.
+"""
+
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import threading
+import time
+
+import pytest
+import requests
+
+from tft_bot.league_api.transport import CircuitBreaker
+from tft_bot.league_api.transport import CircuitOpenError
+from tft_bot.league_api.transport import CircuitState
+from tft_bot.league_api.transport import ResilientSession
+
+# Nothing listens on the discard port, so every connection is refused right away.
+REFUSED_URL = "http://127.0.0.1:9/lol-gameflow/v1/session"
+
+
+class EchoHeaderHandler(BaseHTTPRequestHandler):
+    """
+    Answers every request with the value of its Authorization header.
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Answer a GET request.
+        """
+        body = self.headers.get("Authorization", "").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Keep the test output clean.
+        """
+
+
+def test_half_open_lets_a_single_probe_through():
+    """
+    Once the reset timeout passed, only one request is let through until its outcome is recorded.
+    """
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert not circuit_breaker.allow_request()
+
+    time.sleep(0.1)
+    assert [circuit_breaker.allow_request() for _ in range(3)] == [True, False, False]
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.allow_request()
+    assert circuit_breaker.counters["rejected"] == 3
+
+
+def test_failed_probe_opens_the_circuit_again():
+    """
+    A failing probe opens the circuit for another reset timeout.
+    """
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+    time.sleep(0.1)
+
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert not circuit_breaker.allow_request()
+
+
+def test_retries_count_as_one_failure():
+    """
+    A request that fails all of its retries is recorded as a single failure.
+    """
+    session = ResilientSession(max_retries=2)
+    for _ in range(session.circuit_breaker.failure_threshold - 1):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get(REFUSED_URL)
+
+    assert session.circuit_breaker.counters["failures"] == session.circuit_breaker.failure_threshold - 1
+    assert session.circuit_breaker.state == CircuitState.CLOSED
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(REFUSED_URL)
+    assert session.circuit_breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        session.get(REFUSED_URL)
+
+
+def test_interrupted_probe_opens_the_circuit_again(monkeypatch):
+    """
+    A probe interrupted by an exception that is not a request exception still records its outcome,
+    instead of leaving the circuit half open forever.
+    """
+    session = ResilientSession(circuit_reset_timeout=0.05)
+    session.circuit_breaker.failure_threshold = 1
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(REFUSED_URL)
+    time.sleep(0.1)
+
+    def interrupt(*_args, **_kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(session._get_thread_session(), "request", interrupt)  # pylint: disable=protected-access
+    with pytest.raises(KeyboardInterrupt):
+        session.get(REFUSED_URL)
+    assert session.circuit_breaker.state == CircuitState.OPEN
+
+
+def test_every_thread_sends_through_its_own_session():
+    """
+    Requests from different threads use different sessions, with the settings of the shared session.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHeaderHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = ResilientSession()
+    session.auth = ("riot", "token")
+    url = f"http://127.0.0.1:{server.server_port}/lol-gameflow/v1/session"
+
+    # Every worker waits for the others, so each of them sends one request.
+    barrier = threading.Barrier(4)
+
+    def send_request():
+        barrier.wait(timeout=5)
+        response = session.get(url)
+        return response.text, session._get_thread_session()  # pylint: disable=protected-access
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: send_request(), range(4)))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert {text for text, _ in results} == {"Basic " + base64.b64encode(b"riot:token").decode()}
+    thread_sessions = {id(thread_session) for _, thread_session in results}
+    assert len(thread_sessions) == 4
+    assert all(thread_session.get_adapter(url) is session.get_adapter(url) for _, thread_session in results)
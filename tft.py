@@ -14,26 +14,39 @@ import keyboard
 from loguru import logger
 import psutil
 import pyautogui as auto
+from pytesseract import pytesseract
 import requests
 from requests import HTTPError
 from win32process import DETACHED_PROCESS
 
 from tft_bot import config
+from tft_bot.constants import client_error_messages
 from tft_bot.constants import CONSTANTS
 from tft_bot.constants import exit_now_images
 from tft_bot.constants import league_processes
 from tft_bot.constants import message_exit_buttons
 from tft_bot.economy.base import EconomyMode
 from tft_bot.helpers import system_helpers
+from tft_bot.helpers.benchmark_helpers import run_benchmark
 from tft_bot.helpers.click_helpers import click_to
 from tft_bot.helpers.click_helpers import click_to_image
 from tft_bot.helpers.click_helpers import move_to
 from tft_bot.helpers.screen_helpers import calculate_window_click_offset
 from tft_bot.helpers.screen_helpers import check_league_game_size
+from tft_bot.helpers.screen_helpers import determine_minimum_round
 from tft_bot.helpers.screen_helpers import get_board_positions
 from tft_bot.helpers.screen_helpers import get_on_screen_in_client
 from tft_bot.helpers.screen_helpers import get_on_screen_in_game
+from tft_bot.helpers.screen_helpers import get_on_screen_many
+from tft_bot.helpers.screen_helpers import start_tick
 from tft_bot.league_api import league_api_integration
+from tft_bot.league_api.async_integration import check_client_health
+from tft_bot.league_api.async_integration import refresh_game_state
+from tft_bot.vision.capture_thread import start_capture_thread
+from tft_bot.vision.capture_thread import stop_capture_threads
+from tft_bot.vision.rounds import ROUND_TRACKER
+from tft_bot.vision.telemetry import MATCH_TELEMETRY
+from tft_bot.vision.templates import TEMPLATES
 
 auto.FAILSAFE = False
 GAME_COUNT = 0
@@ -253,19 +266,20 @@ def queue() -> None:  # pylint: disable=too-many-branches
         if not PLAY_NEXT_GAME:
             evaluate_next_game_logic()
 
-        if not LCU_INTEGRATION.client_connected():
+        client_health = check_client_health(LCU_INTEGRATION)
+        if not client_health.client_connected:
             logger.warning("Client is not connected or sending confusing messages, restarting the client")
             restart_league_client()
             time.sleep(5)
             continue
 
-        if LCU_INTEGRATION.session_expired():
+        if client_health.session_expired():
             logger.warning("Our login session expired, restarting the client")
             restart_league_client()
             time.sleep(5)
             continue
 
-        if LCU_INTEGRATION.in_game():
+        if client_health.in_game():
             logger.info("A game is running, switching to game logic")
             break
 
@@ -273,9 +287,8 @@ def queue() -> None:  # pylint: disable=too-many-branches
             start_queue_repeating = False
             if LCU_INTEGRATION.found_queue() and not LCU_INTEGRATION.queue_accepted():
                 LCU_INTEGRATION.accept_queue()
-                time.sleep(3)
-            else:
-                time.sleep(3)
+            # Returns as soon as the client reports a queue pop, falls back to waiting the full time while polling.
+            LCU_INTEGRATION.wait_for_event(timeout=3)
             continue
 
         if not PLAY_NEXT_GAME:
@@ -330,18 +343,27 @@ def loading_match() -> None:
 
 def start_match() -> None:
     """Do initial first round pathing to pick the first champ."""
+    ROUND_TRACKER.reset()
     time.sleep(5)
     if get_on_screen_in_game(CONSTANTS["game"]["round"]["1-1"]):
         vote_option_offset = calculate_window_click_offset(
             window_title=CONSTANTS["window_titles"]["game"], position_x=34, position_y=435
         )
+        vote_confirm_offset = calculate_window_click_offset(
+            window_title=CONSTANTS["window_titles"]["game"], position_x=334, position_y=560
+        )
         move_to(position_x=vote_option_offset.position_x, position_y=vote_option_offset.position_y)
         time.sleep(1)
-        click_to(position_x=vote_option_offset.position_x + 300, position_y=vote_option_offset.position_y + 125)
+        click_to(position_x=vote_confirm_offset.position_x, position_y=vote_confirm_offset.position_y)
         time.sleep(25)
 
     logger.info("Initial vote complete, continuing with game")
-    main_game_loop(economy_mode=config.get_economy_mode(system_helpers=system_helpers))
+    if config.get_capture_fps():
+        start_capture_thread(window_title=CONSTANTS["window_titles"]["game"], fps=config.get_capture_fps())
+    try:
+        main_game_loop(economy_mode=config.get_economy_mode(system_helpers=system_helpers))
+    finally:
+        stop_capture_threads()
 
 
 def shared_draft_pathing() -> None:
@@ -385,32 +407,22 @@ def wait_for_internet() -> None:
         time.sleep(60)
 
 
-def check_if_client_error() -> bool:  # pylint: disable=too-many-return-statements
+def check_if_client_error() -> bool:
     """Check if any client error is detected.
     If any are detected, the League client is restarted.
 
     Returns:
         bool: True if a client error message was detected.
     """
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["down_for_maintenance"]):
-        logger.info("League down for maintenance, delaying restart for 5 minutes!")
-        return acknowledge_error_and_restart_league(delay=300)
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["failed_to_reconnect"]):
-        logger.info("Failed to reconnect!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["login_servers_down"]):
-        logger.info("Login servers down!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["session_expired"]):
-        logger.info("Session expired!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["unexpected_error_with_session"]):
-        logger.info("Unexpected error with session!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["unexpected_login_error"]):
-        logger.info("Unexpected login error!")
-        return acknowledge_error_and_restart_league()
-    return False
+    search_results = get_on_screen_many(
+        window_title=CONSTANTS["window_titles"]["client"], paths=list(client_error_messages), first_hit=True
+    )
+    if not search_results:
+        return False
+
+    message, delay = client_error_messages[next(iter(search_results))]
+    logger.info(message)
+    return acknowledge_error_and_restart_league(delay=delay)
 
 
 def acknowledge_error_and_restart_league(delay: int = 5) -> bool:
@@ -440,13 +452,13 @@ def check_screen_for_exit_button() -> bool:
         True if any known exit buttons were found, False if not.
 
     """
-    for image in exit_now_images:
-        if click_to_image(image_search_result=get_on_screen_in_game(image)):
-            logger.info("End of game detected, exiting")
-            break
-    else:
+    search_results = get_on_screen_many(
+        window_title=CONSTANTS["window_titles"]["game"], paths=exit_now_images, first_hit=True
+    )
+    if not any(click_to_image(image_search_result=search_result) for search_result in search_results.values()):
         return False
 
+    logger.info("End of game detected, exiting")
     time.sleep(5)
     return True
 
@@ -468,6 +480,8 @@ def check_if_game_complete(wait_for_exit_buttons: bool = False) -> bool:
     if check_screen_for_exit_button():
         return True
 
+    # The checks below are answered from the snapshots, so both clients are only asked once and concurrently.
+    refresh_game_state(LCU_INTEGRATION, GAME_CLIENT_INTEGRATION)
     if LCU_INTEGRATION.in_game():
         if LCU_INTEGRATION.should_reconnect():
             attempt_reconnect_to_existing_game()
@@ -528,43 +542,6 @@ def check_if_post_game() -> bool:
     return attempt_reconnect_to_existing_game()
 
 
-def determine_minimum_round() -> int:
-    """
-    Determines minimum round we are at.
-    Prioritizes PvE markers, falls back to the round display.
-
-    Returns:
-        The major round as an integer.
-
-    """
-    if get_on_screen_in_game(CONSTANTS["game"]["round"]["krugs_inactive"], 0.9) or get_on_screen_in_game(
-        CONSTANTS["game"]["round"]["krugs_active"], 0.9
-    ):
-        return 2
-
-    if get_on_screen_in_game(CONSTANTS["game"]["round"]["wolves_inactive"], 0.9) or get_on_screen_in_game(
-        CONSTANTS["game"]["round"]["wolves_active"], 0.9
-    ):
-        return 3
-
-    if get_on_screen_in_game(CONSTANTS["game"]["round"]["birds_inactive"], 0.9) or get_on_screen_in_game(
-        CONSTANTS["game"]["round"]["birds_active"], 0.9
-    ):
-        return 4
-
-    if get_on_screen_in_game(CONSTANTS["game"]["round"]["elder_dragon_inactive"], 0.9) or get_on_screen_in_game(
-        CONSTANTS["game"]["round"]["elder_dragon_active"], 0.9
-    ):
-        return 5
-
-    for i in range(1, 7):
-        if get_on_screen_in_game(CONSTANTS["game"]["round"][f"{i}-"]):
-            return i
-
-    logger.debug("Could not determine minimum round, returning 0.")
-    return 0
-
-
 def main_game_loop(economy_mode: EconomyMode) -> None:
     """
     The main in-game loop.
@@ -580,6 +557,9 @@ def main_game_loop(economy_mode: EconomyMode) -> None:
             time.sleep(5)
             continue
 
+        # Start every tick with a fresh capture, which all detectors in this tick share.
+        start_tick()
+
         post_game = check_if_post_game()
         if post_game:
             match_complete()
@@ -871,6 +851,38 @@ def wait_for_start_confirmation():
         sys.exit(0)
 
 
+def load_vision(storage_path: str) -> None:
+    """
+    Load every template and set where the match telemetry is written to.
+
+    Args:
+        storage_path: The base storage path where all of our files should go.
+    """
+    TEMPLATES.load()
+    MATCH_TELEMETRY.set_storage_path(storage_path)
+
+
+def run_benchmark_if_requested() -> None:
+    """
+    If the --benchmark flag was given, time every detector on its directory of recorded frames and exit.
+    Exits with 1 if a detector regressed compared to the baseline, see benchmark_helpers.run_benchmark.
+    """
+    corpus_directory = config.get_benchmark_corpus()
+    if not corpus_directory:
+        return
+
+    tesseract_location = system_helpers.determine_tesseract_ocr_install_location() + "\\tesseract.exe"
+    if os.path.isfile(tesseract_location):
+        pytesseract.tesseract_cmd = tesseract_location
+
+    passed = run_benchmark(
+        corpus_directory=corpus_directory,
+        baseline_path=config.get_benchmark_baseline(),
+        update_baseline=config.update_benchmark_baseline(),
+    )
+    sys.exit(0 if passed else 1)
+
+
 @logger.catch
 def main():
     """Entrypoint function to initialize most of the code.
@@ -887,6 +899,7 @@ def main():
             break
 
     config.load_config(storage_path=storage_path)
+    load_vision(storage_path=storage_path)
 
     log_level = config.get_log_level().upper()
     if log_level == "DEBUG":
@@ -894,6 +907,8 @@ def main():
     else:
         re_add_non_debug_logger("INFO")
 
+    run_benchmark_if_requested()
+
     # File logging, writes to a file in the same folder as the executable.
     # Logs at level DEBUG, so it's always verbose.
     # retention=10 to only keep the 10 most recent files.
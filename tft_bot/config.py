@@ -98,6 +98,21 @@ def _parse_cli_flags() -> None:
         action="store_true",
         help="Increase output verbosity, mostly useful for debugging",
     )
+    arg_parser.add_argument(
+        "--benchmark",
+        metavar="CORPUS",
+        help="Time every detector on a directory of recorded frames and compare the results to a baseline, then exit.",
+    )
+    arg_parser.add_argument(
+        "--benchmark-baseline",
+        metavar="PATH",
+        help="The JSON baseline to compare benchmark results to. Defaults to benchmark_baseline.json in the corpus.",
+    )
+    arg_parser.add_argument(
+        "--update-benchmark-baseline",
+        action="store_true",
+        help="Write the benchmark results as the new baseline instead of comparing to it.",
+    )
     parsed_args = arg_parser.parse_args()
 
     if parsed_args.ffearly:
@@ -106,6 +121,10 @@ def _parse_cli_flags() -> None:
     if parsed_args.verbose:
         _SELF["log_level"] = "DEBUG"
 
+    _SELF["benchmark_corpus"] = parsed_args.benchmark
+    _SELF["benchmark_baseline"] = parsed_args.benchmark_baseline
+    _SELF["update_benchmark_baseline"] = parsed_args.update_benchmark_baseline
+
 
 def get_log_level() -> str:
     """
@@ -129,6 +148,39 @@ def forfeit_early() -> bool:
     return _SELF.get("forfeit_early", False)
 
 
+def get_benchmark_corpus() -> str | None:
+    """
+    Get the directory of recorded frames to benchmark the detectors on, set with the --benchmark flag.
+
+    Returns:
+        The directory as a str if the bot should only run the benchmark, None if not.
+
+    """
+    return _SELF.get("benchmark_corpus") or None
+
+
+def get_benchmark_baseline() -> str | None:
+    """
+    Get the path of the JSON baseline to compare benchmark results to.
+
+    Returns:
+        The path as a str if one was given, None to use the default path.
+
+    """
+    return _SELF.get("benchmark_baseline") or None
+
+
+def update_benchmark_baseline() -> bool:
+    """
+    Get if benchmark results should be written as the new baseline.
+
+    Returns:
+        True if the baseline should be updated, False if results should be compared to it.
+
+    """
+    return _SELF.get("update_benchmark_baseline", False)
+
+
 def get_override_install_location(app: str) -> str | None:
     """
     Get the value of the override_install_location setting in the config.
@@ -162,6 +214,28 @@ def purchase_traits_in_prioritized_order() -> bool:
     return _SELF.get("purchase_traits_in_prioritized_order", True)
 
 
+def get_capture_fps() -> float:
+    """
+    Get how many times per second the game window should be captured in the background.
+
+    Returns:
+        The captures per second, 0 if the game window should only be captured when needed.
+
+    """
+    return _SELF.get("capture_fps", 0)
+
+
+def get_live_client_data_max_age() -> float:
+    """
+    Get how many seconds the in-game data is re-used for before it is requested again.
+
+    Returns:
+        The maximum age of the in-game data in seconds.
+
+    """
+    return _SELF.get("live_client_data_max_age", 1.0)
+
+
 def get_timeout(timeout: Timeout, default: int) -> int:
     """
     Get a timeout value by enum class member.
@@ -133,6 +133,38 @@ CONSTANTS = {
     },
 }
 
+# The window sizes every capture, region and coordinate was made for, other sizes are scaled to these.
+reference_window_sizes = {
+    CONSTANTS["window_titles"]["game"]: (1920, 1080),
+}
+
+# Regions of the 1920 x 1080 game window a template can appear in, ordered min_x, min_y, max_x, max_y.
+# Templates are only searched inside their region, templates without one are searched in the whole window.
+round_indicator_region = (560, 0, 1360, 80)
+shop_region = (470, 920, 1500, 1080)
+shop_buttons_region = (200, 900, 520, 1080)
+gold_region = (780, 850, 970, 920)
+center_dialog_region = (480, 200, 1440, 1000)
+
+template_regions = {
+    **{path: round_indicator_region for path in CONSTANTS["game"]["round"].values()},
+    **{path: shop_region for path in CONSTANTS["game"]["trait"].values()},
+    **{path: gold_region for path in CONSTANTS["game"]["gold"].values()},
+    **{path: center_dialog_region for path in CONSTANTS["game"]["exit_now"].values()},
+    **{path: center_dialog_region for path in CONSTANTS["game"]["surrender"].values()},
+    CONSTANTS["game"]["gamelogic"]["reroll"]: shop_buttons_region,
+    CONSTANTS["game"]["gamelogic"]["xp_buy"]: shop_buttons_region,
+    CONSTANTS["game"]["gamelogic"]["choose_an_augment"]: (560, 40, 1360, 320),
+}
+
+# Templates searched coarse-to-fine, with how often the frame and template are halved in size for the coarse search.
+# Only worth it for templates that are searched in large areas and stay recognizable when downscaled.
+template_pyramid_levels = {
+    **{path: 1 for path in CONSTANTS["game"]["trait"].values()},
+    CONSTANTS["game"]["gamelogic"]["choose_an_augment"]: 2,
+    CONSTANTS["game"]["settings"]: 1,
+}
+
 exit_now_images = [
     CONSTANTS["game"]["exit_now"]["base"],
     CONSTANTS["game"]["exit_now"]["highlighted"],
@@ -145,6 +177,19 @@ message_exit_buttons = [
     CONSTANTS["client"]["messages"]["buttons"]["message_exit"]["2"],
 ]
 
+# Client error messages, ordered by priority, with what to log and how long to wait before restarting the client.
+client_error_messages = {
+    CONSTANTS["client"]["messages"]["down_for_maintenance"]: (
+        "League down for maintenance, delaying restart for 5 minutes!",
+        300,
+    ),
+    CONSTANTS["client"]["messages"]["failed_to_reconnect"]: ("Failed to reconnect!", 5),
+    CONSTANTS["client"]["messages"]["login_servers_down"]: ("Login servers down!", 5),
+    CONSTANTS["client"]["messages"]["session_expired"]: ("Session expired!", 5),
+    CONSTANTS["client"]["messages"]["unexpected_error_with_session"]: ("Unexpected error with session!", 5),
+    CONSTANTS["client"]["messages"]["unexpected_login_error"]: ("Unexpected login error!", 5),
+}
+
 league_processes = [
     CONSTANTS["processes"]["client"],
     CONSTANTS["processes"]["client_ux"],
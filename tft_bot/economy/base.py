@@ -6,7 +6,9 @@ import time
 
 from tft_bot.constants import CONSTANTS
 from tft_bot.helpers.click_helpers import click_to_image
+from tft_bot.helpers.screen_helpers import get_frame
 from tft_bot.helpers.screen_helpers import get_on_screen_in_game
+from tft_bot.vision.shop import SHOP_READER
 
 
 class EconomyMode:
@@ -36,15 +38,22 @@ class EconomyMode:
     def purchase_units(self, amount: int) -> None:
         """
         Attempts to purchase a given amount of units from the pool of configured traits.
+        The shop is read once, then units are bought from it slot by slot.
 
         Args:
             amount: The amount of units to purchase.
         """
+        frame = get_frame(window_title=CONSTANTS["window_titles"]["game"])
+        if frame is None:
+            return
+
+        shop = SHOP_READER.read(frame=frame, traits=self.wanted_traits)
+        bought_slots = set()
         for _ in range(amount):
             for trait in self.wanted_traits:
-                if click_to_image(
-                    image_search_result=get_on_screen_in_game(CONSTANTS["game"]["trait"][trait], precision=0.9)
-                ):
+                slot = SHOP_READER.find_slot(shop=shop, trait=trait, excluded_slots=bought_slots)
+                if slot is not None and click_to_image(image_search_result=shop[slot][trait]):
+                    bought_slots.add(slot)
                     time.sleep(0.5)
                 elif self.prioritized_order:
                     return
@@ -0,0 +1,293 @@
+"""
+A collection of benchmark helpers to time every detector on a corpus of recorded frames.
+Runs without League, Windows or a display: python -m tft_bot.helpers.benchmark_helpers <folder>
+"""
+
+import argparse
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+import json
+import os
+import sys
+import time
+from typing import Any, Callable
+
+from loguru import logger
+import numpy
+
+from tft_bot.constants import client_error_messages
+from tft_bot.constants import CONSTANTS
+from tft_bot.constants import exit_now_images
+from tft_bot.helpers.replay_helpers import find_recorded_frames
+from tft_bot.helpers.replay_helpers import ReplayPlatform
+from tft_bot.helpers.screen_helpers import clear_detector_caches
+from tft_bot.helpers.screen_helpers import determine_minimum_round
+from tft_bot.helpers.screen_helpers import get_board_positions
+from tft_bot.helpers.screen_helpers import get_gold_with_ocr
+from tft_bot.helpers.screen_helpers import get_on_screen
+from tft_bot.helpers.screen_helpers import get_on_screen_many
+from tft_bot.helpers.screen_helpers import gold_at_least
+from tft_bot.vision.buffers import BUFFER_POOL
+from tft_bot.vision.capture import ScreenSource
+from tft_bot.vision.capture import set_screen_source
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.templates import TEMPLATES
+
+BASELINE_FILE_NAME = "benchmark_baseline.json"
+# A detector regresses if its p95 latency grows by more than this fraction of the baseline...
+REGRESSION_TOLERANCE = 0.25
+# ...and by more than this many milliseconds, so jitter on very fast detectors never fails a run.
+REGRESSION_MINIMUM_MILLISECONDS = 2.0
+
+
+class CountingScreenSource(ScreenSource):
+    """
+    Wraps another screen source and counts how often it captures.
+    """
+
+    def __init__(self, screen_source: ScreenSource):
+        """
+        Init method to set the screen source to count the captures of.
+
+        Args:
+            screen_source: The screen source that actually captures.
+        """
+        self.screen_source = screen_source
+        self.captures = 0
+
+    def grab(self, bounding_box: BoundingBox) -> numpy.ndarray:
+        self.captures += 1
+        return self.screen_source.grab(bounding_box)
+
+    def close(self) -> None:
+        self.screen_source.close()
+
+
+@dataclass
+class DetectorTimings:
+    """
+    A dataclass holding the latency and capture count of every call to a detector.
+    """
+
+    latencies: list[float] = field(default_factory=list)
+    captures: list[int] = field(default_factory=list)
+    error: str | None = None
+
+    def summarize(self) -> dict[str, Any]:
+        """
+        Summarize the calls to the detector.
+
+        Returns:
+            A dictionary holding the p50, p95 and p99 latency in milliseconds and the captures per call,
+            or the error the detector failed with.
+        """
+        if self.error is not None or not self.latencies:
+            return {"error": self.error or "No calls"}
+
+        p50, p95, p99 = numpy.percentile(self.latencies, [50, 95, 99])
+        return {
+            "calls": len(self.latencies),
+            "p50": round(float(p50), 3),
+            "p95": round(float(p95), 3),
+            "p99": round(float(p99), 3),
+            "captures_per_call": round(float(numpy.mean(self.captures)), 3),
+        }
+
+
+def get_detectors() -> dict[str, Callable[[], Any]]:
+    """
+    Get every detector path of the bot, without the actions the bot takes on their results.
+
+    Returns:
+        A dictionary of detector name to a function running the detector.
+    """
+    detectors: dict[str, Callable[[], Any]] = {}
+    for name, path in TEMPLATES.get_sources().items():
+        window_title = CONSTANTS["window_titles"]["client" if name.startswith("client.") else "game"]
+        detectors[f"get_on_screen[{name}]"] = partial(get_on_screen, window_title=window_title, path=path)
+
+    detectors["check_screen_for_exit_button"] = partial(
+        get_on_screen_many, window_title=CONSTANTS["window_titles"]["game"], paths=exit_now_images, first_hit=True
+    )
+    detectors["check_if_client_error"] = partial(
+        get_on_screen_many,
+        window_title=CONSTANTS["window_titles"]["client"],
+        paths=list(client_error_messages),
+        first_hit=True,
+    )
+    detectors["determine_minimum_round"] = determine_minimum_round
+    detectors["gold_at_least"] = partial(gold_at_least, 4)
+    detectors["get_gold_with_ocr"] = get_gold_with_ocr
+    detectors["get_board_positions"] = get_board_positions
+    return detectors
+
+
+def _time_detector(detector: Callable[[], Any], timings: DetectorTimings, screen_source: CountingScreenSource) -> None:
+    """
+    Time a single, cold call to a detector.
+
+    Args:
+        detector: The detector to call.
+        timings: The timings to add the call to.
+        screen_source: The screen source the detector captures with.
+    """
+    if timings.error is not None:
+        return
+
+    clear_detector_caches()
+    screen_source.captures = 0
+    started_at = time.perf_counter()
+    try:
+        detector()
+    except Exception as exc:
+        timings.error = f"{type(exc).__name__}: {exc}"
+        return
+
+    timings.latencies.append((time.perf_counter() - started_at) * 1000)
+    timings.captures.append(screen_source.captures)
+
+
+def find_regressions(summaries: dict[str, dict], baseline: dict[str, dict]) -> list[str]:
+    """
+    Compare benchmark summaries to a baseline.
+
+    Args:
+        summaries: The summaries of the current run, keyed by detector name.
+        baseline: The summaries of the baseline run, keyed by detector name.
+
+    Returns:
+        A description of every regression, empty if there are none.
+    """
+    regressions = []
+    for name, baseline_summary in baseline.items():
+        summary = summaries.get(name)
+        if summary is None or "error" in summary or "error" in baseline_summary:
+            continue
+
+        slowdown = summary["p95"] - baseline_summary["p95"]
+        if slowdown > baseline_summary["p95"] * REGRESSION_TOLERANCE and slowdown > REGRESSION_MINIMUM_MILLISECONDS:
+            regressions.append(f"{name}: p95 went from {baseline_summary['p95']}ms to {summary['p95']}ms")
+
+        if summary["captures_per_call"] > baseline_summary["captures_per_call"]:
+            regressions.append(
+                f"{name}: captures per call went from {baseline_summary['captures_per_call']}"
+                f" to {summary['captures_per_call']}"
+            )
+
+    return regressions
+
+
+def _log_summaries(summaries: dict[str, dict]) -> None:
+    """
+    Log the summary of every detector.
+
+    Args:
+        summaries: The summaries of a run, keyed by detector name.
+    """
+    for name, summary in summaries.items():
+        if "error" in summary:
+            logger.warning(f"{name}: skipped, {summary['error']}")
+            continue
+
+        logger.info(
+            f"{name}: p50 {summary['p50']}ms, p95 {summary['p95']}ms, p99 {summary['p99']}ms, "
+            f"{summary['captures_per_call']} captures per call"
+        )
+
+
+def run_benchmark(
+    corpus_directory: str, baseline_path: str | None = None, update_baseline: bool = False, repeat: int = 3
+) -> bool:
+    """
+    Time every detector on every recorded frame of a corpus, and compare the results to a baseline.
+    Every call is timed cold, so frame and detector caches are dropped before each one.
+
+    Args:
+        corpus_directory: The directory holding the recorded frames, see replay_helpers.find_recorded_frames.
+        baseline_path: The path of the JSON baseline. Defaults to benchmark_baseline.json in the corpus directory.
+        update_baseline: Whether to write the results as the new baseline. A missing baseline is always written.
+          Defaults to False.
+        repeat: How often every detector is called per frame. Defaults to 3.
+
+    Returns:
+        True if no detector regressed, False if one did or the corpus is empty.
+    """
+    frame_paths = find_recorded_frames(corpus_directory)
+    if not frame_paths:
+        logger.error(f"No recorded frames found in {corpus_directory}")
+        return False
+
+    baseline_path = baseline_path or os.path.join(corpus_directory, BASELINE_FILE_NAME)
+    detectors = get_detectors()
+    timings = {name: DetectorTimings() for name in detectors}
+
+    logger.info(f"Benchmarking {len(detectors)} detectors on {len(frame_paths)} recorded frames")
+    with ReplayPlatform(frame_paths=frame_paths) as replay:
+        screen_source = CountingScreenSource(replay.screen_source)
+        set_screen_source(screen_source)
+        for _ in replay:
+            for _ in range(repeat):
+                for name, detector in detectors.items():
+                    _time_detector(detector=detector, timings=timings[name], screen_source=screen_source)
+    clear_detector_caches()
+
+    summaries = {name: detector_timings.summarize() for name, detector_timings in timings.items()}
+    _log_summaries(summaries)
+    logger.info(f"Frame buffers: {BUFFER_POOL.get_statistics()}")
+
+    if update_baseline or not os.path.isfile(baseline_path):
+        with open(baseline_path, mode="w", encoding="UTF-8") as baseline_file:
+            json.dump(summaries, baseline_file, indent=2)
+        logger.info(f"Wrote the benchmark baseline to {baseline_path}")
+        return True
+
+    with open(baseline_path, mode="r", encoding="UTF-8") as baseline_file:
+        regressions = find_regressions(summaries=summaries, baseline=json.load(baseline_file))
+
+    for regression in regressions:
+        logger.error(f"Regression in {regression}")
+    if not regressions:
+        logger.info(f"No regressions compared to {baseline_path}")
+    return not regressions
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Headless entrypoint of the benchmark, which only loads the vision and benchmark modules.
+
+    Args:
+        args: The command line arguments. Defaults to the arguments the module was started with.
+
+    Returns:
+        The exit code, 0 if no detector regressed, 1 if one did or the corpus is empty.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m tft_bot.helpers.benchmark_helpers",
+        description="Time every detector on a folder of recorded frames, see run_benchmark.",
+    )
+    parser.add_argument("corpus", help="The folder of recorded frames (PNG, .npy or .npz).")
+    parser.add_argument(
+        "--baseline",
+        help="The JSON baseline to compare the results to. Defaults to benchmark_baseline.json in the corpus.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results as the new baseline instead of comparing to them.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="How often every detector is called per frame.")
+    parsed_args = parser.parse_args(args)
+
+    TEMPLATES.load()
+    passed = run_benchmark(
+        corpus_directory=parsed_args.corpus,
+        baseline_path=parsed_args.baseline,
+        update_baseline=parsed_args.update_baseline,
+        repeat=parsed_args.repeat,
+    )
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
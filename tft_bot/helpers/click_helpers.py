@@ -3,9 +3,9 @@
 import random
 import time
 
-import pyautogui as auto
-
 from tft_bot.helpers.screen_helpers import ImageSearchResult
+from tft_bot.helpers.screen_helpers import invalidate_frames
+from tft_bot.vision.mouse import get_mouse_backend
 
 
 def mouse_button(delay=0.1, button="left") -> None:
@@ -16,9 +16,9 @@ def mouse_button(delay=0.1, button="left") -> None:
         button (str, optional): Button of the mouse to activate : "left" "right" "middle",
             see pyautogui.click documentation for more info. Defaults to "left".
     """
-    auto.mouseDown(button=button)
+    get_mouse_backend().mouse_down(button=button)
     time.sleep(delay)
-    auto.mouseUp(button=button)
+    get_mouse_backend().mouse_up(button=button)
 
 
 def move_to(
@@ -32,7 +32,8 @@ def move_to(
         position_x: The x coordinate to move to
         position_y: The y coordinate to move to
     """
-    auto.moveTo(position_x, position_y, random.uniform(0.4, 1.1))
+    get_mouse_backend().move_to(position_x, position_y, random.uniform(0.4, 1.1))
+    invalidate_frames()
 
 
 def click_to(
@@ -50,8 +51,9 @@ def click_to(
         delay (float, optional): The delay between mouse down & up. Defaults to 0.2.
         action (str, optional): The mouse button to perform. Defaults to "left".
     """
-    auto.moveTo(position_x, position_y, random.uniform(0.4, 1.1))
+    get_mouse_backend().move_to(position_x, position_y, random.uniform(0.4, 1.1))
     mouse_button(delay=delay, button=action)
+    invalidate_frames()
 
 
 def click_to_image(
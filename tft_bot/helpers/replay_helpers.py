@@ -0,0 +1,137 @@
+"""A collection of replay helpers to run the detection on recorded frames instead of the live screen."""
+
+import os
+from typing import Iterator
+
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.screen_helpers import invalidate_frames
+from tft_bot.vision.capture import ArrayScreenSource
+from tft_bot.vision.capture import load_recorded_frame
+from tft_bot.vision.capture import ScreenSource
+from tft_bot.vision.capture import set_screen_source
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.mouse import MouseBackend
+from tft_bot.vision.mouse import RecordingMouseBackend
+from tft_bot.vision.mouse import set_mouse_backend
+from tft_bot.vision.window import set_window_backend
+from tft_bot.vision.window import StaticWindowBackend
+from tft_bot.vision.window import WindowBackend
+
+RECORDED_FRAME_EXTENSIONS = (".png", ".npy", ".npz")
+
+
+def find_recorded_frames(directory: str) -> list[str]:
+    """
+    Find all recorded frames in a directory and its subdirectories.
+
+    Args:
+        directory: The directory holding the recorded frames.
+
+    Returns:
+        The paths to all PNG, .npy and .npz files, sorted by path.
+    """
+    frame_paths = []
+    for root, _, files in os.walk(directory):
+        frame_paths.extend(
+            os.path.join(root, file) for file in files if file.lower().endswith(RECORDED_FRAME_EXTENSIONS)
+        )
+    return sorted(frame_paths)
+
+
+class ReplayPlatform:
+    """
+    Replaces window lookup, screen capture and mouse input with a replay of recorded frames,
+    so the detection runs without League (or Windows) on a fixed window.
+    """
+
+    def __init__(self, frame_paths: list[str], window_bounding_box: BoundingBox | None = None):
+        """
+        Init method to set the frames to replay.
+
+        Args:
+            frame_paths: The paths to the recorded frames, in replay order.
+            window_bounding_box: The absolute screen area the game and client windows report.
+              Defaults to a 1920 x 1080 window in the top left corner.
+        """
+        self.frame_paths = list(frame_paths)
+        self.window_bounding_box = window_bounding_box or BoundingBox(0, 0, 1920, 1080)
+        self.frame_path: str | None = None
+        self.screen_source = ArrayScreenSource(
+            pixels=numpy.zeros(
+                (self.window_bounding_box.get_height(), self.window_bounding_box.get_width(), 4), dtype=numpy.uint8
+            ),
+            origin_x=self.window_bounding_box.min_x,
+            origin_y=self.window_bounding_box.min_y,
+        )
+        self.window_backend = StaticWindowBackend(
+            windows={
+                CONSTANTS["window_titles"]["game"]: self.window_bounding_box,
+                CONSTANTS["window_titles"]["client"]: self.window_bounding_box,
+            }
+        )
+        self.mouse_backend = RecordingMouseBackend()
+        self._previous_backends: tuple[ScreenSource, WindowBackend, MouseBackend] | None = None
+
+    def install(self) -> None:
+        """
+        Replace the live backends with the replay ones.
+        """
+        if self._previous_backends is not None:
+            return
+
+        self._previous_backends = (
+            set_screen_source(self.screen_source),
+            set_window_backend(self.window_backend),
+            set_mouse_backend(self.mouse_backend),
+        )
+        invalidate_frames()
+
+    def uninstall(self) -> None:
+        """
+        Restore the backends that were active before installing.
+        """
+        if self._previous_backends is None:
+            return
+
+        screen_source, window_backend, mouse_backend = self._previous_backends
+        set_screen_source(screen_source)
+        set_window_backend(window_backend)
+        set_mouse_backend(mouse_backend)
+        self._previous_backends = None
+        invalidate_frames()
+
+    def show(self, frame_path: str) -> None:
+        """
+        Show a recorded frame, every capture after this sees it.
+
+        Args:
+            frame_path: The path to the recorded frame.
+        """
+        self.screen_source.set_pixels(load_recorded_frame(frame_path))
+        self.frame_path = frame_path
+        invalidate_frames()
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Show every recorded frame in turn.
+
+        Yields:
+            The path of the recorded frame that is currently shown.
+        """
+        for frame_path in self.frame_paths:
+            try:
+                self.show(frame_path)
+            except ValueError as exc:
+                logger.warning(f"Skipping recorded frame: {exc}")
+                continue
+            yield frame_path
+
+    def __enter__(self) -> "ReplayPlatform":
+        self.install()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.uninstall()
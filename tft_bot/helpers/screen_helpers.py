@@ -1,116 +1,94 @@
 """A collection of screen helpers for detecting when images are on screen."""
 
-from dataclasses import dataclass
+import time
 
-import cv2
 from loguru import logger
-import mss
 import numpy
 from pytesseract import pytesseract
-import win32gui
 
 from tft_bot.constants import CONSTANTS
-
-
-@dataclass
-class BoundingBox:
-    """
-    A dataclass holding information about a bounding box, a rectangle of two coordinate sets.
-    """
-
-    min_x: int
-    min_y: int
-    max_x: int
-    max_y: int
-
-    def to_tuple(self) -> tuple[int, int, int, int]:
-        """
-        Converts the bounding box to a tuple.
-
-        Returns:
-            A tuple, ordered min_x, min_y, max_x, max_y.
-
-        """
-        return self.min_x, self.min_y, self.max_x, self.max_y
-
-    def get_width(self) -> int:
-        """
-        Get the width of the bounding box.
-
-        Returns:
-            The width as an integer.
-        """
-        return self.max_x - self.min_x
-
-    def get_height(self) -> int:
-        """
-        Get the height of the bounding box.
-
-        Returns:
-            The height as an integer.
-        """
-        return self.max_y - self.min_y
-
-
-@dataclass
-class Coordinates:
-    """
-    A dataclass holding information about offset pixels to click to.
-    """
-
-    position_x: int
-    position_y: int
-
-
-@dataclass
-class ImageSearchResult(Coordinates):
-    """
-    A dataclass holding information about an image search result.
-    """
-
-    width: int
-    height: int
+from tft_bot.constants import reference_window_sizes
+from tft_bot.vision.board import BOARD_SCANNER
+from tft_bot.vision.cache import PixelCache
+from tft_bot.vision.capture import get_screen_source
+from tft_bot.vision.capture_thread import get_capture_thread
+from tft_bot.vision.change import CHANGE_DETECTOR
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.geometry import Coordinates
+from tft_bot.vision.geometry import ImageSearchResult
+from tft_bot.vision.gold import GOLD_READER
+from tft_bot.vision.matching import match_many
+from tft_bot.vision.matching import match_template
+from tft_bot.vision.rounds import ROUND_TRACKER
+from tft_bot.vision.scaling import get_window_scale
+from tft_bot.vision.telemetry import MATCH_TELEMETRY
+from tft_bot.vision.window import get_window_geometry
+
+# Frames younger than this are re-used instead of capturing the window again.
+# The main game loop sleeps 0.5s between ticks, so every detector in a tick shares one capture.
+MAX_FRAME_AGE = 0.4
+# How long to wait for the capture thread to deliver a new enough frame before capturing directly.
+CAPTURE_THREAD_TIMEOUT = 0.5
+
+_FRAMES: dict[str, FrameSnapshot] = {}
+# The monotonic time the screen was last interacted with, frames captured before it are outdated.
+_FRAMES_INVALIDATED_AT = 0.0
 
 
 def get_window_bounding_box(window_title: str) -> BoundingBox | None:
     """
-    Gets the bounding box of a specific window.
+    Gets the bounding box of a specific window. The bounding box is cached for a short time.
 
     Returns:
         A bounding box (min x, min y, max x, max y) or None if no window exists.
 
     """
-    league_game_window_handle = win32gui.FindWindowEx(0, 0, 0, window_title)
-    if not league_game_window_handle:
+    window_bounding_box = get_window_geometry().get_bounding_box(window_title)
+    if not window_bounding_box:
         logger.debug(f"We tried to check {window_title} for an image, but there is no window")
         return None
 
-    return BoundingBox(*win32gui.GetWindowRect(league_game_window_handle))
+    return window_bounding_box
 
 
 def check_league_game_size() -> None:
     """
-    Check the league game size and print an error if it is not what we need it to be.
+    Check the league game size and tell the user if it is not the size every capture was made for.
+    Other sizes are scaled to, but only keep their aspect ratio at 16:9.
     """
-    league_game_bounding_box = get_window_bounding_box(window_title="League of Legends (TM) Client")
+    window_title = CONSTANTS["window_titles"]["game"]
+    league_game_bounding_box = get_window_bounding_box(window_title=window_title)
     if not league_game_bounding_box:
         return
 
-    if league_game_bounding_box.get_width() != 1920 or league_game_bounding_box.get_height() != 1080:
+    width, height = league_game_bounding_box.get_width(), league_game_bounding_box.get_height()
+    reference_width, reference_height = reference_window_sizes[window_title]
+    if (width, height) == (reference_width, reference_height):
+        return
+
+    if width * reference_height != height * reference_width:
         logger.error(
-            f"Your game's size is {league_game_bounding_box.get_width()} x {league_game_bounding_box.get_height()} "
-            f"instead of 1920 x 1080! This WILL cause issues!"
+            f"Your game's size is {width} x {height}, which is not 16:9 like {reference_width} x {reference_height}! "
+            f"Captures will be distorted when scaled, which WILL cause issues!"
         )
+        return
+
+    logger.info(
+        f"Your game's size is {width} x {height}, "
+        f"captures made for {reference_width} x {reference_height} are scaled to it"
+    )
 
 
 def calculate_window_click_offset(window_title: str, position_x: int, position_y: int) -> Coordinates | None:
     """
     Calculate absolute screen coordinates based off relative pixel position in a specific window.
+    The position is scaled if the window does not have its reference size, see constants.reference_window_sizes.
 
     Args:
         window_title: The title of the window to click in.
-        position_x: The relative x coordinate to click to.
-        position_y: The relative y coordinate to click to.
+        position_x: The relative x coordinate to click to, in the reference window size.
+        position_y: The relative y coordinate to click to, in the reference window size.
 
     Returns:
         Absolute coordinates to click to.
@@ -119,13 +97,95 @@ def calculate_window_click_offset(window_title: str, position_x: int, position_y
     if not window_bounding_box:
         return None
 
+    scale = get_window_scale(
+        window_bounding_box.get_width(), window_bounding_box.get_height(), reference_window_sizes.get(window_title)
+    )
     return Coordinates(
-        position_x=window_bounding_box.min_x + position_x, position_y=window_bounding_box.min_y + position_y
+        position_x=window_bounding_box.min_x + scale.scale_x(position_x),
+        position_y=window_bounding_box.min_y + scale.scale_y(position_y),
     )
 
 
+def get_frame(window_title: str, max_age: float = MAX_FRAME_AGE) -> FrameSnapshot | None:
+    """
+    Get a frame of a specific window, re-using the last capture if it is recent enough.
+
+    Args:
+        window_title: The title of the window to capture.
+        max_age: The maximum age in seconds a previous capture may have to be re-used. Defaults to MAX_FRAME_AGE.
+
+    Returns:
+        A frame of the whole window or None if no window exists.
+    """
+    window_bounding_box = get_window_bounding_box(window_title=window_title)
+    if not window_bounding_box:
+        return None
+
+    frame = _FRAMES.get(window_title)
+    if frame and frame.bounding_box == window_bounding_box and frame.get_age() <= max_age:
+        return frame
+
+    capture_thread = get_capture_thread(window_title)
+    if capture_thread:
+        frame = capture_thread.wait_for_frame(
+            newer_than=max(_FRAMES_INVALIDATED_AT, time.monotonic() - max_age), timeout=CAPTURE_THREAD_TIMEOUT
+        )
+        if frame and frame.bounding_box == window_bounding_box:
+            _FRAMES[window_title] = frame
+            return frame
+
+    try:
+        pixels = get_screen_source().grab(window_bounding_box)
+    except Exception as exc:
+        # The window most likely moved or closed since we looked it up, so look it up again.
+        logger.opt(exception=exc).debug(f"Capturing {window_title} failed, refreshing its geometry")
+        get_window_geometry().invalidate(window_title)
+        window_bounding_box = get_window_bounding_box(window_title=window_title)
+        if not window_bounding_box:
+            return None
+        pixels = get_screen_source().grab(window_bounding_box)
+
+    frame = FrameSnapshot(
+        pixels=pixels, bounding_box=window_bounding_box, reference_size=reference_window_sizes.get(window_title)
+    )
+    _FRAMES[window_title] = frame
+    return frame
+
+
+def invalidate_frames() -> None:
+    """
+    Drop all cached frames, so the next detector captures again. Should be called whenever the screen was
+    interacted with. With a capture thread, the next detector waits for a frame captured after this call.
+    """
+    global _FRAMES_INVALIDATED_AT
+    _FRAMES_INVALIDATED_AT = time.monotonic()
+    _FRAMES.clear()
+
+
+def clear_detector_caches() -> None:
+    """
+    Drop every cached frame and detector result, so the next detection does all of its work again.
+    """
+    invalidate_frames()
+    CHANGE_DETECTOR.invalidate()
+    _OCR_CACHE.clear()
+
+
+def start_tick() -> int:
+    """
+    Start a new main loop tick: drop cached frames so the tick starts with a fresh capture,
+    and advance the tick counter regions are reported unchanged since. Writes the match telemetry when it is due.
+
+    Returns:
+        The new tick number.
+    """
+    MATCH_TELEMETRY.dump_if_due()
+    invalidate_frames()
+    return CHANGE_DETECTOR.advance_tick()
+
+
 def get_on_screen_in_client(
-    path: str, precision: float = 0.8, offsets: BoundingBox | None = None
+    path: str, precision: float = 0.8, offsets: BoundingBox | None = None, frame: FrameSnapshot | None = None
 ) -> ImageSearchResult | None:
     """
     Check if a given image is detected on screen, but only check the league client window.
@@ -135,17 +195,18 @@ def get_on_screen_in_client(
         precision: The precision to be used when matching the image. Defaults to 0.8.
         offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
           Defaults to None.
+        frame: A frame of the league client window to search in. Defaults to a capture of the current screen.
 
     Returns:
         The position of the image and it's width and height or None if it wasn't found
     """
     return get_on_screen(
-        window_title=CONSTANTS["window_titles"]["client"], path=path, precision=precision, offsets=offsets
+        window_title=CONSTANTS["window_titles"]["client"], path=path, precision=precision, offsets=offsets, frame=frame
     )
 
 
 def get_on_screen_in_game(
-    path: str, precision: float = 0.8, offsets: BoundingBox | None = None
+    path: str, precision: float = 0.8, offsets: BoundingBox | None = None, frame: FrameSnapshot | None = None
 ) -> ImageSearchResult | None:
     """
     Check if a given image is detected on screen, but only check the league game window.
@@ -155,17 +216,22 @@ def get_on_screen_in_game(
         precision: The precision to be used when matching the image. Defaults to 0.8.
         offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
           Defaults to None.
+        frame: A frame of the league game window to search in. Defaults to a capture of the current screen.
 
     Returns:
         The position of the image and it's width and height or None if it wasn't found
     """
     return get_on_screen(
-        window_title=CONSTANTS["window_titles"]["game"], path=path, precision=precision, offsets=offsets
+        window_title=CONSTANTS["window_titles"]["game"], path=path, precision=precision, offsets=offsets, frame=frame
     )
 
 
 def get_on_screen(
-    window_title: str, path: str, precision: float = 0.8, offsets: BoundingBox | None = None
+    window_title: str,
+    path: str,
+    precision: float = 0.8,
+    offsets: BoundingBox | None = None,
+    frame: FrameSnapshot | None = None,
 ) -> ImageSearchResult | None:
     """
     Check if a given image is detected on screen in a specific window's area.
@@ -175,184 +241,166 @@ def get_on_screen(
         path: The relative or absolute path to the image to be found.
         precision: The precision to be used when matching the image. Defaults to 0.8.
         offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
-          Defaults to None.
+          Defaults to None, which searches the template's region in constants.template_regions.
+        frame: A frame of the window to search in. Defaults to a capture of the current screen.
 
     Returns:
         The position of the image and it's width and height or None if it wasn't found
     """
-    window_bounding_box = get_window_bounding_box(window_title=window_title)
-    if not window_bounding_box:
+    if frame is None:
+        frame = get_frame(window_title=window_title)
+    if frame is None:
         return None
 
-    image_to_find = cv2.imread(path, 0)
-    if image_to_find is None:
-        logger.warning(f"The image {path} does not exist on the system or we do not have permission to read it")
-        return None
+    return match_template(frame=frame, path=path, precision=precision, offsets=offsets)
 
-    if offsets:
-        window_bounding_box.min_x += offsets.min_x
-        window_bounding_box.min_y += offsets.min_y
-        window_bounding_box.max_x += offsets.max_x
-        window_bounding_box.max_y += offsets.max_y
 
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(window_bounding_box.to_tuple())
+def get_on_screen_many(
+    window_title: str,
+    paths: list[str],
+    precision: float = 0.8,
+    first_hit: bool = False,
+    frame: FrameSnapshot | None = None,
+) -> dict[str, ImageSearchResult]:
+    """
+    Check which of the given images are detected on screen, matching all of them against a single frame at once.
 
-    pixels = numpy.array(screenshot)
-    gray_scaled_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
-    search_result = cv2.matchTemplate(gray_scaled_pixels, image_to_find, cv2.TM_CCOEFF_NORMED)
+    Args:
+        window_title: The title of the window we should look at.
+        paths: The list of relative or absolute paths to images to be searched for, ordered by priority.
+        precision: The precision to be used when matching the images. Defaults to 0.8.
+        first_hit: Whether to stop at the first image found, in the order of paths. Defaults to False.
+        frame: A frame of the window to search in. Defaults to a capture of the current screen.
 
-    _, max_precision, _, max_location = cv2.minMaxLoc(search_result)
-    if max_precision < precision:
-        return None
+    Returns:
+        A dictionary of path to search result for every image found, holding at most one entry with first_hit.
+    """
+    if frame is None:
+        frame = get_frame(window_title=window_title)
+    if frame is None:
+        return {}
 
-    return ImageSearchResult(
-        position_x=max_location[0] + window_bounding_box.min_x,
-        position_y=max_location[1] + window_bounding_box.min_y,
-        height=image_to_find.shape[0],
-        width=image_to_find.shape[1],
-    )
+    return match_many(frame=frame, paths=paths, precision=precision, first_hit=first_hit)
 
 
 @logger.catch
-def get_on_screen_multiple_any(window_title: str, paths: list[str], precision: float = 0.8) -> bool:
+def get_on_screen_multiple_any(
+    window_title: str, paths: list[str], precision: float = 0.8, frame: FrameSnapshot | None = None
+) -> bool:
     """Check if any of the given images are detected on screen.
 
     Args:
         window_title: The title of the window we should look at.
         paths: The list of relative or absolute paths to images to be searched for.
         precision: The precision to be used when matching the image. Defaults to 0.8.
+        frame: A frame of the window to search in. Defaults to a capture of the current screen.
 
     Returns:
         True if any of the images are detected on screen, False otherwise.
     """
-    for path in paths:
-        if get_on_screen(window_title=window_title, path=path, precision=precision):
-            return True
-
-    return False
+    return bool(
+        get_on_screen_many(window_title=window_title, paths=paths, precision=precision, first_hit=True, frame=frame)
+    )
 
 
 _TESSERACT_CONFIG = '--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789 -c page_separator=""'
+# Running Tesseract spawns a process, so we only do it when the pixels of the gold display actually changed.
+_OCR_CACHE = PixelCache(max_size=128)
 
 
-def get_gold_with_ocr() -> int:
+def get_gold_with_ocr(frame: FrameSnapshot | None = None) -> int:
     """
     Get the gold by taking a screenshot of the region where it is and running OCR over it.
     This should only be called by ocr_* implementations in the economy package, since they set where Tesseract-OCR is.
 
+    Args:
+        frame: A frame of the league game window to read from. Defaults to a capture of the current screen.
+
     Returns:
         The amount of gold the player currently has.
 
     """
-    league_bounding_box = get_window_bounding_box(CONSTANTS["window_titles"]["game"])
-    if not league_bounding_box:
+    if frame is None:
+        frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
         return 0
 
-    gold_bounding_box = (
-        league_bounding_box.min_x + 867,
-        league_bounding_box.min_y + 881,
-        league_bounding_box.min_x + 924,
-        league_bounding_box.min_y + 909,
-    )
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(gold_bounding_box)
-
-    pixels = numpy.array(screenshot)
-    gray_scaled_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
-    return int(pytesseract.image_to_string(~gray_scaled_pixels, config=_TESSERACT_CONFIG) or 0)
+    gray_scaled_pixels = frame.crop_gray_at_reference_size(BoundingBox(867, 881, 924, 909))
+    gold = _OCR_CACHE.get_or_compute(gray_scaled_pixels, _run_gold_ocr)
+    logger.debug(f"Gold OCR cache has {_OCR_CACHE.hits} hits and {_OCR_CACHE.misses} misses")
+    return gold
 
 
-def get_gold_with_opencv(num: int) -> bool:
+def _run_gold_ocr(gray_scaled_pixels: numpy.ndarray) -> int:
     """
-    Checks if there is N gold in the region of the gold display.
+    Run Tesseract-OCR over the gray scaled pixels of the gold display.
 
     Args:
-        num: The amount of gold we're checking for, there should be a file for it in captures/gold .
+        gray_scaled_pixels: The gray scaled pixels of the gold display.
 
     Returns:
-        True if we found the amount of gold. False if not.
+        The amount of gold recognized.
     """
-    try:
-        if get_on_screen_in_game(CONSTANTS["game"]["gold"][f"{num}"], 0.9, BoundingBox(780, 850, 970, 920)):
-            logger.debug(f"Found {num} gold")
-            return True
-    except Exception as exc:
-        logger.opt(exception=exc).debug(f"Exception finding {num} gold, we possibly don't have the value as a file")
-        # We don't have this gold as a file
-        return True
-    return False
+    return int(pytesseract.image_to_string(~gray_scaled_pixels, config=_TESSERACT_CONFIG) or 0)
 
 
-def gold_at_least(num: int) -> bool:
+def gold_at_least(num: int, frame: FrameSnapshot | None = None) -> bool:
     """
-    Check if the gold on screen is at least the provided amount with opencv
+    Check if the gold on screen is at least the provided amount, reading the gold display digit by digit.
 
     Args:
         num (int): The value to check if the gold is at least.
+        frame: A frame of the league game window to read from. Defaults to a capture of the current screen.
 
     Returns:
         bool: True if the value is >= `num`, False otherwise.
     """
     logger.debug(f"Looking for at least {num} gold")
-    if get_gold_with_opencv(num):
+    if frame is None:
+        frame = get_frame(CONSTANTS["window_titles"]["game"])
+
+    gold = GOLD_READER.read(frame) if frame else None
+    if gold is None:
+        # We have no capture for at least one of the digits, which only happens for values above the ones we check.
+        logger.debug("No gold value found, assuming we have more")
         return True
 
-    for i in range(num + 1):
-        if get_gold_with_opencv(i):
-            return i >= num
+    logger.debug(f"Found {gold} gold")
+    return gold >= num
+
 
-    logger.debug("No gold value found, assuming we have more")
-    return True
+def determine_minimum_round() -> int:
+    """
+    Determines minimum round we are at.
+    Prioritizes PvE markers, falls back to the round display.
+    Only the markers of the last confirmed and the next round are searched, see RoundTracker.
+    If no marker is found, for example while something covers the round indicator, the last confirmed round
+    is returned instead of 0, so the draft, economy and surrender checks keep acting on the current round.
+    It is only 0 before the first round of a game was confirmed.
 
+    Returns:
+        The major round as an integer.
 
-# H, S, V
-LOWER_GREEN = numpy.array([40, 150, 10])
-UPPER_GREEN = numpy.array([75, 255, 255])
+    """
+    frame = get_frame(window_title=CONSTANTS["window_titles"]["game"])
+    if frame is None:
+        return ROUND_TRACKER.major_round
 
-FIELD_SLOT_Y_POSITIONS = numpy.array([672, 596, 515, 446])
-MINIMUM_Y_OFFSET = 75
+    return ROUND_TRACKER.update(frame)
 
 
-def get_board_positions() -> list[Coordinates]:
+def get_board_positions(frame: FrameSnapshot | None = None) -> list[Coordinates]:
     """
     Get position of units on the board.
 
-    Returns: A list of coordinates holding the board position of the unit.
+    Args:
+        frame: A frame of the league game window to search in. Defaults to a capture of the current screen.
+
+    Returns: A list of coordinates holding the board position of the unit, in the reference window size.
     """
-    window_bounding_box = get_window_bounding_box(window_title=CONSTANTS["window_titles"]["game"])
-    if not window_bounding_box:
+    if frame is None:
+        frame = get_frame(window_title=CONSTANTS["window_titles"]["game"])
+    if frame is None:
         return []
 
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(window_bounding_box.to_tuple())
-
-    pixels = numpy.array(screenshot)
-    hsv_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
-
-    mask = cv2.inRange(hsv_pixels, LOWER_GREEN, UPPER_GREEN)
-    mask = cv2.erode(mask, None, iterations=2)
-    mask = cv2.dilate(mask, None, iterations=2)
-    mask = cv2.GaussianBlur(mask, (5, 5), 0)
-
-    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-    positions = []
-    for contour in contours:
-        position_x, position_y, width, height = cv2.boundingRect(contour)
-
-        if position_y < 275 or position_y > 672:
-            continue
-
-        if width < 55 or width > 80 or height < 5 or height > 20:
-            continue
-
-        position_x = int(position_x + (width / 2))
-        position_y = int(position_y + (height / 2)) + MINIMUM_Y_OFFSET
-        potential_unit_y_positions = FIELD_SLOT_Y_POSITIONS[FIELD_SLOT_Y_POSITIONS > position_y]
-        if len(potential_unit_y_positions) == 0:
-            continue
-
-        positions.append(Coordinates(position_x=position_x, position_y=potential_unit_y_positions.min()))
-
-    return positions
+    return BOARD_SCANNER.scan(frame)
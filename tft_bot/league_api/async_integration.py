@@ -0,0 +1,402 @@
+"""
+Asyncio variants of the Rito API integrations, to run independent requests concurrently.
+The requests themselves still go through the synchronous integrations, each one in a worker thread
+with its own session of the shared connection pool.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+from typing import Any, Coroutine
+
+from tft_bot.league_api.league_api_integration import GameClientIntegration
+from tft_bot.league_api.league_api_integration import GameflowSnapshot
+from tft_bot.league_api.league_api_integration import LCUIntegration
+from tft_bot.league_api.league_api_integration import LiveGameSnapshot
+
+# The synchronous facades run on one event loop for the whole process, whose worker threads (and so their sessions
+# with their open connections) are kept between calls, instead of a new loop and new threads on every call.
+_EVENT_LOOP = asyncio.new_event_loop()
+_EVENT_LOOP.set_default_executor(ThreadPoolExecutor(max_workers=4, thread_name_prefix="league-api"))
+_EVENT_LOOP_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ClientHealth:
+    """
+    A dataclass holding the result of every health probe of the League client.
+    """
+
+    client_connected: bool
+    gameflow: GameflowSnapshot
+
+    def session_expired(self) -> bool | None:
+        """
+        Check if the login session is expired.
+
+        Returns:
+            True if it is expired, False if not, None if it is unknown.
+        """
+        return self.gameflow.session_expired
+
+    def in_game(self) -> bool:
+        """
+        Check if the client is in a game.
+
+        Returns:
+            True if we are in a game, False if not.
+        """
+        return self.gameflow.in_game()
+
+
+class AsyncLCUIntegration:
+    """
+    Async variant of the LCUIntegration, sharing its session, event listener and gameflow snapshot.
+    Every method that sends a request has an async variant, get_installation_directory only reads an attribute.
+    """
+
+    def __init__(self, lcu_integration: LCUIntegration):
+        """
+        Init method to wrap an existing integration.
+
+        Args:
+            lcu_integration: The connected integration to send the requests with.
+        """
+        self.lcu_integration = lcu_integration
+
+    async def connect_to_lcu(self, wait_for_availability: bool = False) -> bool:
+        """
+        Connect to the LCU client, see LCUIntegration.connect_to_lcu.
+
+        Args:
+            wait_for_availability: Whether we should wait for the client to report that it's ready to open games.
+
+        Returns:
+            True if we succeeded in connecting, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.connect_to_lcu, wait_for_availability)
+
+    async def get_state(self, uri: str) -> dict | None:
+        """
+        Get the data of an endpoint, see LCUIntegration.get_state.
+
+        Args:
+            uri: The path of the endpoint, for example /lol-gameflow/v1/session.
+
+        Returns:
+            The data of the endpoint, or None if it does not exist right now or there was an issue getting it.
+        """
+        return await asyncio.to_thread(self.lcu_integration.get_state, uri)
+
+    async def refresh(self) -> GameflowSnapshot:
+        """
+        Take a new gameflow snapshot, requesting the gameflow and login session concurrently.
+
+        Returns:
+            The new snapshot.
+        """
+        generation = self.lcu_integration.events.generation
+        gameflow_session, login_session = await asyncio.gather(
+            self.get_state("/lol-gameflow/v1/session"), self.get_state("/lol-login/v1/session")
+        )
+        self.lcu_integration.gameflow_snapshot = GameflowSnapshot.from_sessions(
+            gameflow_session=gameflow_session, login_session=login_session, generation=generation
+        )
+        return self.lcu_integration.gameflow_snapshot
+
+    async def get_gameflow_snapshot(self) -> GameflowSnapshot:
+        """
+        Get the gameflow snapshot, see LCUIntegration.get_gameflow_snapshot.
+
+        Returns:
+            The gameflow snapshot.
+        """
+        return await asyncio.to_thread(self.lcu_integration.get_gameflow_snapshot)
+
+    async def wait_for_event(self, timeout: float) -> bool:
+        """
+        Wait until the LCU pushes an event, see LCUIntegration.wait_for_event.
+
+        Args:
+            timeout: The maximum time to wait, in seconds.
+
+        Returns:
+            True if an event arrived, False if the timeout passed or there is no event connection.
+        """
+        return await asyncio.to_thread(self.lcu_integration.wait_for_event, timeout)
+
+    async def client_connected(self) -> bool:
+        """
+        Checks if the client is currently connected / sending understandable responses.
+
+        Returns:
+            True if connected, False otherwise.
+        """
+        return await asyncio.to_thread(self.lcu_integration.client_connected)
+
+    async def check_health(self) -> ClientHealth:
+        """
+        Run every health probe concurrently, so the check takes as long as the slowest request.
+
+        Returns:
+            The result of every probe.
+        """
+        client_connected, gameflow = await asyncio.gather(self.client_connected(), self.refresh())
+        return ClientHealth(client_connected=client_connected, gameflow=gameflow)
+
+    async def in_lobby(self) -> bool:
+        """
+        Check if we are in a lobby of the type we want.
+
+        Returns:
+            True if we are in a lobby of the type we want, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.in_lobby)
+
+    async def create_lobby(self) -> bool:
+        """
+        Create a lobby of the type we want.
+
+        Returns:
+            True if we succeeded in creating it, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.create_lobby)
+
+    async def delete_lobby(self) -> None:
+        """
+        Leave the current lobby.
+        """
+        await asyncio.to_thread(self.lcu_integration.delete_lobby)
+
+    async def start_queue(self) -> bool:
+        """
+        Start the match finding queue.
+
+        Returns:
+            True if we succeeded in starting the search, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.start_queue)
+
+    async def in_queue(self) -> bool:
+        """
+        Checks if we are in a match finding queue.
+
+        Returns:
+            True if we are in a match finding queue, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.in_queue)
+
+    async def found_queue(self) -> bool:
+        """
+        Checks if we have found a match that we need to accept.
+
+        Returns:
+            True if we have found a match that we need to accept, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.found_queue)
+
+    async def queue_accepted(self) -> bool:
+        """
+        Checks if we have accepted the match.
+
+        Returns:
+            True if we have accepted the match, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.queue_accepted)
+
+    async def accept_queue(self) -> None:
+        """
+        Accept the found match.
+        """
+        await asyncio.to_thread(self.lcu_integration.accept_queue)
+
+    async def in_game(self) -> bool:
+        """
+        Checks if we are in a game.
+
+        Returns:
+            True if we are in a game, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.in_game)
+
+    async def should_reconnect(self) -> bool:
+        """
+        Checks if we should reconnect to an existing game.
+
+        Returns:
+            True if we need to reconnect, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.should_reconnect)
+
+    async def reconnect(self) -> None:
+        """
+        Reconnect to the running game.
+        """
+        await asyncio.to_thread(self.lcu_integration.reconnect)
+
+    async def session_expired(self) -> bool | None:
+        """
+        Check if the session is expired.
+
+        Returns:
+            True if it is expired, False if not.
+        """
+        return await asyncio.to_thread(self.lcu_integration.session_expired)
+
+    async def get_win_rate(self, number_of_games: int) -> str:
+        """
+        Get the win rate of the player, see LCUIntegration.get_win_rate.
+
+        Args:
+            number_of_games: The amount of games to calculate the win rate over.
+
+        Returns:
+            A human-readable string holding the percentage, for example '20.3'.
+        """
+        return await asyncio.to_thread(self.lcu_integration.get_win_rate, number_of_games)
+
+
+class AsyncGameClientIntegration:
+    """
+    Async variant of the GameClientIntegration, sharing its session and live game snapshot.
+    """
+
+    def __init__(self, game_client_integration: GameClientIntegration):
+        """
+        Init method to wrap an existing integration.
+
+        Args:
+            game_client_integration: The integration to send the requests with.
+        """
+        self.game_client_integration = game_client_integration
+
+    async def get_live_game_snapshot(self) -> LiveGameSnapshot | None:
+        """
+        Get the data of the running game, see GameClientIntegration.get_live_game_snapshot.
+
+        Returns:
+            The snapshot, or None if there was an issue getting it.
+        """
+        return await asyncio.to_thread(self.game_client_integration.get_live_game_snapshot)
+
+    async def refresh(self) -> LiveGameSnapshot | None:
+        """
+        Request the data of the running game, regardless of how old the current snapshot is.
+
+        Returns:
+            The new snapshot, or None if there was an issue getting it.
+        """
+        return await asyncio.to_thread(self.game_client_integration.refresh)
+
+    async def wait_for_game_window(self, lcu_integration: LCUIntegration, timeout: int) -> bool:
+        """
+        Waits for the API to be responsive, see GameClientIntegration.wait_for_game_window.
+
+        Args:
+            lcu_integration: The object to interact with the LCU.
+            timeout: The approximate time to wait for a successful connection before giving up.
+
+        Returns:
+            True if we could connect to the API within a specified time, False if not.
+        """
+        return await asyncio.to_thread(self.game_client_integration.wait_for_game_window, lcu_integration, timeout)
+
+    async def game_loaded(self) -> bool:
+        """
+        Checks if the game has loaded.
+
+        Returns:
+            True if the game has loaded, False if not.
+        """
+        return await asyncio.to_thread(self.game_client_integration.game_loaded)
+
+    async def is_dead(self) -> bool:
+        """
+        Checks if the user is considered dead, aka. has less than or equal to 0 HP.
+
+        Returns:
+            True if the user has less than or equal to 0 HP, else False.
+        """
+        return await asyncio.to_thread(self.game_client_integration.is_dead)
+
+    async def get_level(self) -> int:
+        """
+        Get the level the player currently is at.
+
+        Returns:
+            The level of the active player.
+        """
+        return await asyncio.to_thread(self.game_client_integration.get_level)
+
+    async def get_game_time(self) -> float:
+        """
+        Get the time that passed since the game started.
+
+        Returns:
+            The game time in seconds, 0.0 if there was an issue getting it.
+        """
+        return await asyncio.to_thread(self.game_client_integration.get_game_time)
+
+
+def _run(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion on the event loop of the synchronous facades.
+
+    Args:
+        coroutine: The coroutine to run.
+
+    Returns:
+        The result of the coroutine.
+    """
+    with _EVENT_LOOP_LOCK:
+        return _EVENT_LOOP.run_until_complete(coroutine)
+
+
+def check_client_health(lcu_integration: LCUIntegration) -> ClientHealth:
+    """
+    Synchronous facade to run every health probe of the League client concurrently.
+
+    Args:
+        lcu_integration: The connected integration to send the requests with.
+
+    Returns:
+        The result of every probe.
+    """
+    return _run(AsyncLCUIntegration(lcu_integration).check_health())
+
+
+async def _refresh_game_state(
+    lcu_integration: LCUIntegration, game_client_integration: GameClientIntegration
+) -> tuple[GameflowSnapshot, LiveGameSnapshot | None]:
+    """
+    Refresh the gameflow and the live game snapshot concurrently.
+
+    Args:
+        lcu_integration: The connected integration to send the LCU requests with.
+        game_client_integration: The integration to send the game client requests with.
+
+    Returns:
+        The new gameflow snapshot and the live game snapshot, None if there was an issue getting it.
+    """
+    return await asyncio.gather(
+        AsyncLCUIntegration(lcu_integration).refresh(),
+        AsyncGameClientIntegration(game_client_integration).get_live_game_snapshot(),
+    )
+
+
+def refresh_game_state(
+    lcu_integration: LCUIntegration, game_client_integration: GameClientIntegration
+) -> tuple[GameflowSnapshot, LiveGameSnapshot | None]:
+    """
+    Synchronous facade to refresh the state of the League client and the running game concurrently,
+    so the in-game checks that follow are answered from the snapshots.
+
+    Args:
+        lcu_integration: The connected integration to send the LCU requests with.
+        game_client_integration: The integration to send the game client requests with.
+
+    Returns:
+        The new gameflow snapshot and the live game snapshot, None if there was an issue getting it.
+    """
+    return _run(_refresh_game_state(lcu_integration, game_client_integration))
@@ -0,0 +1,255 @@
+"""
+Module holding the LCU event listener, which keeps the state of the League client up to date over its WebSocket.
+"""
+
+import base64
+import json
+import threading
+import time
+
+from loguru import logger
+import websocket
+
+# The WAMP opcodes the LCU uses on its WebSocket.
+SUBSCRIBE_OPCODE = 5
+EVENT_OPCODE = 8
+
+# The endpoints whose state is kept, every one of them has an event named after its path.
+TRACKED_URIS = (
+    "/lol-gameflow/v1/availability",
+    "/lol-gameflow/v1/session",
+    "/lol-login/v1/session",
+    "/lol-lobby/v2/lobby",
+    "/lol-lobby/v2/lobby/matchmaking/search-state",
+    "/lol-matchmaking/v1/ready-check",
+)
+
+# The address of the LCU WebSocket, formatted with the app port.
+WEBSOCKET_URL = "wss://127.0.0.1:{port}/"
+
+# Polled data of an endpoint is only trusted for about one poll interval until an event for the endpoint arrived,
+# as an endpoint whose events never arrive would otherwise keep its polled data for max_age seconds.
+PRIMED_MAX_AGE = 1.0
+
+# Seconds to wait before reconnecting after the WebSocket closed, doubling up to the maximum.
+RECONNECT_DELAY = 1.0
+MAXIMUM_RECONNECT_DELAY = 10.0
+
+
+def get_event_name(uri: str) -> str:
+    """
+    Get the name of the event the LCU publishes changes of an endpoint under.
+
+    Args:
+        uri: The path of the endpoint, for example /lol-gameflow/v1/session.
+
+    Returns:
+        The event name, for example OnJsonApiEvent_lol-gameflow_v1_session.
+    """
+    return f"OnJsonApiEvent{uri.replace('/', '_')}"
+
+
+class LCUEventListener:
+    """
+    Listens to the LCU WebSocket in a background thread and keeps the latest data of every tracked endpoint.
+    State is only handed out while the WebSocket is connected and for at most max_age seconds after it last changed,
+    or PRIMED_MAX_AGE seconds for polled data of an endpoint no event arrived for yet,
+    so callers fall back to polling the endpoint whenever the listener can not be trusted.
+    """
+
+    def __init__(self, max_age: float = 30.0):
+        """
+        Init method to start without any state, the listener only connects once started.
+
+        Args:
+            max_age: The time in seconds the state of an endpoint is trusted without a new event. Defaults to 30.0.
+        """
+        self.max_age = max_age
+        self.connected = False
+        # Increases on every change of the state, so derived data knows when it went stale.
+        self.generation = 0
+        # The time the data was stored at, the data, and whether an event arrived for the endpoint.
+        self._states: dict[str, tuple[float, dict | None, bool]] = {}
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, port: int, auth_token: str, certificate: str) -> None:
+        """
+        Start listening to the LCU, stopping a listener to a previous client first.
+
+        Args:
+            port: The app port of the LCU.
+            auth_token: The remoting auth token of the LCU.
+            certificate: The path to the certificate the LCU is signed with.
+        """
+        self.stop()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(port, auth_token, certificate), name="lcu-events", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop listening and forget all state.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._set_connected(False)
+
+    def get_state(self, uri: str) -> tuple[bool, dict | None]:
+        """
+        Get the latest data of an endpoint.
+
+        Args:
+            uri: The path of the endpoint.
+
+        Returns:
+            Whether the state is known and its data, which is None if the endpoint does not exist right now.
+        """
+        with self._condition:
+            state = self._states.get(uri)
+            if not self.connected or state is None or self._is_stale(state):
+                return False, None
+            return True, state[1]
+
+    def prime(self, uri: str, data: dict | None) -> None:
+        """
+        Store polled data of an endpoint, unless an event already delivered newer data.
+
+        Args:
+            uri: The path of the endpoint.
+            data: The polled data, None if the endpoint does not exist right now.
+        """
+        with self._condition:
+            state = self._states.get(uri)
+            if self.connected and (state is None or self._is_stale(state)):
+                self._states[uri] = (time.monotonic(), data, state is not None and state[2])
+
+    def wait_for_event(self, timeout: float) -> bool:
+        """
+        Wait until any tracked endpoint changes. Without a connected listener this simply sleeps.
+
+        Args:
+            timeout: The maximum time to wait, in seconds.
+
+        Returns:
+            True if an endpoint changed, False if the timeout passed.
+        """
+        if not self.connected:
+            time.sleep(timeout)
+            return False
+
+        with self._condition:
+            return self._condition.wait(timeout=timeout)
+
+    def _is_stale(self, state: tuple[float, dict | None, bool]) -> bool:
+        """
+        Check if the stored state of an endpoint is too old to be trusted.
+
+        Args:
+            state: The stored state.
+
+        Returns:
+            True if the endpoint needs to be polled again, False if the state can be used.
+        """
+        received_at, _, pushed = state
+        return time.monotonic() - received_at > (self.max_age if pushed else PRIMED_MAX_AGE)
+
+    def _set_connected(self, connected: bool) -> None:
+        """
+        Mark the listener as (dis)connected. All state is dropped, as events may have been missed.
+
+        Args:
+            connected: Whether the WebSocket is connected.
+        """
+        with self._condition:
+            self.connected = connected
+            self._states.clear()
+            self.generation += 1
+            self._condition.notify_all()
+
+    def _handle_message(self, message: str) -> None:
+        """
+        Store the data of an event message.
+
+        Args:
+            message: The raw message received over the WebSocket.
+        """
+        try:
+            opcode, _, payload = json.loads(message)
+        except (ValueError, TypeError):
+            return
+
+        if opcode != EVENT_OPCODE or not isinstance(payload, dict) or payload.get("uri") not in TRACKED_URIS:
+            return
+
+        data = None if payload.get("eventType") == "Delete" else payload.get("data")
+        logger.debug(f"LCU event {payload.get('eventType')} on {payload['uri']}")
+        with self._condition:
+            self._states[payload["uri"]] = (time.monotonic(), data, True)
+            self.generation += 1
+            self._condition.notify_all()
+
+    @staticmethod
+    def _connect(port: int, auth_token: str, certificate: str) -> websocket.WebSocket:
+        """
+        Open the WebSocket to the LCU and subscribe to the events of every tracked endpoint.
+
+        Args:
+            port: The app port of the LCU.
+            auth_token: The remoting auth token of the LCU.
+            certificate: The path to the certificate the LCU is signed with.
+
+        Returns:
+            The connected WebSocket.
+        """
+        authorization = base64.b64encode(f"riot:{auth_token}".encode()).decode()
+        connection = websocket.create_connection(
+            WEBSOCKET_URL.format(port=port),
+            header=[f"Authorization: Basic {authorization}"],
+            sslopt={"ca_certs": certificate},
+            timeout=5,
+        )
+        for uri in TRACKED_URIS:
+            connection.send(json.dumps([SUBSCRIBE_OPCODE, get_event_name(uri)]))
+        # Wake up regularly, so a stop request is noticed.
+        connection.settimeout(1)
+        return connection
+
+    def _run(self, port: int, auth_token: str, certificate: str) -> None:
+        """
+        Keep the WebSocket connected and handle its messages until the listener is stopped.
+
+        Args:
+            port: The app port of the LCU.
+            auth_token: The remoting auth token of the LCU.
+            certificate: The path to the certificate the LCU is signed with.
+        """
+        reconnect_delay = RECONNECT_DELAY
+        while not self._stop_event.is_set():
+            try:
+                connection = self._connect(port=port, auth_token=auth_token, certificate=certificate)
+            except (websocket.WebSocketException, OSError) as exc:
+                logger.debug(f"Could not connect to the LCU WebSocket, polling instead: {exc}")
+                self._stop_event.wait(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 2, MAXIMUM_RECONNECT_DELAY)
+                continue
+
+            logger.debug("Connected to the LCU WebSocket")
+            self._set_connected(True)
+            reconnect_delay = RECONNECT_DELAY
+            try:
+                while not self._stop_event.is_set():
+                    try:
+                        self._handle_message(connection.recv())
+                    except websocket.WebSocketTimeoutException:
+                        continue
+            except (websocket.WebSocketException, OSError) as exc:
+                logger.debug(f"The LCU WebSocket closed, polling until it reconnects: {exc}")
+            finally:
+                self._set_connected(False)
+                connection.close()
@@ -2,6 +2,7 @@
 Integrations with the Rito API to have the most reliable data where possible.
 """
 
+from dataclasses import dataclass
 import time
 
 from loguru import logger
@@ -11,11 +12,23 @@ import requests
 from requests import HTTPError
 
 from tft_bot import config
+from tft_bot.league_api.lcu_events import LCUEventListener
+from tft_bot.league_api.transport import ResilientSession
 
 # Potentially make this configurable in the future
 # to let the user select their preferred tft mode.
 TFT_NORMAL_GAME_QUEUE_ID = 1090
 
+RIOT_CERTIFICATE_PATH = "tft_bot/resources/riotgames_root_certificate.pem"
+
+# The time in seconds a gameflow snapshot is re-used for, unless the client reported a change before that.
+GAMEFLOW_SNAPSHOT_TTL = 1.0
+
+# The time in seconds the game client may take to answer once connected, before it is considered hung.
+GAME_WINDOW_READ_TIMEOUT = 5.0
+
+IN_GAME_PHASES = frozenset({"ChampSelect", "GameStart", "InProgress", "Reconnect"})
+
 
 # LCU logic taken from https://github.com/elliejs/Willump
 # We want to implement a synchronous approach,
@@ -82,6 +95,91 @@ def _http_error_wrapper(method, raise_and_catch: bool = True, **kwargs) -> reque
     return response
 
 
+@dataclass(frozen=True)
+class GameflowSnapshot:
+    """
+    A dataclass holding the gameflow phase and login state of the client at one point in time.
+    """
+
+    phase: str | None
+    session_expired: bool | None
+    taken_at: float
+    generation: int
+
+    @classmethod
+    def from_sessions(
+        cls, gameflow_session: dict | None, login_session: dict | None, generation: int
+    ) -> "GameflowSnapshot":
+        """
+        Create a snapshot from the gameflow and login session of the client.
+
+        Args:
+            gameflow_session: The data of /lol-gameflow/v1/session, None if there is none.
+            login_session: The data of /lol-login/v1/session, None if there is none.
+            generation: The generation of the event listener before the sessions were requested.
+
+        Returns:
+            The snapshot.
+        """
+        return cls(
+            phase=gameflow_session["phase"] if gameflow_session is not None else None,
+            session_expired=bool(login_session.get("error")) if login_session is not None else None,
+            taken_at=time.monotonic(),
+            generation=generation,
+        )
+
+    def in_game(self) -> bool:
+        """
+        Check if the client is in a game, which includes champ select and a game waiting for a reconnect.
+
+        Returns:
+            True if we are in a game, False if not.
+        """
+        return self.phase in IN_GAME_PHASES
+
+    def should_reconnect(self) -> bool:
+        """
+        Check if the client waits for us to reconnect to a running game.
+
+        Returns:
+            True if we need to reconnect, False if not.
+        """
+        return self.phase == "Reconnect"
+
+
+@dataclass(frozen=True)
+class LiveGameSnapshot:
+    """
+    A dataclass holding the data of the running game, taken from a single Live Client Data request.
+    """
+
+    level: int
+    current_health: float
+    events: tuple[dict, ...]
+    game_time: float
+    taken_at: float
+
+    @classmethod
+    def from_all_game_data(cls, all_game_data: dict) -> "LiveGameSnapshot":
+        """
+        Create a snapshot from the response of /liveclientdata/allgamedata.
+
+        Args:
+            all_game_data: The parsed response.
+
+        Returns:
+            The snapshot.
+        """
+        active_player = all_game_data.get("activePlayer", {})
+        return cls(
+            level=active_player.get("level", 0),
+            current_health=active_player.get("championStats", {}).get("currentHealth", 0.0),
+            events=tuple(all_game_data.get("events", {}).get("Events", [])),
+            game_time=all_game_data.get("gameData", {}).get("gameTime", 0.0),
+            taken_at=time.monotonic(),
+        )
+
+
 class LCUIntegration:
     """
     Integrates the bot with League Client Update (LCU) API.
@@ -90,15 +188,17 @@ class LCUIntegration:
     """
 
     def __init__(self):
-        self._session = requests.Session()
+        self._session = ResilientSession()
         self._session.headers.update(
             {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
             }
         )
-        self._session.verify = "tft_bot/resources/riotgames_root_certificate.pem"
+        self._session.verify = RIOT_CERTIFICATE_PATH
         self._url = None
+        self.events = LCUEventListener()
+        self.gameflow_snapshot: GameflowSnapshot | None = None
         self.install_directory = None
 
     def connect_to_lcu(self, wait_for_availability: bool = False) -> bool:
@@ -132,6 +232,12 @@ class LCUIntegration:
         self.install_directory = process_arguments["install-directory"]
         self._url = f"https://127.0.0.1:{process_arguments['app-port']}"
         self._session.auth = ("riot", process_arguments["remoting-auth-token"])
+        self._session.circuit_breaker.reset()
+        self.events.start(
+            port=int(process_arguments["app-port"]),
+            auth_token=process_arguments["remoting-auth-token"],
+            certificate=RIOT_CERTIFICATE_PATH,
+        )
 
         connect_timeout = config.get_timeout(config.Timeout.CLIENT_CONNECT, 60)
         logger.info(f"League client found, trying to connect to it (~{connect_timeout}s timeout)")
@@ -181,6 +287,75 @@ class LCUIntegration:
         """
         return self.install_directory
 
+    def get_state(self, uri: str) -> dict | None:
+        """
+        Get the data of an endpoint, from the event listener if it knows it, else by polling the endpoint.
+
+        Args:
+            uri: The path of the endpoint, for example /lol-gameflow/v1/session.
+
+        Returns:
+            The data of the endpoint, or None if it does not exist right now or there was an issue getting it.
+
+        """
+        known, data = self.events.get_state(uri)
+        if known:
+            return data
+
+        response = _http_error_wrapper(self._session.get, url=f"{self._url}{uri}")
+        data = response.json() if response is not None else None
+        self.events.prime(uri, data)
+        return data
+
+    def wait_for_event(self, timeout: float) -> bool:
+        """
+        Wait until the client state changes, so the queue logic can react right away.
+        Simply sleeps if the event listener is not connected.
+
+        Args:
+            timeout: The maximum time to wait, in seconds.
+
+        Returns:
+            True if the client state changed, False if the timeout passed.
+
+        """
+        return self.events.wait_for_event(timeout=timeout)
+
+    def refresh(self) -> GameflowSnapshot:
+        """
+        Take a new gameflow snapshot, regardless of how old the current one is.
+
+        Returns:
+            The new snapshot.
+
+        """
+        # Taken before the requests, so a change while they run makes the snapshot stale right away.
+        generation = self.events.generation
+        self.gameflow_snapshot = GameflowSnapshot.from_sessions(
+            gameflow_session=self.get_state("/lol-gameflow/v1/session"),
+            login_session=self.get_state("/lol-login/v1/session"),
+            generation=generation,
+        )
+        return self.gameflow_snapshot
+
+    def get_gameflow_snapshot(self) -> GameflowSnapshot:
+        """
+        Get the gameflow snapshot, taking a new one if the current one is older than GAMEFLOW_SNAPSHOT_TTL
+        or the client reported a change since it was taken.
+
+        Returns:
+            The gameflow snapshot.
+
+        """
+        snapshot = self.gameflow_snapshot
+        if (
+            snapshot is None
+            or snapshot.generation != self.events.generation
+            or time.monotonic() - snapshot.taken_at > GAMEFLOW_SNAPSHOT_TTL
+        ):
+            snapshot = self.refresh()
+        return snapshot
+
     def in_lobby(self) -> bool:
         """
         Check if we are in a lobby, also checks if the lobby is of the type we want (TFT_NORMAL_GAME_QUEUE_ID).
@@ -189,12 +364,12 @@ class LCUIntegration:
             True if we are in a lobby of the type we want, False if not.
 
         """
-        get_lobby_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-lobby/v2/lobby")
+        lobby = self.get_state("/lol-lobby/v2/lobby")
 
-        if not get_lobby_response:
+        if not lobby:
             return False
 
-        return get_lobby_response.json()["gameConfig"]["queueId"] == TFT_NORMAL_GAME_QUEUE_ID
+        return lobby["gameConfig"]["queueId"] == TFT_NORMAL_GAME_QUEUE_ID
 
     def create_lobby(self) -> bool:
         """
@@ -241,19 +416,12 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we are already in a queue")
-        get_queue_response = _http_error_wrapper(
-            self._session.get, url=f"{self._url}/lol-lobby/v2/lobby/matchmaking/search-state"
-        )
+        search_state = self.get_state("/lol-lobby/v2/lobby/matchmaking/search-state")
 
-        return (
-            get_queue_response is not None
-            and get_queue_response.status_code is not None
-            and get_queue_response.json()["searchState"]
-            in {
-                "Searching",
-                "Found",
-            }
-        )
+        return search_state is not None and search_state["searchState"] in {
+            "Searching",
+            "Found",
+        }
 
     def found_queue(self) -> bool:
         """
@@ -264,11 +432,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we have found a match")
-        get_queue_response = _http_error_wrapper(
-            self._session.get, url=f"{self._url}/lol-lobby/v2/lobby/matchmaking/search-state"
-        )
+        search_state = self.get_state("/lol-lobby/v2/lobby/matchmaking/search-state")
 
-        return get_queue_response is not None and get_queue_response.json()["searchState"] == "Found"
+        return search_state is not None and search_state["searchState"] == "Found"
 
     def queue_accepted(self) -> bool:
         """
@@ -279,9 +445,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we already accepted the queue")
-        ready_check_state = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-matchmaking/v1/ready-check")
+        ready_check_state = self.get_state("/lol-matchmaking/v1/ready-check")
 
-        return ready_check_state is not None and ready_check_state.json()["playerResponse"] == "Accepted"
+        return ready_check_state is not None and ready_check_state["playerResponse"] == "Accepted"
 
     def accept_queue(self) -> None:
         """
@@ -299,14 +465,7 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we are in a game")
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-gameflow/v1/session")
-
-        return session_response is not None and session_response.json()["phase"] in {
-            "ChampSelect",
-            "GameStart",
-            "InProgress",
-            "Reconnect",
-        }
+        return self.get_gameflow_snapshot().in_game()
 
     def should_reconnect(self) -> bool:
         """
@@ -317,9 +476,7 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we should reconnect")
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-gameflow/v1/session")
-
-        return session_response is not None and session_response.json()["phase"] == "Reconnect"
+        return self.get_gameflow_snapshot().should_reconnect()
 
     def reconnect(self) -> None:
         """
@@ -327,6 +484,7 @@ class LCUIntegration:
         """
         logger.debug("Reconnecting to game")
         _http_error_wrapper(self._session.post, url=f"{self._url}/lol-gameflow/v1/reconnect")
+        self.refresh()
 
     def session_expired(self) -> bool:
         """
@@ -337,9 +495,7 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if our login session is expired")
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-login/v1/session")
-
-        return session_response.json()["error"] if session_response is not None else None
+        return self.get_gameflow_snapshot().session_expired
 
     def client_connected(self) -> bool:
         """
@@ -350,14 +506,8 @@ class LCUIntegration:
         """
         logger.debug("Checking if the client is connected")
         try:
-            availability_response = _http_error_wrapper(
-                self._session.get, url=f"{self._url}/lol-gameflow/v1/availability"
-            )
-            if (
-                availability_response is not None
-                and availability_response.status_code == 200
-                and availability_response.json()["isAvailable"]
-            ):
+            availability = self.get_state("/lol-gameflow/v1/availability")
+            if availability is not None and availability["isAvailable"]:
                 return True
         except (requests.exceptions.RequestException, requests.exceptions.ConnectionError):
             logger.warning("Can't determine client was available")
@@ -422,49 +572,75 @@ class GameClientIntegration:
 
     def __init__(self):
         self._url = "https://127.0.0.1:2999"
-        self._session = requests.Session()
+        # The game is polled every second while it starts, so let a request through about as often.
+        self._session = ResilientSession(circuit_reset_timeout=1.0)
         self._session.headers.update(
             {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
             }
         )
-        self._session.verify = "tft_bot/resources/riotgames_root_certificate.pem"
+        self._session.verify = RIOT_CERTIFICATE_PATH
+        self._live_game_snapshot: LiveGameSnapshot | None = None
 
-    def wait_for_game_window(
-        self, lcu_integration: LCUIntegration, timeout: int, connection_error_counter: int = 0
-    ) -> bool:
+    def refresh(self) -> LiveGameSnapshot | None:
+        """
+        Request the data of the running game, regardless of how old the current snapshot is.
+
+        Returns:
+            The new snapshot, or None if there was an issue getting it.
+
+        """
+        all_game_data_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/allgamedata")
+        if not all_game_data_response:
+            self._live_game_snapshot = None
+            return None
+
+        self._live_game_snapshot = LiveGameSnapshot.from_all_game_data(all_game_data_response.json())
+        return self._live_game_snapshot
+
+    def get_live_game_snapshot(self) -> LiveGameSnapshot | None:
+        """
+        Get the data of the running game, requesting it again if the snapshot is older than the configured maximum age.
+
+        Returns:
+            The snapshot, or None if there was an issue getting it.
+
+        """
+        snapshot = self._live_game_snapshot
+        if snapshot is None or time.monotonic() - snapshot.taken_at > config.get_live_client_data_max_age():
+            snapshot = self.refresh()
+        return snapshot
+
+    def wait_for_game_window(self, lcu_integration: LCUIntegration, timeout: int) -> bool:
         """
         Waits for the API to be responsive, which also means the game window is available.
 
         Args:
             lcu_integration: The object to interact with the LCU.
             timeout: The approximate time to wait for a successful connection before giving up.
-            connection_error_counter: The amount of times we received a connection error, should only be set by itself.
 
         Returns:
             True if we could connect to the API within a specified time, False if not
 
         """
-        try:
-            self._session.get(f"{self._url}", timeout=(timeout, None))
-        except requests.exceptions.ConnectionError:
-            if connection_error_counter == timeout:
-                return False
-
-            time.sleep(1)
+        for connection_error_counter in range(timeout + 1):
+            try:
+                self._session.get(f"{self._url}", timeout=(timeout, GAME_WINDOW_READ_TIMEOUT))
+                return True
+            except requests.exceptions.ConnectionError:
+                if connection_error_counter == timeout:
+                    return False
 
-            if lcu_integration.should_reconnect():
-                lcu_integration.reconnect()
-                time.sleep(5)
+                time.sleep(1)
 
-            return self.wait_for_game_window(
-                lcu_integration=lcu_integration, timeout=timeout, connection_error_counter=connection_error_counter + 1
-            )
-        except requests.exceptions.Timeout:
-            return False
+                if lcu_integration.should_reconnect():
+                    lcu_integration.reconnect()
+                    time.sleep(5)
+            except requests.exceptions.Timeout:
+                return False
 
-        return True
+        return False
 
     def game_loaded(self) -> bool:
         """
@@ -476,8 +652,8 @@ class GameClientIntegration:
         """
         logger.debug("Checking if the game has loaded")
 
-        event_data_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/eventdata")
-        return event_data_response is not None and len(event_data_response.json()["Events"]) > 0
+        snapshot = self.get_live_game_snapshot()
+        return snapshot is not None and len(snapshot.events) > 0
 
     def is_dead(self) -> bool:
         """
@@ -489,12 +665,12 @@ class GameClientIntegration:
         """
         logger.debug("Checking if we have more than 0 HP")
 
-        active_player_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/activeplayer")
-        if not active_player_response:
+        snapshot = self.get_live_game_snapshot()
+        if not snapshot:
             logger.debug("There was an error in the response, assuming that we are dead")
             return True
 
-        return active_player_response.json()["championStats"]["currentHealth"] <= 0.0
+        return snapshot.current_health <= 0.0
 
     def get_level(self) -> int:
         """
@@ -504,9 +680,19 @@ class GameClientIntegration:
             The level of the active player.
         """
 
-        active_player_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/activeplayer")
-        if not active_player_response:
+        snapshot = self.get_live_game_snapshot()
+        if not snapshot:
             logger.debug("There was an error in the response, assuming that we are level 0")
             return 0
 
-        return active_player_response.json().get("level", 0)
+        return snapshot.level
+
+    def get_game_time(self) -> float:
+        """
+        Get the time that passed since the game started.
+
+        Returns:
+            The game time in seconds, 0.0 if there was an issue getting it.
+        """
+        snapshot = self.get_live_game_snapshot()
+        return snapshot.game_time if snapshot else 0.0
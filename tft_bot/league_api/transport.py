@@ -0,0 +1,264 @@
+"""
+Module holding the HTTP transport of the Rito API integrations, which bounds every request in time
+and stops sending requests to a client that does not answer.
+"""
+
+from enum import auto
+from enum import StrEnum
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from loguru import logger
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connect and read timeouts in seconds, for every endpoint starting with the path.
+DEFAULT_TIMEOUT = (3.05, 10.0)
+ENDPOINT_TIMEOUTS = {
+    "/riotclient/ux-state": (2.0, 5.0),
+    "/lol-gameflow": (2.0, 5.0),
+    "/lol-login": (2.0, 5.0),
+    "/lol-lobby": (2.0, 5.0),
+    "/lol-matchmaking": (2.0, 5.0),
+    "/lol-match-history": (3.05, 20.0),
+    "/liveclientdata": (1.0, 3.0),
+}
+
+# Only requests that can safely be sent twice are retried.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# The settings of a session that every thread copies onto its own session before sending a request.
+SHARED_SESSION_SETTINGS = ("headers", "auth", "proxies", "hooks", "params", "stream", "verify", "cert", "trust_env")
+
+# Every retry waits a random time up to the base delay doubled per attempt, capped at the maximum.
+BACKOFF_BASE_DELAY = 0.25
+BACKOFF_MAXIMUM_DELAY = 4.0
+
+
+def get_endpoint_timeout(url: str) -> tuple[float, float]:
+    """
+    Get the connect and read timeout of an endpoint.
+
+    Args:
+        url: The full URL of the request.
+
+    Returns:
+        The connect and read timeout in seconds.
+    """
+    path = urlsplit(url).path
+    matches = [prefix for prefix in ENDPOINT_TIMEOUTS if path.startswith(prefix)]
+    return ENDPOINT_TIMEOUTS[max(matches, key=len)] if matches else DEFAULT_TIMEOUT
+
+
+def get_backoff_delay(attempt: int) -> float:
+    """
+    Get the time to wait before retrying a request, using exponential backoff with full jitter.
+
+    Args:
+        attempt: The amount of attempts that already failed, starting at 1.
+
+    Returns:
+        The delay in seconds.
+    """
+    return random.uniform(0, min(BACKOFF_MAXIMUM_DELAY, BACKOFF_BASE_DELAY * 2 ** (attempt - 1)))
+
+
+class CircuitState(StrEnum):
+    """
+    StrEnum holding the states of a circuit breaker.
+    """
+
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a client after too many requests in a row failed, for example while it restarts.
+    Once the reset timeout passed, a single probe request is let through and every other request is rejected
+    until the probe decides if the circuit closes again.
+    A request is only recorded once, after all of its retries, so one slow request can not open the circuit by itself.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 3.0):
+        """
+        Init method to start with a closed circuit.
+
+        Args:
+            failure_threshold: The amount of failed requests in a row that opens the circuit. Defaults to 5.
+            reset_timeout: The time in seconds the circuit stays open before requests are tried again. Defaults to 3.0.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        # Transitions into every state, and the outcome of every request.
+        self.counters = dict.fromkeys([*CircuitState, "successes", "failures", "rejected"], 0)
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check if a request may be sent. Every allowed request needs its outcome recorded with record_success
+        or record_failure, as the circuit stays half open until the probe request is recorded.
+
+        Returns:
+            True if the request may be sent, False if it should fail right away.
+        """
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+
+            if self.state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # This request is the probe, every other one is rejected until its outcome is recorded.
+                self._transition(CircuitState.HALF_OPEN)
+                return True
+
+            self.counters["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        """
+        Record a request that got a response, closing the circuit.
+        """
+        with self._lock:
+            self.counters["successes"] += 1
+            self._consecutive_failures = 0
+            if self.state != CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """
+        Record a request that did not get a response, opening the circuit if it failed too often.
+        """
+        with self._lock:
+            self.counters["failures"] += 1
+            self._consecutive_failures += 1
+            if self.state == CircuitState.HALF_OPEN or (
+                self.state == CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._transition(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """
+        Close the circuit, for example after a new client was found.
+        """
+        with self._lock:
+            self._consecutive_failures = 0
+            if self.state != CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+
+    def _transition(self, state: CircuitState) -> None:
+        """
+        Change the state and count the transition, the lock needs to be held.
+
+        Args:
+            state: The new state.
+        """
+        logger.debug(f"Circuit breaker {self.state} -> {state}")
+        self.state = state
+        self.counters[state] += 1
+
+
+class ResilientSession(requests.Session):
+    """
+    A requests session that applies the endpoint timeouts, keeps a bounded pool of keep-alive connections,
+    retries failed idempotent requests with backoff and fails fast while the circuit breaker is open.
+    Failed requests raise the same exceptions as a plain session, so existing error handling keeps working.
+    A requests session is not thread-safe, so every thread sends its requests through its own session,
+    which copies the settings of this one and shares its connection pool.
+    """
+
+    def __init__(self, max_retries: int = 2, pool_size: int = 4, circuit_reset_timeout: float = 3.0):
+        """
+        Init method to mount the pooled adapter.
+
+        Args:
+            max_retries: How often an idempotent request is retried after a connection error. Defaults to 2.
+            pool_size: The maximum amount of connections kept open to the client. Defaults to 4.
+            circuit_reset_timeout: The time in seconds the circuit breaker stays open. Defaults to 3.0.
+        """
+        super().__init__()
+        self.max_retries = max_retries
+        self.circuit_breaker = CircuitBreaker(reset_timeout=circuit_reset_timeout)
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.mount("https://", self._adapter)
+        self.mount("http://", self._adapter)
+        self._thread_sessions = threading.local()
+
+    def _get_thread_session(self) -> requests.Session:
+        """
+        Get the session of the calling thread, created on its first request, with the current settings of this one.
+
+        Returns:
+            The session to send the request of the calling thread with.
+        """
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._thread_sessions.session = session
+
+        for setting in SHARED_SESSION_SETTINGS:
+            setattr(session, setting, getattr(self, setting))
+        return session
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:  # pylint: disable=arguments-differ
+        """
+        Send a request, see requests.Session.request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL of the request.
+            *args: Any positional arguments to pass to requests.Session.request.
+            **kwargs: Any keyword arguments to pass to requests.Session.request.
+              Without a timeout, the timeout of the endpoint is used.
+
+        Returns:
+            The response.
+        """
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(f"Not sending {method} {url}, the client did not respond recently")
+
+        kwargs.setdefault("timeout", get_endpoint_timeout(url))
+        attempts = self.max_retries + 1 if method.upper() in IDEMPOTENT_METHODS else 1
+        session = self._get_thread_session()
+        attempt = 1
+        client_answered = False
+        try:
+            while True:
+                try:
+                    response = session.request(method, url, *args, **kwargs)
+                except requests.exceptions.ReadTimeout:
+                    # The client accepted the connection but hangs, retrying would only hang again.
+                    raise
+                except requests.exceptions.ConnectionError:
+                    if attempt >= attempts:
+                        raise
+                    time.sleep(get_backoff_delay(attempt))
+                    attempt += 1
+                    continue
+                except requests.exceptions.RequestException:
+                    # The client answered, just not with anything usable.
+                    client_answered = True
+                    raise
+
+                client_answered = True
+                return response
+        finally:
+            # Recorded for every way out, so a probe interrupted by any exception does not leave the circuit half open.
+            if client_answered:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
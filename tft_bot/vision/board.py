@@ -0,0 +1,158 @@
+"""
+Module holding the board scanner, which finds the health bars of units on the board.
+"""
+
+import threading
+
+import cv2
+import numpy
+
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import Coordinates
+
+# H, S, V
+LOWER_GREEN = numpy.array([40, 150, 10])
+UPPER_GREEN = numpy.array([75, 255, 255])
+
+FIELD_SLOT_Y_POSITIONS = numpy.array([672, 596, 515, 446])
+MINIMUM_Y_OFFSET = 75
+
+# Health bars start within these rows of the 1920 x 1080 game window.
+BOARD_MIN_Y = 275
+BOARD_MAX_Y = 672
+# Extra rows around the board, so the morphology near the edges sees the same neighbourhood as on the full window,
+# and health bars starting at the last board row are not cut off.
+BOARD_MARGIN = 28
+
+HEALTH_BAR_MIN_WIDTH = 55
+HEALTH_BAR_MAX_WIDTH = 80
+HEALTH_BAR_MIN_HEIGHT = 5
+HEALTH_BAR_MAX_HEIGHT = 20
+
+
+class BoardScanner:  # pylint: disable=too-few-public-methods
+    """
+    Scans only the board rows of a frame, re-using its kernels and buffers between scans.
+    Frames that do not have the reference window size are scanned at the reference size,
+    and positions are always returned in the reference window size, like every other detector.
+    """
+
+    def __init__(self):
+        """
+        Init method to preallocate the kernels, buffers are allocated on the first scan of a frame size.
+        """
+        self._kernel = numpy.ones((3, 3), dtype=numpy.uint8)
+        self._sorted_slot_y_positions = numpy.sort(FIELD_SLOT_Y_POSITIONS)
+        self._buffers: dict[str, numpy.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def scan(self, frame: FrameSnapshot) -> list[Coordinates]:
+        """
+        Get the board position of every unit on a frame of the game window. The result is remembered for the frame.
+
+        Args:
+            frame: The frame of the game window.
+
+        Returns:
+            A list of coordinates holding the board position of the unit, relative to the window and in the reference
+            window size, see screen_helpers.calculate_window_click_offset.
+        """
+        if "board" not in frame.cache:
+            with self._lock:
+                frame.cache["board"] = self._scan(frame)
+        return frame.cache["board"]
+
+    def _get_buffer(self, name: str, shape: tuple[int, ...]) -> numpy.ndarray:
+        """
+        Get a preallocated buffer, allocating it again if the requested shape changed.
+
+        Args:
+            name: The name of the buffer.
+            shape: The shape the buffer needs to have.
+
+        Returns:
+            The buffer, its contents are left over from the previous scan.
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = numpy.empty(shape, dtype=numpy.uint8)
+            self._buffers[name] = buffer
+        return buffer
+
+    def _build_mask(self, frame: FrameSnapshot, min_y: int, max_y: int) -> numpy.ndarray:
+        """
+        Build the blurred health bar mask of the board rows, at the reference window size.
+
+        Args:
+            frame: The frame of the game window.
+            min_y: The first row to scan, relative to the frame and in the reference window size.
+            max_y: The row after the last row to scan, relative to the frame and in the reference window size.
+
+        Returns:
+            The mask of the board rows.
+        """
+        scaled_min_y = frame.scale.scale_y(min_y)
+        scaled_max_y = frame.scale.scale_y(max_y)
+        board_pixels = frame.bgra[scaled_min_y:scaled_max_y]
+        if not frame.scale.is_identity():
+            # The health bar sizes and morphology are tuned to the reference window size, so scale the rows back to it.
+            shape = (max_y - min_y, round(board_pixels.shape[1] / frame.scale.factor_x))
+            board_pixels = cv2.resize(
+                board_pixels, shape[::-1], dst=self._get_buffer("resized", (*shape, 4)), interpolation=cv2.INTER_LINEAR
+            )
+        shape = board_pixels.shape[:2]
+        hsv = cv2.cvtColor(board_pixels, cv2.COLOR_BGR2HSV, dst=self._get_buffer("hsv", (*shape, 3)))
+        mask = cv2.inRange(hsv, LOWER_GREEN, UPPER_GREEN, dst=self._get_buffer("mask", shape))
+        morphed = cv2.erode(mask, self._kernel, dst=self._get_buffer("morphed", shape), iterations=2)
+        mask = cv2.dilate(morphed, self._kernel, dst=mask, iterations=2)
+        return cv2.GaussianBlur(mask, (5, 5), 0, dst=morphed)
+
+    def _scan(self, frame: FrameSnapshot) -> list[Coordinates]:
+        """
+        Get the board position of every unit on a frame of the game window.
+
+        Args:
+            frame: The frame of the game window.
+
+        Returns:
+            A list of coordinates holding the board position of the unit.
+        """
+        min_y = max(BOARD_MIN_Y - BOARD_MARGIN, 0)
+        max_y = min(
+            BOARD_MAX_Y + HEALTH_BAR_MAX_HEIGHT + BOARD_MARGIN, round(frame.bgra.shape[0] / frame.scale.factor_y)
+        )
+        if max_y <= min_y:
+            return []
+
+        contours, _ = cv2.findContours(
+            self._build_mask(frame=frame, min_y=min_y, max_y=max_y), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+        if not contours:
+            return []
+
+        position_x, position_y, width, height = numpy.array([cv2.boundingRect(contour) for contour in contours]).T
+        position_y = position_y + min_y
+
+        is_health_bar = (
+            (position_y >= BOARD_MIN_Y)
+            & (position_y <= BOARD_MAX_Y)
+            & (width >= HEALTH_BAR_MIN_WIDTH)
+            & (width <= HEALTH_BAR_MAX_WIDTH)
+            & (height >= HEALTH_BAR_MIN_HEIGHT)
+            & (height <= HEALTH_BAR_MAX_HEIGHT)
+        )
+        center_x = (position_x + width / 2).astype(int)[is_health_bar]
+        center_y = (position_y + height / 2).astype(int)[is_health_bar] + MINIMUM_Y_OFFSET
+
+        # Snap every unit to the closest slot row below it.
+        slot_indices = numpy.searchsorted(self._sorted_slot_y_positions, center_y, side="right")
+        on_board = slot_indices < len(self._sorted_slot_y_positions)
+        slot_y = self._sorted_slot_y_positions[slot_indices[on_board]]
+
+        return [
+            Coordinates(position_x=int(unit_x), position_y=int(unit_y))
+            for unit_x, unit_y in zip(center_x[on_board], slot_y)
+        ]
+
+
+BOARD_SCANNER = BoardScanner()
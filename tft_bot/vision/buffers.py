@@ -0,0 +1,87 @@
+"""
+Module holding the buffer pool, which hands out pixel buffers that are re-used once their owner is gone.
+"""
+
+import threading
+from typing import Any
+import weakref
+
+import numpy
+
+
+class BufferPool:
+    """
+    Keeps released pixel buffers by shape and data type, so converting every frame does not allocate new ones.
+    A buffer is released automatically when the object it was acquired for is garbage collected.
+    """
+
+    def __init__(self, max_free_buffers: int = 4):
+        """
+        Init method to set how many unused buffers of a shape are kept around.
+
+        Args:
+            max_free_buffers: The maximum amount of unused buffers kept per shape and data type. Defaults to 4.
+        """
+        self.max_free_buffers = max_free_buffers
+        self.allocations = 0
+        self.allocated_bytes = 0
+        self.reuses = 0
+        self._free_buffers: dict[tuple, list[numpy.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: tuple[int, ...], owner: Any, dtype: type = numpy.uint8) -> numpy.ndarray:
+        """
+        Get a buffer that stays reserved until the owner is garbage collected.
+
+        Args:
+            shape: The shape of the buffer.
+            owner: The object the buffer belongs to, for example a frame.
+            dtype: The data type of the buffer. Defaults to numpy.uint8.
+
+        Returns:
+            The buffer, its contents are left over from its previous owner.
+        """
+        key = (tuple(shape), numpy.dtype(dtype).str)
+        with self._lock:
+            free_buffers = self._free_buffers.get(key)
+            if free_buffers:
+                buffer = free_buffers.pop()
+                self.reuses += 1
+            else:
+                buffer = numpy.empty(shape, dtype=dtype)
+                self.allocations += 1
+                self.allocated_bytes += buffer.nbytes
+
+        weakref.finalize(owner, self._release, key, buffer)
+        return buffer
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        Get the allocation counters, in steady state only reuses should grow.
+
+        Returns:
+            A dictionary holding the allocations, allocated bytes, reuses and currently unused buffers.
+        """
+        with self._lock:
+            return {
+                "allocations": self.allocations,
+                "allocated_bytes": self.allocated_bytes,
+                "reuses": self.reuses,
+                "free_buffers": sum(len(free_buffers) for free_buffers in self._free_buffers.values()),
+            }
+
+    def _release(self, key: tuple, buffer: numpy.ndarray) -> None:
+        """
+        Return a buffer to the pool.
+
+        Args:
+            key: The shape and data type the buffer is kept under.
+            buffer: The buffer to return.
+        """
+        with self._lock:
+            free_buffers = self._free_buffers.setdefault(key, [])
+            if len(free_buffers) < self.max_free_buffers:
+                free_buffers.append(buffer)
+
+
+BUFFER_POOL = BufferPool()
@@ -0,0 +1,82 @@
+"""
+Module holding the pixel cache, which memoizes expensive results by the pixels they were computed from.
+"""
+
+from collections import OrderedDict
+import hashlib
+import threading
+from typing import Any, Callable
+
+import numpy
+
+
+def hash_pixels(pixels: numpy.ndarray) -> bytes:
+    """
+    Compute a fast hash of pixels, including their shape so crops of different sizes never collide.
+
+    Args:
+        pixels: The pixels to hash.
+
+    Returns:
+        The hash as bytes.
+    """
+    pixel_hash = hashlib.blake2b(str(pixels.shape).encode(), digest_size=16)
+    pixel_hash.update(numpy.ascontiguousarray(pixels).data)
+    return pixel_hash.digest()
+
+
+class PixelCache:
+    """
+    A bounded least-recently-used cache of results, keyed by a hash of the pixels they were computed from.
+    """
+
+    def __init__(self, max_size: int = 64):
+        """
+        Init method to set the size of the cache.
+
+        Args:
+            max_size: The maximum amount of results to keep. Defaults to 64.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, pixels: numpy.ndarray, compute: Callable[[numpy.ndarray], Any]) -> Any:
+        """
+        Get the result for pixels, computing and storing it if these exact pixels were not seen recently.
+
+        Args:
+            pixels: The pixels the result is computed from.
+            compute: The function computing the result from the pixels.
+
+        Returns:
+            The (cached) result.
+        """
+        key = hash_pixels(pixels)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+            self.misses += 1
+
+        result = compute(pixels)
+
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """
+        Drop all cached results and reset the counters.
+        """
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,237 @@
+"""
+Module holding the screen sources, which capture the pixels of a region on screen.
+"""
+
+import threading
+
+import cv2
+import mss
+import numpy
+
+from tft_bot.vision.geometry import BoundingBox
+
+
+class ScreenSource:
+    """
+    Blueprint class to implement screen capture backends on.
+    """
+
+    def grab(self, bounding_box: BoundingBox) -> numpy.ndarray:
+        """
+        Capture a region of the screen.
+
+        Args:
+            bounding_box: The absolute screen area to capture.
+
+        Returns:
+            The captured pixels in BGRA format.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release anything the source holds on to.
+        """
+
+
+class MssScreenSource(ScreenSource):
+    """
+    Captures the live screen with mss. Every thread keeps its own long-lived mss instance,
+    since the device contexts it holds may not be shared between threads.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _get_screenshot_taker(self) -> mss.base.MSSBase:
+        """
+        Get the mss instance of the current thread, creating it on first use.
+
+        Returns:
+            The mss instance of the current thread.
+        """
+        screenshot_taker = getattr(self._local, "screenshot_taker", None)
+        if screenshot_taker is None:
+            screenshot_taker = mss.mss()
+            self._local.screenshot_taker = screenshot_taker
+        return screenshot_taker
+
+    def grab(self, bounding_box: BoundingBox) -> numpy.ndarray:
+        screenshot = self._get_screenshot_taker().grab(bounding_box.to_tuple())
+        # View the raw BGRA buffer mss allocated for this capture instead of copying it.
+        return numpy.frombuffer(screenshot.raw, dtype=numpy.uint8).reshape(screenshot.height, screenshot.width, 4)
+
+    def close(self) -> None:
+        screenshot_taker = getattr(self._local, "screenshot_taker", None)
+        if screenshot_taker is not None:
+            screenshot_taker.close()
+            self._local.screenshot_taker = None
+
+
+class ArrayScreenSource(ScreenSource):
+    """
+    Serves captures from an in-memory screen, useful to replay recorded frames without a live screen.
+    """
+
+    def __init__(self, pixels: numpy.ndarray, origin_x: int = 0, origin_y: int = 0):
+        """
+        Init method to set the screen that captures are served from.
+
+        Args:
+            pixels: The pixels of the screen, in BGRA, BGR or grayscale format.
+            origin_x: The absolute x coordinate of the top left corner of the pixels. Defaults to 0.
+            origin_y: The absolute y coordinate of the top left corner of the pixels. Defaults to 0.
+        """
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self._pixels = _to_bgra(pixels)
+
+    def set_pixels(self, pixels: numpy.ndarray) -> None:
+        """
+        Replace the screen that captures are served from.
+
+        Args:
+            pixels: The pixels of the screen, in BGRA, BGR or grayscale format.
+        """
+        self._pixels = _to_bgra(pixels)
+
+    def grab(self, bounding_box: BoundingBox) -> numpy.ndarray:
+        screen_height, screen_width = self._pixels.shape[:2]
+        min_x = bounding_box.min_x - self.origin_x
+        min_y = bounding_box.min_y - self.origin_y
+        max_x = bounding_box.max_x - self.origin_x
+        max_y = bounding_box.max_y - self.origin_y
+        if min_x >= 0 and min_y >= 0 and max_x <= screen_width and max_y <= screen_height:
+            # The pixels are replaced instead of changed, so a view stays valid for as long as it is used.
+            return self._pixels[min_y:max_y, min_x:max_x]
+
+        return self._grab_padded(bounding_box)
+
+    def _grab_padded(self, bounding_box: BoundingBox) -> numpy.ndarray:
+        """
+        Capture a region that is partially or fully outside the recorded screen.
+
+        Args:
+            bounding_box: The absolute screen area to capture.
+
+        Returns:
+            The captured pixels in BGRA format.
+        """
+        # Areas outside the recorded screen are black, the same as mss reports for off-screen areas.
+        captured_pixels = numpy.zeros((bounding_box.get_height(), bounding_box.get_width(), 4), dtype=numpy.uint8)
+
+        screen_height, screen_width = self._pixels.shape[:2]
+        min_x = max(bounding_box.min_x - self.origin_x, 0)
+        min_y = max(bounding_box.min_y - self.origin_y, 0)
+        max_x = min(bounding_box.max_x - self.origin_x, screen_width)
+        max_y = min(bounding_box.max_y - self.origin_y, screen_height)
+        if min_x >= max_x or min_y >= max_y:
+            return captured_pixels
+
+        target_min_x = min_x - (bounding_box.min_x - self.origin_x)
+        target_min_y = min_y - (bounding_box.min_y - self.origin_y)
+        target_max_x = target_min_x + max_x - min_x
+        target_max_y = target_min_y + max_y - min_y
+        captured_pixels[target_min_y:target_max_y, target_min_x:target_max_x] = self._pixels[min_y:max_y, min_x:max_x]
+        return captured_pixels
+
+
+class FileScreenSource(ArrayScreenSource):
+    """
+    Serves captures from a recorded screenshot on disk, either a PNG or a numpy (.npy/.npz) file.
+    """
+
+    def __init__(self, path: str, origin_x: int = 0, origin_y: int = 0):
+        """
+        Init method to load the recorded screenshot.
+
+        Args:
+            path: The path to the recorded screenshot.
+            origin_x: The absolute x coordinate of the top left corner of the screenshot. Defaults to 0.
+            origin_y: The absolute y coordinate of the top left corner of the screenshot. Defaults to 0.
+        """
+        super().__init__(pixels=load_recorded_frame(path), origin_x=origin_x, origin_y=origin_y)
+        self.path = path
+
+    def load(self, path: str) -> None:
+        """
+        Replace the screen with another recorded screenshot.
+
+        Args:
+            path: The path to the recorded screenshot.
+        """
+        self.set_pixels(load_recorded_frame(path))
+        self.path = path
+
+
+def load_recorded_frame(path: str) -> numpy.ndarray:
+    """
+    Load a recorded frame from disk.
+
+    Args:
+        path: The path to a PNG, .npy or .npz file. For .npz files the "pixels" array is used, or the first one.
+
+    Returns:
+        The recorded pixels.
+
+    Raises:
+        ValueError: If the file could not be read.
+    """
+    if path.endswith(".npz"):
+        with numpy.load(path) as recorded_arrays:
+            name = "pixels" if "pixels" in recorded_arrays.files else recorded_arrays.files[0]
+            return recorded_arrays[name]
+
+    if path.endswith(".npy"):
+        return numpy.load(path)
+
+    pixels = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if pixels is None:
+        raise ValueError(f"The recorded frame {path} does not exist or can not be read")
+    return pixels
+
+
+def _to_bgra(pixels: numpy.ndarray) -> numpy.ndarray:
+    """
+    Convert pixels to the BGRA format mss captures in.
+
+    Args:
+        pixels: The pixels in BGRA, BGR or grayscale format.
+
+    Returns:
+        The pixels in BGRA format.
+    """
+    if pixels.ndim == 2:
+        return cv2.cvtColor(pixels, cv2.COLOR_GRAY2BGRA)
+    if pixels.shape[2] == 3:
+        return cv2.cvtColor(pixels, cv2.COLOR_BGR2BGRA)
+    return pixels
+
+
+_SCREEN_SOURCE: ScreenSource = MssScreenSource()
+
+
+def get_screen_source() -> ScreenSource:
+    """
+    Get the screen source captures are currently taken with.
+
+    Returns:
+        The active screen source.
+    """
+    return _SCREEN_SOURCE
+
+
+def set_screen_source(screen_source: ScreenSource) -> ScreenSource:
+    """
+    Replace the screen source captures are taken with, for example to replay recorded frames.
+
+    Args:
+        screen_source: The screen source to use from now on.
+
+    Returns:
+        The previously active screen source.
+    """
+    global _SCREEN_SOURCE
+    previous_screen_source = _SCREEN_SOURCE
+    _SCREEN_SOURCE = screen_source
+    return previous_screen_source
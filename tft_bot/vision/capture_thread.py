@@ -0,0 +1,238 @@
+"""
+Module holding the capture thread, which keeps capturing a window into a small ring buffer in the background.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+import threading
+import time
+import weakref
+
+from loguru import logger
+import numpy
+
+from tft_bot.constants import reference_window_sizes
+from tft_bot.vision.capture import get_screen_source
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.window import get_window_geometry
+
+# How long to wait before looking for the window again if it does not exist.
+MISSING_WINDOW_DELAY = 1.0
+
+
+@dataclass
+class _RingBuffer:
+    """
+    A dataclass holding the preallocated slots of the capture thread and the frames that reference them.
+    """
+
+    slots: int
+    pixels: numpy.ndarray | None = None
+    slot_frames: list[weakref.ref | None] = field(default_factory=list)
+    latest: FrameSnapshot | None = None
+
+
+class CaptureThread:
+    """
+    Captures a window at a fixed rate into a preallocated ring buffer, so detectors read the newest frame
+    instead of waiting for a capture. A slot is only overwritten once no frame of it is referenced anymore,
+    if all slots are still in use the capture is dropped.
+    """
+
+    def __init__(self, window_title: str, fps: float = 10.0, slots: int = 4):
+        """
+        Init method to set what to capture and how often.
+
+        Args:
+            window_title: The title of the window to capture.
+            fps: How many captures to take per second. Defaults to 10.0.
+            slots: How many frames the ring buffer holds. Defaults to 4.
+        """
+        self.window_title = window_title
+        self.fps = fps
+        self.dropped_frames = 0
+        self._ring = _RingBuffer(slots=slots)
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start capturing in the background, does nothing if already running.
+        """
+        if self.is_running():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=f"capture-{self.window_title}", daemon=True)
+        self._thread.start()
+        logger.debug(f"Capturing {self.window_title} in the background at {self.fps} FPS")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop capturing and drop the newest frame.
+
+        Args:
+            timeout: How long to wait for the thread to finish its current capture. Defaults to 1.0.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+        with self._condition:
+            self._ring.latest = None
+            self._condition.notify_all()
+
+    def is_running(self) -> bool:
+        """
+        Check if the thread is capturing.
+
+        Returns:
+            True if the thread is alive and was not asked to stop, False if not.
+        """
+        return self._thread is not None and self._thread.is_alive() and not self._stopped.is_set()
+
+    def wait_for_frame(self, newer_than: float, timeout: float) -> FrameSnapshot | None:
+        """
+        Wait for a frame captured after a point in time, for example to see the result of a click.
+
+        Args:
+            newer_than: The monotonic time the frame's capture has to have started after.
+            timeout: The maximum time in seconds to wait.
+
+        Returns:
+            The newest frame, or None if no new enough frame was captured in time.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._stopped.is_set()
+                or (self._ring.latest is not None and self._ring.latest.captured_at > newer_than),
+                timeout=timeout,
+            )
+            if self._ring.latest is None or self._ring.latest.captured_at <= newer_than:
+                return None
+            return self._ring.latest
+
+    def _run(self) -> None:
+        """
+        Capture until stopped, keeping to the configured rate.
+        """
+        period = 1 / self.fps
+        next_capture_at = time.monotonic()
+        while not self._stopped.wait(max(next_capture_at - time.monotonic(), 0)):
+            # Do not try to catch up on captures that were missed, just keep the rate from now on.
+            next_capture_at = max(next_capture_at + period, time.monotonic())
+            try:
+                if not self._capture():
+                    next_capture_at = time.monotonic() + MISSING_WINDOW_DELAY
+            except Exception as exc:
+                logger.opt(exception=exc).debug(f"Capturing {self.window_title} in the background failed")
+                get_window_geometry().invalidate(self.window_title)
+
+    def _capture(self) -> bool:
+        """
+        Capture the window into a free slot of the ring buffer.
+
+        Returns:
+            True if the window exists, False if not.
+        """
+        window_bounding_box = get_window_geometry().get_bounding_box(self.window_title)
+        if not window_bounding_box:
+            with self._condition:
+                self._ring.latest = None
+            return False
+
+        captured_at = time.monotonic()
+        pixels = get_screen_source().grab(window_bounding_box)
+        slot = self._acquire_slot(pixels.shape)
+        if slot is None:
+            self.dropped_frames += 1
+            return True
+
+        slot_pixels = self._ring.pixels[slot]
+        numpy.copyto(slot_pixels, pixels)
+        frame = FrameSnapshot(
+            pixels=slot_pixels,
+            bounding_box=window_bounding_box,
+            captured_at=captured_at,
+            reference_size=reference_window_sizes.get(self.window_title),
+        )
+        with self._condition:
+            self._ring.slot_frames[slot] = weakref.ref(frame)
+            self._ring.latest = frame
+            self._condition.notify_all()
+        return True
+
+    def _acquire_slot(self, shape: tuple[int, ...]) -> int | None:
+        """
+        Find a slot of the ring buffer that no frame references anymore, (re-)allocating the buffer on size changes.
+
+        Args:
+            shape: The shape of the captured pixels.
+
+        Returns:
+            The index of the free slot or None if all slots are in use.
+        """
+        with self._condition:
+            if self._ring.pixels is None or self._ring.pixels.shape[1:] != shape:
+                # Frames of the old buffer keep it alive until they are dropped, so nothing is overwritten.
+                self._ring.pixels = numpy.empty((self._ring.slots, *shape), dtype=numpy.uint8)
+                self._ring.slot_frames = [None] * self._ring.slots
+                self._ring.latest = None
+
+            for slot, slot_frame in enumerate(self._ring.slot_frames):
+                if slot_frame is None or slot_frame() is None:
+                    self._ring.slot_frames[slot] = None
+                    return slot
+        return None
+
+
+_CAPTURE_THREADS: dict[str, CaptureThread] = {}
+
+
+def start_capture_thread(window_title: str, fps: float) -> CaptureThread:
+    """
+    Start capturing a window in the background, re-using the window's capture thread if it already has one.
+
+    Args:
+        window_title: The title of the window to capture.
+        fps: How many captures to take per second.
+
+    Returns:
+        The running capture thread.
+    """
+    capture_thread = _CAPTURE_THREADS.get(window_title)
+    if capture_thread is None or capture_thread.fps != fps:
+        if capture_thread is not None:
+            capture_thread.stop()
+        capture_thread = CaptureThread(window_title=window_title, fps=fps)
+        _CAPTURE_THREADS[window_title] = capture_thread
+
+    capture_thread.start()
+    return capture_thread
+
+
+def get_capture_thread(window_title: str) -> CaptureThread | None:
+    """
+    Get the running capture thread of a window.
+
+    Args:
+        window_title: The title of the window.
+
+    Returns:
+        The capture thread or None if the window is not captured in the background.
+    """
+    capture_thread = _CAPTURE_THREADS.get(window_title)
+    if capture_thread is None or not capture_thread.is_running():
+        return None
+    return capture_thread
+
+
+def stop_capture_threads() -> None:
+    """
+    Stop capturing all windows in the background.
+    """
+    for capture_thread in _CAPTURE_THREADS.values():
+        capture_thread.stop()
+    _CAPTURE_THREADS.clear()
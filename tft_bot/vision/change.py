@@ -0,0 +1,127 @@
+"""
+Module holding the change detector, which lets detectors skip their work while their region of the screen is static.
+"""
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable
+
+import numpy
+
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+
+_MISSING = object()
+
+
+@dataclass
+class _RegionState:
+    """
+    A dataclass holding the last known signature of a region and the detector result computed for it.
+    """
+
+    signature: numpy.ndarray
+    origin: tuple[int, int]
+    unchanged_since: int
+    result: Any = _MISSING
+
+
+class ChangeDetector:
+    """
+    Keeps the grayscale pixels of every watched region and reports since which tick it did not change.
+    Regions are compared pixel by pixel at the reference window size, so a single changed glyph counts as a change.
+    """
+
+    def __init__(self, threshold: int = 24):
+        """
+        Init method to set how sensitive the detection is.
+
+        Args:
+            threshold: The absolute difference in gray levels a single pixel needs to exceed for its region to count
+              as changed. Defaults to 24.
+        """
+        self.threshold = threshold
+        self.tick = 0
+        self._states: dict[str, _RegionState] = {}
+        self._lock = threading.Lock()
+
+    def advance_tick(self) -> int:
+        """
+        Start a new tick, should be called once at the start of every main loop iteration.
+
+        Returns:
+            The new tick number.
+        """
+        self.tick += 1
+        return self.tick
+
+    def unchanged_since(self, name: str, frame: FrameSnapshot, region: BoundingBox) -> int | None:
+        """
+        Compare a region of a frame to its last signature and remember the new one.
+
+        Args:
+            name: The name the region is watched under.
+            frame: The frame to look at.
+            region: The region to compare, relative to the frame and in the reference window size.
+
+        Returns:
+            The tick since which the region did not change, or None if it changed or was never seen before.
+        """
+        # A copy, as the frame's pixels go back to the buffer pool once the frame is dropped.
+        signature = frame.crop_gray_at_reference_size(region).astype(numpy.int16)
+        # Results hold absolute screen positions, so a moved window counts as a change even if the pixels did not.
+        origin = (frame.bounding_box.min_x, frame.bounding_box.min_y)
+
+        with self._lock:
+            state = self._states.get(name)
+            if (
+                state is not None
+                and state.origin == origin
+                and state.signature.shape == signature.shape
+                and int(numpy.abs(signature - state.signature).max(initial=0)) <= self.threshold
+            ):
+                return state.unchanged_since
+
+            self._states[name] = _RegionState(signature=signature, origin=origin, unchanged_since=self.tick)
+            return None
+
+    def get_or_compute(self, name: str, frame: FrameSnapshot, region: BoundingBox, compute: Callable[[], Any]) -> Any:
+        """
+        Get the last result of a detector if its region did not change, otherwise compute it again.
+
+        Args:
+            name: The name the region is watched under, unique per detector.
+            frame: The frame the detector looks at.
+            region: The region the detector looks at, relative to the frame.
+            compute: The function running the detector.
+
+        Returns:
+            The (cached) detector result.
+        """
+        if self.unchanged_since(name=name, frame=frame, region=region) is not None:
+            result = self._states[name].result
+            if result is not _MISSING:
+                return result
+
+        result = compute()
+        with self._lock:
+            state = self._states.get(name)
+            if state is not None:
+                state.result = result
+        return result
+
+    def invalidate(self, name: str | None = None) -> None:
+        """
+        Forget signatures and results, so detectors run again on the next frame.
+
+        Args:
+            name: The name of the region to forget. Defaults to forgetting all regions.
+        """
+        with self._lock:
+            if name is None:
+                self._states.clear()
+            else:
+                self._states.pop(name, None)
+
+
+CHANGE_DETECTOR = ChangeDetector()
@@ -0,0 +1,245 @@
+"""
+Module holding the frame snapshot, a single capture of a window shared by every detector in a tick.
+"""
+
+import time
+from typing import Any
+
+import cv2
+import numpy
+
+from tft_bot.vision.buffers import BUFFER_POOL
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.scaling import get_window_scale
+
+
+class FrameSnapshot:  # pylint: disable=too-many-instance-attributes
+    """
+    A single capture of a window. The grayscale and HSV views are only converted when first used,
+    into pooled buffers that are re-used by later frames once this one is dropped.
+    """
+
+    def __init__(
+        self,
+        pixels: numpy.ndarray,
+        bounding_box: BoundingBox,
+        captured_at: float | None = None,
+        reference_size: tuple[int, int] | None = None,
+    ):
+        """
+        Init method to wrap captured pixels.
+
+        Args:
+            pixels: The captured pixels in BGRA format.
+            bounding_box: The absolute screen area the pixels were captured from.
+            captured_at: The monotonic time the pixels were captured at. Defaults to now.
+            reference_size: The (width, height) of the window that templates and regions were made for.
+              Defaults to None, which never scales them.
+        """
+        self.bounding_box = bounding_box
+        self.captured_at = time.monotonic() if captured_at is None else captured_at
+        # How templates and regions of the reference window size are scaled to this frame.
+        self.scale = get_window_scale(pixels.shape[1], pixels.shape[0], reference_size)
+        # Results of detectors that already looked at this frame, so they are computed once per frame.
+        self.cache: dict[str, Any] = {}
+        self._bgra = pixels
+        self._gray: numpy.ndarray | None = None
+        self._hsv: numpy.ndarray | None = None
+        self._downscaled_grays: dict[int, numpy.ndarray] = {}
+        self._reference_grays: dict[int, numpy.ndarray] = {}
+
+    @property
+    def bgra(self) -> numpy.ndarray:
+        """
+        The captured pixels in BGRA format.
+        """
+        return self._bgra
+
+    @property
+    def gray(self) -> numpy.ndarray:
+        """
+        The captured pixels in grayscale, converted on first access.
+        """
+        if self._gray is None:
+            self._gray = cv2.cvtColor(
+                self._bgra, cv2.COLOR_BGR2GRAY, dst=BUFFER_POOL.acquire(self._bgra.shape[:2], owner=self)
+            )
+        return self._gray
+
+    @property
+    def hsv(self) -> numpy.ndarray:
+        """
+        The captured pixels in HSV, converted on first access.
+        """
+        if self._hsv is None:
+            self._hsv = cv2.cvtColor(
+                self._bgra, cv2.COLOR_BGR2HSV, dst=BUFFER_POOL.acquire((*self._bgra.shape[:2], 3), owner=self)
+            )
+        return self._hsv
+
+    def get_downscaled_gray(self, levels: int) -> numpy.ndarray:
+        """
+        Get the grayscale pixels halved in size a number of times, cached after the first call.
+
+        Args:
+            levels: How often to halve the size, 0 returns the grayscale pixels themselves.
+
+        Returns:
+            The downscaled grayscale pixels.
+        """
+        if levels == 0:
+            return self.gray
+
+        downscaled_gray = self._downscaled_grays.get(levels)
+        if downscaled_gray is None:
+            source_gray = self.get_downscaled_gray(levels - 1)
+            height, width = source_gray.shape
+            downscaled_gray = cv2.pyrDown(
+                source_gray, dst=BUFFER_POOL.acquire(((height + 1) // 2, (width + 1) // 2), owner=self)
+            )
+            self._downscaled_grays[levels] = downscaled_gray
+        return downscaled_gray
+
+    def get_age(self) -> float:
+        """
+        Get the time passed since the capture.
+
+        Returns:
+            The age of the frame in seconds.
+        """
+        return time.monotonic() - self.captured_at
+
+    def clamp_region(self, region: BoundingBox) -> BoundingBox:
+        """
+        Clamp a region, relative to the frame's top left corner, to the size of the frame.
+
+        Args:
+            region: The relative region to clamp.
+
+        Returns:
+            A new bounding box that lies fully within the frame.
+        """
+        height, width = self._bgra.shape[:2]
+        return _clamp(region=region, width=width, height=height)
+
+    def get_reference_region(self) -> BoundingBox:
+        """
+        Get the whole frame as a region of the reference window size.
+
+        Returns:
+            A new bounding box starting at 0, 0 with the size the frame has in the reference window size.
+        """
+        height, width = self._bgra.shape[:2]
+        if self.scale.is_identity():
+            return BoundingBox(0, 0, width, height)
+        return BoundingBox(0, 0, round(width / self.scale.factor_x), round(height / self.scale.factor_y))
+
+    def clamp_reference_region(self, region: BoundingBox) -> BoundingBox:
+        """
+        Clamp a region of the reference window size to the size of the frame in the reference window size.
+
+        Args:
+            region: The relative region in the reference window size to clamp.
+
+        Returns:
+            A new bounding box that lies fully within the frame.
+        """
+        reference_region = self.get_reference_region()
+        return _clamp(region=region, width=reference_region.max_x, height=reference_region.max_y)
+
+    def get_reference_gray(self, levels: int = 0) -> numpy.ndarray:
+        """
+        Get the grayscale pixels resized to the reference window size and then halved in size a number of times,
+        cached after the first call. Frames with the reference size return their own grayscale pixels.
+
+        Args:
+            levels: How often to halve the size, 0 returns the pixels at the reference window size.
+
+        Returns:
+            The grayscale pixels at the reference window size.
+        """
+        if self.scale.is_identity():
+            return self.get_downscaled_gray(levels)
+
+        reference_gray = self._reference_grays.get(levels)
+        if reference_gray is None:
+            if levels == 0:
+                reference_region = self.get_reference_region()
+                shape = (reference_region.get_height(), reference_region.get_width())
+                interpolation = cv2.INTER_AREA if shape[0] < self._bgra.shape[0] else cv2.INTER_LINEAR
+                reference_gray = cv2.resize(
+                    self.gray, shape[::-1], dst=BUFFER_POOL.acquire(shape, owner=self), interpolation=interpolation
+                )
+            else:
+                source_gray = self.get_reference_gray(levels - 1)
+                height, width = source_gray.shape
+                reference_gray = cv2.pyrDown(
+                    source_gray, dst=BUFFER_POOL.acquire(((height + 1) // 2, (width + 1) // 2), owner=self)
+                )
+            self._reference_grays[levels] = reference_gray
+        return reference_gray
+
+    def crop_gray(self, region: BoundingBox, levels: int = 0) -> numpy.ndarray:
+        """
+        Get a view of the grayscale pixels in a region, relative to the frame's top left corner.
+
+        Args:
+            region: The relative region to crop to, should be clamped with clamp_region first.
+            levels: How often the grayscale pixels are halved in size, the region is scaled along. Defaults to 0.
+
+        Returns:
+            A view into the (downscaled) grayscale pixels.
+        """
+        scale = 2**levels
+        min_x, min_y, max_x, max_y = (coordinate // scale for coordinate in region.to_tuple())
+        return self.get_downscaled_gray(levels)[min_y:max_y, min_x:max_x]
+
+    def crop_reference_gray(self, region: BoundingBox, levels: int = 0) -> numpy.ndarray:
+        """
+        Get a view of the grayscale pixels at the reference window size in a region, see get_reference_gray.
+
+        Args:
+            region: The relative region in the reference window size, should be clamped with clamp_reference_region.
+            levels: How often the grayscale pixels are halved in size, the region is scaled along. Defaults to 0.
+
+        Returns:
+            A view into the (downscaled) grayscale pixels at the reference window size.
+        """
+        scale = 2**levels
+        min_x, min_y, max_x, max_y = (coordinate // scale for coordinate in region.to_tuple())
+        return self.get_reference_gray(levels)[min_y:max_y, min_x:max_x]
+
+    def crop_gray_at_reference_size(self, region: BoundingBox) -> numpy.ndarray:
+        """
+        Get the grayscale pixels of a region of the reference window size, at the reference size,
+        so readers tuned to the reference window size work on any window size.
+
+        Args:
+            region: The region in the reference window size, relative to the frame's top left corner.
+
+        Returns:
+            A view into the grayscale pixels at the reference window size.
+        """
+        return self.crop_reference_gray(self.clamp_reference_region(region))
+
+
+def _clamp(region: BoundingBox, width: int, height: int) -> BoundingBox:
+    """
+    Clamp a region to an area starting at 0, 0.
+
+    Args:
+        region: The region to clamp.
+        width: The width of the area.
+        height: The height of the area.
+
+    Returns:
+        A new bounding box that lies fully within the area.
+    """
+    min_x = min(max(region.min_x, 0), width)
+    min_y = min(max(region.min_y, 0), height)
+    return BoundingBox(
+        min_x=min_x,
+        min_y=min_y,
+        max_x=min(max(region.max_x, min_x), width),
+        max_y=min(max(region.max_y, min_y), height),
+    )
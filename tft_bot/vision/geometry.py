@@ -0,0 +1,65 @@
+"""
+Module holding the geometry dataclasses shared by the vision and helper modules.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class BoundingBox:
+    """
+    A dataclass holding information about a bounding box, a rectangle of two coordinate sets.
+    """
+
+    min_x: int
+    min_y: int
+    max_x: int
+    max_y: int
+
+    def to_tuple(self) -> tuple[int, int, int, int]:
+        """
+        Converts the bounding box to a tuple.
+
+        Returns:
+            A tuple, ordered min_x, min_y, max_x, max_y.
+
+        """
+        return self.min_x, self.min_y, self.max_x, self.max_y
+
+    def get_width(self) -> int:
+        """
+        Get the width of the bounding box.
+
+        Returns:
+            The width as an integer.
+        """
+        return self.max_x - self.min_x
+
+    def get_height(self) -> int:
+        """
+        Get the height of the bounding box.
+
+        Returns:
+            The height as an integer.
+        """
+        return self.max_y - self.min_y
+
+
+@dataclass
+class Coordinates:
+    """
+    A dataclass holding information about offset pixels to click to.
+    """
+
+    position_x: int
+    position_y: int
+
+
+@dataclass
+class ImageSearchResult(Coordinates):
+    """
+    A dataclass holding information about an image search result.
+    """
+
+    width: int
+    height: int
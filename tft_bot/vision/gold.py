@@ -0,0 +1,270 @@
+"""
+Module holding the gold reader, which reads the gold display digit by digit from a single crop.
+
+The glyphs of the digits come from captures/gold, which only holds captures for 0 to 6.
+A glyph of 7, 8 or 9 never matches one of those: two different digits of the game font correlate far below
+GLYPH_PRECISION, so the read returns None instead of a wrong value. Every value holding one of those digits
+is at least 7, so callers treat None as more gold than they check for, see screen_helpers.gold_at_least.
+"""
+
+from dataclasses import dataclass
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.constants import gold_region
+from tft_bot.vision.change import CHANGE_DETECTOR
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.scaling import WindowScale
+from tft_bot.vision.templates import TemplateBank
+from tft_bot.vision.templates import TEMPLATES
+
+# The region of the 1920 x 1080 game window that holds the gold coin and the gold value next to it.
+GOLD_REGION = BoundingBox(*gold_region)
+# Pixels brighter than this are part of the coin or a digit, the background is much darker.
+GLYPH_THRESHOLD = 120
+# Every glyph is resized to this (width, height) before comparing, so comparisons are one dot product.
+GLYPH_SIZE = (10, 16)
+# The minimum correlation a glyph needs with a known digit to be recognized as it.
+# Different digits correlate at most ~0.7 with each other, also in scaled windows,
+# so a digit without a capture is never recognized.
+GLYPH_PRECISION = 0.8
+# The maximum horizontal gap between two digits of the same value, in the reference window size.
+MAXIMUM_DIGIT_GAP = 8
+# Sub-pixel offsets the captures are shifted by before scaling them to a smaller window, in both directions.
+# A scaled glyph looks different depending on where it lands between two pixels, so every offset is kept.
+GLYPH_PHASES = (0.0, 0.25, 0.5, 0.75)
+
+
+@dataclass
+class _GlyphBank:
+    """
+    A dataclass holding the coin and digit glyphs extracted from captures/gold, at the scale of one window size.
+    Every glyph has one row per sub-pixel phase it was extracted at.
+    """
+
+    coin: numpy.ndarray
+    digits: dict[int, numpy.ndarray]
+
+
+def _find_glyph_columns(binary_pixels: numpy.ndarray) -> list[tuple[int, int]]:
+    """
+    Split thresholded pixels into glyphs by looking for columns without any bright pixel.
+
+    Args:
+        binary_pixels: The thresholded pixels, non-zero where a glyph is.
+
+    Returns:
+        A list of (min_x, max_x) column ranges, max_x being exclusive.
+    """
+    bright_columns = numpy.flatnonzero(binary_pixels.any(axis=0))
+    if len(bright_columns) == 0:
+        return []
+
+    breaks = numpy.flatnonzero(numpy.diff(bright_columns) > 1)
+    starts = numpy.concatenate(([bright_columns[0]], bright_columns[breaks + 1]))
+    ends = numpy.concatenate((bright_columns[breaks], [bright_columns[-1]])) + 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def _normalize_glyph(gray_pixels: numpy.ndarray, binary_pixels: numpy.ndarray) -> numpy.ndarray | None:
+    """
+    Crop a glyph to its bright rows, resize it to GLYPH_SIZE and normalize it to zero mean and unit length.
+
+    Args:
+        gray_pixels: The grayscale pixels of the glyph's columns.
+        binary_pixels: The thresholded pixels of the glyph's columns.
+
+    Returns:
+        The normalized glyph as a flat float vector, or None if the glyph is empty or flat.
+    """
+    bright_rows = numpy.flatnonzero(binary_pixels.any(axis=1))
+    if len(bright_rows) == 0:
+        return None
+
+    min_y, max_y = bright_rows[0], bright_rows[-1] + 1
+    glyph = cv2.resize(gray_pixels[min_y:max_y], GLYPH_SIZE, interpolation=cv2.INTER_AREA).astype(numpy.float32)
+    glyph -= glyph.mean()
+    norm = numpy.linalg.norm(glyph)
+    if norm == 0:
+        return None
+    return (glyph / norm).ravel()
+
+
+def _get_scaled_captures(image: numpy.ndarray, scale: WindowScale) -> list[numpy.ndarray]:
+    """
+    Scale a capture to a window size, once for every sub-pixel phase.
+
+    Args:
+        image: The grayscale capture in the reference window size.
+        scale: The scale of the window.
+
+    Returns:
+        The capture itself if the window has the reference size, else one scaled capture per phase.
+    """
+    image = numpy.asarray(image)
+    if scale.is_identity():
+        return [image]
+
+    size = (max(scale.scale_x(image.shape[1]), 1), max(scale.scale_y(image.shape[0]), 1))
+    interpolation = cv2.INTER_AREA if size[0] < image.shape[1] else cv2.INTER_LINEAR
+    scaled_captures = []
+    for phase_x in GLYPH_PHASES:
+        for phase_y in GLYPH_PHASES:
+            shift = numpy.float32([[1, 0, phase_x], [0, 1, phase_y]])
+            shifted = cv2.warpAffine(image, shift, (image.shape[1], image.shape[0]), borderMode=cv2.BORDER_REPLICATE)
+            scaled_captures.append(cv2.resize(shifted, size, interpolation=interpolation))
+    return scaled_captures
+
+
+def _build_glyph_bank(template_bank: TemplateBank, scale: WindowScale) -> _GlyphBank | None:
+    """
+    Extract the coin and digit glyphs from the gold captures, scaled to a window size.
+    Every capture shows the coin followed by one digit.
+
+    Args:
+        template_bank: The template bank holding the gold captures.
+        scale: The scale of the window the glyphs are read from.
+
+    Returns:
+        The glyph bank, or None if no gold capture could be read.
+    """
+    coins = []
+    digits = {}
+    for digit in CONSTANTS["game"]["gold"]:
+        template = template_bank.get(f"game.gold.{digit}")
+        if template is None:
+            continue
+
+        digit_glyphs = []
+        for image in _get_scaled_captures(template.image, scale):
+            binary_pixels = image > GLYPH_THRESHOLD
+            glyph_columns = _find_glyph_columns(binary_pixels)
+            if len(glyph_columns) != 2:
+                continue
+
+            coin, digit_glyph = (
+                _normalize_glyph(image[:, min_x:max_x], binary_pixels[:, min_x:max_x]) for min_x, max_x in glyph_columns
+            )
+            if coin is not None and digit_glyph is not None:
+                coins.append(coin)
+                digit_glyphs.append(digit_glyph)
+
+        if not digit_glyphs:
+            logger.warning(f"Could not split the gold capture for {digit} into a coin and a digit, skipping it")
+            continue
+        digits[int(digit)] = numpy.stack(digit_glyphs)
+
+    if not coins:
+        return None
+
+    missing_digits = sorted(set(range(10)) - digits.keys())
+    if missing_digits:
+        logger.debug(f"No gold capture for the digits {missing_digits}, values holding them are read as None")
+    return _GlyphBank(coin=numpy.stack(coins), digits=digits)
+
+
+def _classify(glyph_bank: _GlyphBank, glyph: numpy.ndarray) -> int | None:
+    """
+    Find the known digit that correlates best with a glyph, in any of its sub-pixel phases.
+
+    Args:
+        glyph_bank: The glyph bank of the window size the glyph was read from.
+        glyph: The normalized glyph.
+
+    Returns:
+        The digit, or None if no known digit correlates well enough.
+    """
+    best_digit, best_precision = None, GLYPH_PRECISION
+    for digit, digit_glyphs in glyph_bank.digits.items():
+        precision = float((digit_glyphs @ glyph).max())
+        if precision >= best_precision:
+            best_digit, best_precision = digit, precision
+    return best_digit
+
+
+class GoldReader:  # pylint: disable=too-few-public-methods
+    """
+    Reads the gold value from a single crop of the gold display, classifying every digit against a glyph bank.
+    """
+
+    def __init__(self, template_bank: TemplateBank = TEMPLATES):
+        """
+        Init method to set where the gold captures come from. The glyph bank of a window size is built on first use.
+
+        Args:
+            template_bank: The template bank holding the gold captures. Defaults to the global template bank.
+        """
+        self._template_bank = template_bank
+        # The glyph banks of every window size read from, built once per distinct size.
+        self._glyph_banks: dict[WindowScale, _GlyphBank | None] = {}
+
+    def read(self, frame: FrameSnapshot) -> int | None:
+        """
+        Read the gold value from a frame of the game window. The value is remembered for the frame,
+        and re-used for later frames as long as the gold display does not change.
+
+        Args:
+            frame: The frame of the game window.
+
+        Returns:
+            The gold value or None if the gold display could not be read, for example for digits without a capture.
+        """
+        if "gold" not in frame.cache:
+            frame.cache["gold"] = CHANGE_DETECTOR.get_or_compute(
+                name="gold", frame=frame, region=GOLD_REGION, compute=lambda: self._read(frame)
+            )
+        return frame.cache["gold"]
+
+    def _read(self, frame: FrameSnapshot) -> int | None:
+        """
+        Read the gold value from a frame of the game window.
+
+        Args:
+            frame: The frame of the game window.
+
+        Returns:
+            The gold value or None if the gold display could not be read.
+        """
+        if frame.scale not in self._glyph_banks:
+            self._glyph_banks[frame.scale] = _build_glyph_bank(self._template_bank, frame.scale)
+        glyph_bank = self._glyph_banks[frame.scale]
+        if glyph_bank is None:
+            return None
+
+        # Glyphs are compared at the window's own size, as scaling the crop up blurs the coin apart.
+        gray_pixels = frame.crop_gray(frame.clamp_region(frame.scale.scale_region(GOLD_REGION)))
+        binary_pixels = gray_pixels > GLYPH_THRESHOLD
+        maximum_digit_gap = frame.scale.scale_x(MAXIMUM_DIGIT_GAP)
+
+        digits: list[int] = []
+        previous_max_x = None
+        for min_x, max_x in _find_glyph_columns(binary_pixels):
+            glyph = _normalize_glyph(gray_pixels[:, min_x:max_x], binary_pixels[:, min_x:max_x])
+            if glyph is None:
+                continue
+
+            if previous_max_x is None:
+                # Everything up to and including the coin is not part of the value.
+                if float((glyph_bank.coin @ glyph).max()) >= GLYPH_PRECISION:
+                    previous_max_x = max_x
+                continue
+
+            if digits and min_x - previous_max_x > maximum_digit_gap:
+                break
+
+            digit = _classify(glyph_bank, glyph)
+            if digit is None:
+                return None
+            digits.append(digit)
+            previous_max_x = max_x
+
+        if not digits:
+            return None
+        return int("".join(str(digit) for digit in digits))
+
+
+GOLD_READER = GoldReader()
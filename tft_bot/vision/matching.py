@@ -0,0 +1,297 @@
+"""
+Module holding the template matchers, matching one or many templates against a frame.
+"""
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.geometry import ImageSearchResult
+from tft_bot.vision.regions import TEMPLATE_REGIONS
+from tft_bot.vision.telemetry import MATCH_TELEMETRY
+from tft_bot.vision.templates import Template
+from tft_bot.vision.templates import TEMPLATES
+
+# The amount of best coarse candidates that are verified at full resolution.
+PYRAMID_CANDIDATES = 3
+# Downscaled templates smaller than this (in either dimension) are too blurry to find candidates with.
+PYRAMID_MINIMUM_TEMPLATE_SIZE = 6
+
+# OpenCV releases the GIL while matching, so matching templates in threads runs them in parallel.
+_MATCH_EXECUTOR = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="template-match")
+
+
+def match_template(
+    frame: FrameSnapshot, path: str, precision: float = 0.8, offsets: BoundingBox | None = None
+) -> ImageSearchResult | None:
+    """
+    Match a single template against a frame, inside the template's region if it has one.
+    A frame that does not have the reference window size is matched at the reference size,
+    against the template as the frame's window shows it, see Template.get_degraded.
+
+    Args:
+        frame: The frame to search in.
+        path: The relative or absolute path to the image to be found.
+        precision: The precision to be used when matching the image. Defaults to 0.8.
+        offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+          Defaults to None, which searches the template's region in constants.template_regions.
+
+    Returns:
+        The position of the image and it's width and height or None if it wasn't found
+    """
+    template = TEMPLATES.get_by_path(path)
+    if template is None:
+        return None
+    template = template.get_degraded(frame.scale)
+
+    if offsets:
+        search_region = frame.get_reference_region()
+        search_region.min_x += offsets.min_x
+        search_region.min_y += offsets.min_y
+        search_region.max_x += offsets.max_x
+        search_region.max_y += offsets.max_y
+        return _match_in_region(frame=frame, template=template, search_region=search_region, precision=precision)
+
+    template_region = TEMPLATE_REGIONS.get_region(path)
+    if template_region is None:
+        return _match_in_region(frame=frame, template=template, search_region=None, precision=precision)
+
+    search_result = _match_in_region(frame=frame, template=template, search_region=template_region, precision=precision)
+    if search_result:
+        TEMPLATE_REGIONS.record_hit(path)
+        return search_result
+
+    if TEMPLATE_REGIONS.record_miss(path):
+        search_result = _match_in_region(frame=frame, template=template, search_region=None, precision=precision)
+        if search_result:
+            logger.debug(f"{path} was found outside of its region at {search_result}, the region should be widened")
+    return search_result
+
+
+def match_in_region(
+    frame: FrameSnapshot, path: str, search_region: BoundingBox, precision: float = 0.8
+) -> ImageSearchResult | None:
+    """
+    Match a single template against an explicit region of a frame, ignoring the template's own region.
+
+    Args:
+        frame: The frame to search in.
+        path: The relative or absolute path to the image to be found.
+        search_region: The region to search in, relative to the frame and in the reference window size.
+        precision: The precision to be used when matching the image. Defaults to 0.8.
+
+    Returns:
+        The position of the image and it's width and height or None if it wasn't found
+    """
+    template = TEMPLATES.get_by_path(path)
+    if template is None:
+        return None
+
+    return _match_in_region(
+        frame=frame,
+        template=template.get_degraded(frame.scale),
+        search_region=search_region,
+        precision=precision,
+    )
+
+
+def _match_in_region(
+    frame: FrameSnapshot, template: Template, search_region: BoundingBox | None, precision: float
+) -> ImageSearchResult | None:
+    """
+    Match a template against a region of a frame, at the reference window size.
+    Every match is recorded in the match telemetry.
+
+    Args:
+        frame: The frame to search in.
+        template: The template to search for, already degraded to the frame's scale.
+        search_region: The region to search in, relative to the frame and in the reference window size.
+          None searches the whole frame.
+        precision: The precision to be used when matching the image.
+
+    Returns:
+        The position of the image in the frame's window and it's width and height or None if it wasn't found
+    """
+    started_at = time.perf_counter()
+    if search_region is None:
+        search_region = frame.get_reference_region()
+    search_region = frame.clamp_reference_region(search_region)
+
+    if search_region.get_width() < template.get_width() or search_region.get_height() < template.get_height():
+        return None
+
+    pyramid_levels = template.pyramid_levels
+    downscaled_template = template.get_downscaled(pyramid_levels)
+    if pyramid_levels and min(downscaled_template.shape) >= PYRAMID_MINIMUM_TEMPLATE_SIZE:
+        max_precision, max_location = _match_coarse_to_fine(
+            frame=frame, template=template, search_region=search_region, pyramid_levels=pyramid_levels
+        )
+    else:
+        search_result = cv2.matchTemplate(
+            frame.crop_reference_gray(search_region), template.image, cv2.TM_CCOEFF_NORMED
+        )
+        _, max_precision, _, max_location = cv2.minMaxLoc(search_result)
+
+    MATCH_TELEMETRY.record(
+        name=template.name,
+        path=template.path,
+        score=max_precision,
+        latency=(time.perf_counter() - started_at) * 1000,
+        region_area=search_region.get_width() * search_region.get_height(),
+        hit=max_precision >= precision,
+    )
+    if max_precision < precision:
+        return None
+
+    return ImageSearchResult(
+        position_x=frame.bounding_box.min_x + frame.scale.scale_x(search_region.min_x + max_location[0]),
+        position_y=frame.bounding_box.min_y + frame.scale.scale_y(search_region.min_y + max_location[1]),
+        height=frame.scale.scale_y(template.get_height()),
+        width=frame.scale.scale_x(template.get_width()),
+    )
+
+
+def _match_coarse_to_fine(
+    frame: FrameSnapshot, template: Template, search_region: BoundingBox, pyramid_levels: int
+) -> tuple[float, tuple[int, int]]:
+    """
+    Find candidates on a downscaled frame and template, then verify the best ones at full resolution.
+    The returned precision is always the full resolution one, so thresholds behave like a full search.
+
+    Args:
+        frame: The frame to search in.
+        template: The template to search for.
+        search_region: The clamped region to search in, relative to the frame and in the reference window size.
+        pyramid_levels: How often the frame and template are halved in size for the coarse search.
+
+    Returns:
+        The best full resolution precision and its location, relative to the search region.
+    """
+    gray_region = frame.crop_reference_gray(search_region)
+    best_precision, best_location = -1.0, (0, 0)
+    for candidate in _find_coarse_candidates(
+        frame=frame, template=template, search_region=search_region, pyramid_levels=pyramid_levels
+    ):
+        precision, location = _refine_candidate(
+            gray_region=gray_region, template=template, candidate=candidate, margin=2**pyramid_levels
+        )
+        if precision > best_precision:
+            best_precision, best_location = precision, location
+
+    return best_precision, best_location
+
+
+def _find_coarse_candidates(
+    frame: FrameSnapshot, template: Template, search_region: BoundingBox, pyramid_levels: int
+) -> list[tuple[int, int]]:
+    """
+    Find the best candidate locations of a template on the downscaled frame.
+
+    Args:
+        frame: The frame to search in.
+        template: The template to search for.
+        search_region: The clamped region to search in, relative to the frame and in the reference window size.
+        pyramid_levels: How often the frame and template are halved in size.
+
+    Returns:
+        Up to PYRAMID_CANDIDATES locations, scaled back to full resolution and relative to the search region.
+    """
+    scale = 2**pyramid_levels
+    downscaled_template = template.get_downscaled(pyramid_levels)
+    downscaled_region = frame.crop_reference_gray(search_region, levels=pyramid_levels)
+    if (
+        downscaled_region.shape[0] < downscaled_template.shape[0]
+        or downscaled_region.shape[1] < downscaled_template.shape[1]
+    ):
+        return []
+
+    coarse_result = cv2.matchTemplate(downscaled_region, downscaled_template, cv2.TM_CCOEFF_NORMED)
+
+    candidates = []
+    for _ in range(PYRAMID_CANDIDATES):
+        _, coarse_precision, _, (coarse_x, coarse_y) = cv2.minMaxLoc(coarse_result)
+        if not numpy.isfinite(coarse_precision) or coarse_precision <= -1.0:
+            break
+
+        # Suppress this candidate's neighbourhood, so the next candidate is a different peak.
+        cv2.rectangle(coarse_result, (coarse_x - 2, coarse_y - 2), (coarse_x + 2, coarse_y + 2), -1.0, thickness=-1)
+        candidates.append(
+            (
+                (search_region.min_x // scale + coarse_x) * scale - search_region.min_x,
+                (search_region.min_y // scale + coarse_y) * scale - search_region.min_y,
+            )
+        )
+
+    return candidates
+
+
+def _refine_candidate(
+    gray_region: numpy.ndarray, template: Template, candidate: tuple[int, int], margin: int
+) -> tuple[float, tuple[int, int]]:
+    """
+    Match a template at full resolution in a small window around a candidate location.
+
+    Args:
+        gray_region: The full resolution grayscale pixels of the search region.
+        template: The template to search for.
+        candidate: The candidate location, relative to the search region.
+        margin: The amount of pixels around the candidate to search, to account for what the downscaling smeared.
+
+    Returns:
+        The full resolution precision and its location, relative to the search region.
+    """
+    candidate_x, candidate_y = candidate
+    refine_min_x = max(candidate_x - margin, 0)
+    refine_min_y = max(candidate_y - margin, 0)
+    refine_max_x = min(candidate_x + template.get_width() + margin, gray_region.shape[1])
+    refine_max_y = min(candidate_y + template.get_height() + margin, gray_region.shape[0])
+    refine_region = gray_region[refine_min_y:refine_max_y, refine_min_x:refine_max_x]
+    if refine_region.shape[0] < template.get_height() or refine_region.shape[1] < template.get_width():
+        return -1.0, candidate
+
+    refine_result = cv2.matchTemplate(refine_region, template.image, cv2.TM_CCOEFF_NORMED)
+    _, refine_precision, _, (refine_x, refine_y) = cv2.minMaxLoc(refine_result)
+    return refine_precision, (refine_min_x + refine_x, refine_min_y + refine_y)
+
+
+def match_many(
+    frame: FrameSnapshot, paths: list[str], precision: float = 0.8, first_hit: bool = False
+) -> dict[str, ImageSearchResult]:
+    """
+    Match many templates against the same frame, fanned out over a thread pool.
+
+    Args:
+        frame: The frame to search in.
+        paths: The list of relative or absolute paths to images to be searched for, ordered by priority.
+        precision: The precision to be used when matching the images. Defaults to 0.8.
+        first_hit: Whether to stop at the first image found, in the order of paths. Defaults to False.
+
+    Returns:
+        A dictionary of path to search result for every image found, holding at most one entry with first_hit.
+    """
+    # Convert once up front, instead of every worker racing to convert the same frame.
+    frame.get_reference_gray()
+
+    futures: list[tuple[str, Future]] = [
+        (path, _MATCH_EXECUTOR.submit(match_template, frame=frame, path=path, precision=precision)) for path in paths
+    ]
+
+    search_results = {}
+    for path, future in futures:
+        if first_hit and search_results:
+            # Templates that have not started yet are skipped, running ones finish in the background.
+            future.cancel()
+            continue
+
+        search_result = future.result()
+        if search_result:
+            search_results[path] = search_result
+
+    return search_results
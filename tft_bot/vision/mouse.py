@@ -0,0 +1,105 @@
+"""
+Module holding the mouse backends, which move and click the mouse.
+"""
+
+try:
+    import pyautogui as auto
+except Exception:  # pyautogui fails with all kinds of errors on systems without a display
+    auto = None  # pylint: disable=invalid-name
+
+
+class MouseBackend:
+    """
+    Blueprint class to implement mouse input on.
+    """
+
+    def move_to(self, position_x: int, position_y: int, duration: float) -> None:
+        """
+        Move the mouse to a position on the screen.
+
+        Args:
+            position_x: The absolute x coordinate to move to.
+            position_y: The absolute y coordinate to move to.
+            duration: How long the movement takes, in seconds.
+        """
+        raise NotImplementedError
+
+    def mouse_down(self, button: str) -> None:
+        """
+        Press a mouse button.
+
+        Args:
+            button: The mouse button to press: "left", "right" or "middle".
+        """
+        raise NotImplementedError
+
+    def mouse_up(self, button: str) -> None:
+        """
+        Release a mouse button.
+
+        Args:
+            button: The mouse button to release: "left", "right" or "middle".
+        """
+        raise NotImplementedError
+
+
+class PyAutoGuiMouseBackend(MouseBackend):
+    """
+    Moves and clicks the real mouse with pyautogui.
+    """
+
+    def move_to(self, position_x: int, position_y: int, duration: float) -> None:
+        auto.moveTo(position_x, position_y, duration)
+
+    def mouse_down(self, button: str) -> None:
+        auto.mouseDown(button=button)
+
+    def mouse_up(self, button: str) -> None:
+        auto.mouseUp(button=button)
+
+
+class RecordingMouseBackend(MouseBackend):
+    """
+    Records mouse input instead of performing it, useful to replay recorded frames without touching the mouse.
+    """
+
+    def __init__(self):
+        self.actions: list[tuple[str, ...]] = []
+
+    def move_to(self, position_x: int, position_y: int, duration: float) -> None:
+        self.actions.append(("move_to", position_x, position_y))
+
+    def mouse_down(self, button: str) -> None:
+        self.actions.append(("mouse_down", button))
+
+    def mouse_up(self, button: str) -> None:
+        self.actions.append(("mouse_up", button))
+
+
+_MOUSE_BACKEND: MouseBackend = PyAutoGuiMouseBackend()
+
+
+def get_mouse_backend() -> MouseBackend:
+    """
+    Get the backend the mouse is currently moved with.
+
+    Returns:
+        The active mouse backend.
+    """
+    return _MOUSE_BACKEND
+
+
+def set_mouse_backend(backend: MouseBackend) -> MouseBackend:
+    """
+    Replace the backend the mouse is moved with, for example to replay recorded frames.
+
+    Args:
+        backend: The backend to use from now on.
+
+    Returns:
+        The previously active backend.
+    """
+    global _MOUSE_BACKEND
+    previous_backend = _MOUSE_BACKEND
+    _MOUSE_BACKEND = backend
+    return previous_backend
@@ -0,0 +1,84 @@
+"""
+Module holding the region registry, which limits template matching to where a UI element can appear.
+"""
+
+import threading
+
+from tft_bot.constants import template_regions
+from tft_bot.vision.geometry import BoundingBox
+
+
+class RegionRegistry:
+    """
+    Holds the region every template is searched in and decides when a miss should be retried in the whole window,
+    which happens after a streak of misses in the region.
+    """
+
+    def __init__(self, regions: dict[str, tuple[int, int, int, int]], miss_streak: int = 10):
+        """
+        Init method to set the regions.
+
+        Args:
+            regions: A dictionary of template path to its region, ordered min_x, min_y, max_x, max_y.
+            miss_streak: The amount of consecutive misses that trigger a search of the whole window. Defaults to 10.
+        """
+        self.miss_streak = miss_streak
+        self._regions = {path: BoundingBox(*region) for path, region in regions.items()}
+        self._misses: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_region(self, path: str) -> BoundingBox | None:
+        """
+        Get the region a template should be searched in.
+
+        Args:
+            path: The path of the template.
+
+        Returns:
+            A copy of the region, relative to the window, or None if the whole window should be searched.
+        """
+        region = self._regions.get(path)
+        if region is None:
+            return None
+        return BoundingBox(*region.to_tuple())
+
+    def set_region(self, path: str, region: tuple[int, int, int, int] | None) -> None:
+        """
+        Set the region a template should be searched in, for example the one its template pack was built with.
+
+        Args:
+            path: The path of the template.
+            region: The region, ordered min_x, min_y, max_x, max_y, or None to search the whole window.
+        """
+        with self._lock:
+            if region is None:
+                self._regions.pop(path, None)
+            else:
+                self._regions[path] = BoundingBox(*region)
+
+    def record_hit(self, path: str) -> None:
+        """
+        Record that a template was found, which resets its miss streak.
+
+        Args:
+            path: The path of the template.
+        """
+        self._misses.pop(path, None)
+
+    def record_miss(self, path: str) -> bool:
+        """
+        Record that a template was not found in its region.
+
+        Args:
+            path: The path of the template.
+
+        Returns:
+            True if the whole window should be searched now, False if not.
+        """
+        with self._lock:
+            misses = self._misses.get(path, 0) + 1
+            self._misses[path] = 0 if misses >= self.miss_streak else misses
+        return misses >= self.miss_streak
+
+
+TEMPLATE_REGIONS = RegionRegistry(regions=template_regions)
@@ -0,0 +1,136 @@
+"""
+Module holding the round tracker, which follows the major round incrementally instead of searching every marker.
+"""
+
+from loguru import logger
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.constants import round_indicator_region
+from tft_bot.vision.change import CHANGE_DETECTOR
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.matching import match_many
+
+ROUND_INDICATOR_REGION = BoundingBox(*round_indicator_region)
+# PvE markers in the round indicator, ordered by priority, with the major round they appear in.
+PVE_ROUND_MARKERS = {
+    CONSTANTS["game"]["round"]["krugs_inactive"]: 2,
+    CONSTANTS["game"]["round"]["krugs_active"]: 2,
+    CONSTANTS["game"]["round"]["wolves_inactive"]: 3,
+    CONSTANTS["game"]["round"]["wolves_active"]: 3,
+    CONSTANTS["game"]["round"]["birds_inactive"]: 4,
+    CONSTANTS["game"]["round"]["birds_active"]: 4,
+    CONSTANTS["game"]["round"]["elder_dragon_inactive"]: 5,
+    CONSTANTS["game"]["round"]["elder_dragon_active"]: 5,
+}
+# The major round displays ("N-") in the round indicator, with the major round they show.
+ROUND_DISPLAYS = {CONSTANTS["game"]["round"][f"{major_round}-"]: major_round for major_round in range(1, 7)}
+
+
+class RoundTracker:
+    """
+    Remembers the last confirmed major round and only looks for the markers of it and the next one.
+    All markers are searched again when no round is known yet, or after a streak of misses.
+    A miss returns the last confirmed round rather than 0, which only a reset brings back.
+    """
+
+    def __init__(self, miss_streak: int = 5):
+        """
+        Init method to set when to fall back to searching all markers.
+
+        Args:
+            miss_streak: The amount of consecutive misses after which all markers are searched. Defaults to 5.
+        """
+        self.miss_streak = miss_streak
+        self._major_round = 0
+        self._misses = 0
+
+    @property
+    def major_round(self) -> int:
+        """
+        The last confirmed major round, 0 if none was confirmed yet. Does not look at the screen.
+        """
+        return self._major_round
+
+    def reset(self) -> None:
+        """
+        Forget the confirmed major round, should be called whenever a new game starts.
+        """
+        self._major_round = 0
+        self._misses = 0
+        CHANGE_DETECTOR.invalidate("major_round")
+
+    def update(self, frame: FrameSnapshot) -> int:
+        """
+        Look for the major round on a frame of the game window. The result is remembered for the frame,
+        and re-used for later frames as long as the round indicator does not change.
+
+        Args:
+            frame: The frame of the game window.
+
+        Returns:
+            The major round, or the last confirmed one if no marker was found.
+        """
+        if "major_round" not in frame.cache:
+            frame.cache["major_round"] = CHANGE_DETECTOR.get_or_compute(
+                name="major_round", frame=frame, region=ROUND_INDICATOR_REGION, compute=lambda: self._update(frame)
+            )
+        return frame.cache["major_round"]
+
+    def _update(self, frame: FrameSnapshot) -> int:
+        """
+        Look for the major round on a frame of the game window.
+
+        Args:
+            frame: The frame of the game window.
+
+        Returns:
+            The major round, or the last confirmed one if no marker was found.
+        """
+        full_scan = self._major_round == 0 or self._misses >= self.miss_streak
+        if full_scan:
+            major_round = _find_major_round(frame=frame, major_rounds=None)
+        else:
+            major_round = _find_major_round(frame=frame, major_rounds={self._major_round, self._major_round + 1})
+
+        if major_round:
+            self._major_round = major_round
+            self._misses = 0
+        elif full_scan:
+            logger.debug(f"Could not determine minimum round, keeping {self._major_round}.")
+            self._misses = 0
+        else:
+            self._misses += 1
+
+        return self._major_round
+
+
+def _find_major_round(frame: FrameSnapshot, major_rounds: set[int] | None) -> int:
+    """
+    Search the markers of the given major rounds. PvE markers take priority over the round display.
+
+    Args:
+        frame: The frame of the game window.
+        major_rounds: The major rounds to look for, None to look for all of them.
+
+    Returns:
+        The major round found, 0 if none was found.
+    """
+    pve_round_markers = [
+        path for path, major_round in PVE_ROUND_MARKERS.items() if major_rounds is None or major_round in major_rounds
+    ]
+    pve_search_results = match_many(frame=frame, paths=pve_round_markers, precision=0.9, first_hit=True)
+    if pve_search_results:
+        return PVE_ROUND_MARKERS[next(iter(pve_search_results))]
+
+    round_displays = [
+        path for path, major_round in ROUND_DISPLAYS.items() if major_rounds is None or major_round in major_rounds
+    ]
+    round_search_results = match_many(frame=frame, paths=round_displays, first_hit=True)
+    if round_search_results:
+        return ROUND_DISPLAYS[next(iter(round_search_results))]
+
+    return 0
+
+
+ROUND_TRACKER = RoundTracker()
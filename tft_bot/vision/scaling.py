@@ -0,0 +1,95 @@
+"""
+Module holding the window scale, which maps coordinates of the reference window size to the actual window size.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from tft_bot.vision.geometry import BoundingBox
+
+
+@dataclass(frozen=True)
+class WindowScale:
+    """
+    A dataclass holding the factors to scale coordinates of the reference window size by.
+    """
+
+    factor_x: float = 1.0
+    factor_y: float = 1.0
+
+    def is_identity(self) -> bool:
+        """
+        Check if the window has the reference size.
+
+        Returns:
+            True if coordinates stay the same, False if they need to be scaled.
+        """
+        return self.factor_x == 1.0 and self.factor_y == 1.0
+
+    def scale_x(self, position_x: int) -> int:
+        """
+        Scale a x coordinate of the reference window size to the actual window size.
+
+        Args:
+            position_x: The x coordinate in the reference window size.
+
+        Returns:
+            The x coordinate in the actual window size.
+        """
+        return round(position_x * self.factor_x)
+
+    def scale_y(self, position_y: int) -> int:
+        """
+        Scale a y coordinate of the reference window size to the actual window size.
+
+        Args:
+            position_y: The y coordinate in the reference window size.
+
+        Returns:
+            The y coordinate in the actual window size.
+        """
+        return round(position_y * self.factor_y)
+
+    def scale_region(self, region: BoundingBox) -> BoundingBox:
+        """
+        Scale a region of the reference window size to the actual window size.
+
+        Args:
+            region: The region in the reference window size.
+
+        Returns:
+            A new bounding box in the actual window size, or the region itself if nothing needs to be scaled.
+        """
+        if self.is_identity():
+            return region
+
+        return BoundingBox(
+            min_x=self.scale_x(region.min_x),
+            min_y=self.scale_y(region.min_y),
+            max_x=self.scale_x(region.max_x),
+            max_y=self.scale_y(region.max_y),
+        )
+
+
+IDENTITY_SCALE = WindowScale()
+
+
+@lru_cache(maxsize=16)
+def get_window_scale(width: int, height: int, reference_size: tuple[int, int] | None) -> WindowScale:
+    """
+    Get the scale of a window compared to its reference size, computed once per distinct size.
+
+    Args:
+        width: The actual width of the window.
+        height: The actual height of the window.
+        reference_size: The (width, height) every capture and coordinate of the window was made for,
+          None if the window is never scaled.
+
+    Returns:
+        The scale of the window.
+    """
+    if reference_size is None or (width, height) == reference_size or not width or not height:
+        return IDENTITY_SCALE
+
+    reference_width, reference_height = reference_size
+    return WindowScale(factor_x=width / reference_width, factor_y=height / reference_height)
@@ -0,0 +1,134 @@
+"""
+Module holding the shop reader, which recognizes the traits of all shop slots from a single frame.
+"""
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.constants import shop_region
+from tft_bot.vision.change import CHANGE_DETECTOR
+from tft_bot.vision.frame import FrameSnapshot
+from tft_bot.vision.geometry import BoundingBox
+from tft_bot.vision.geometry import ImageSearchResult
+from tft_bot.vision.matching import match_in_region
+
+# The trait areas of the five shop slots in the 1920 x 1080 game window, from left to right.
+SHOP_REGION = BoundingBox(*shop_region)
+_SHOP_SLOT_WIDTH = SHOP_REGION.get_width() // 5
+# Every slot overlaps its neighbours by this many pixels. Trait icons are 20 pixels wide,
+# so an icon straddling the border of two slots lies completely inside the slot holding its center.
+SHOP_SLOT_OVERLAP = 12
+SHOP_SLOT_REGIONS = [
+    BoundingBox(
+        SHOP_REGION.min_x + slot * _SHOP_SLOT_WIDTH - SHOP_SLOT_OVERLAP,
+        SHOP_REGION.min_y,
+        SHOP_REGION.min_x + (slot + 1) * _SHOP_SLOT_WIDTH + SHOP_SLOT_OVERLAP,
+        SHOP_REGION.max_y,
+    )
+    for slot in range(5)
+]
+
+
+class ShopReader:
+    """
+    Crops the shop slots of a frame and matches trait icons only inside of them.
+    """
+
+    def __init__(self, slot_regions: list[BoundingBox] | None = None, precision: float = 0.9):
+        """
+        Init method to set where the shop slots are.
+
+        Args:
+            slot_regions: The trait areas of the shop slots, relative to the game window, overlapping their neighbours.
+              Defaults to SHOP_SLOT_REGIONS.
+            precision: The precision to be used when matching the trait icons. Defaults to 0.9.
+        """
+        self.slot_regions = slot_regions or SHOP_SLOT_REGIONS
+        self.precision = precision
+
+    def read(self, frame: FrameSnapshot, traits: list[str]) -> dict[int, dict[str, ImageSearchResult]]:
+        """
+        Find which of the given traits every shop slot has. The result is remembered for the frame,
+        and re-used for later frames as long as the shop does not change.
+
+        Args:
+            frame: The frame of the game window.
+            traits: The names of the traits to look for, as in CONSTANTS["game"]["trait"].
+
+        Returns:
+            A dictionary of slot index to the traits found in it, with where each trait icon is.
+            Slots without any of the traits are left out.
+        """
+        cache_key = f"shop:{','.join(traits)}"
+        if cache_key not in frame.cache:
+            frame.cache[cache_key] = CHANGE_DETECTOR.get_or_compute(
+                name=cache_key, frame=frame, region=SHOP_REGION, compute=lambda: self._read(frame=frame, traits=traits)
+            )
+        return frame.cache[cache_key]
+
+    def find_slot(
+        self, shop: dict[int, dict[str, ImageSearchResult]], trait: str, excluded_slots: set[int]
+    ) -> int | None:
+        """
+        Find the left-most slot of a shop read that has a trait.
+
+        Args:
+            shop: The shop, as returned by read.
+            trait: The name of the trait.
+            excluded_slots: Slots to skip, for example because they were bought already.
+
+        Returns:
+            The slot index, or None if no slot has the trait.
+        """
+        for slot in sorted(shop):
+            if slot not in excluded_slots and trait in shop[slot]:
+                return slot
+        return None
+
+    def _get_slot(self, frame: FrameSnapshot, search_result: ImageSearchResult) -> int:
+        """
+        Get the slot a trait icon belongs to, which is the one with the center closest to the icon's center.
+        An icon in the overlap of two slots is found in both, but only belongs to one of them.
+
+        Args:
+            frame: The frame the icon was found in.
+            search_result: Where the icon is.
+
+        Returns:
+            The slot index.
+        """
+        center_x = search_result.position_x + search_result.width // 2
+        slot_centers_x = [
+            frame.bounding_box.min_x + frame.scale.scale_x((slot_region.min_x + slot_region.max_x) // 2)
+            for slot_region in self.slot_regions
+        ]
+        return min(range(len(slot_centers_x)), key=lambda slot: abs(slot_centers_x[slot] - center_x))
+
+    def _read(self, frame: FrameSnapshot, traits: list[str]) -> dict[int, dict[str, ImageSearchResult]]:
+        """
+        Find which of the given traits every shop slot has.
+
+        Args:
+            frame: The frame of the game window.
+            traits: The names of the traits to look for.
+
+        Returns:
+            A dictionary of slot index to the traits found in it.
+        """
+        shop = {}
+        for slot_region in self.slot_regions:
+            for trait in traits:
+                trait_path = CONSTANTS["game"]["trait"].get(trait)
+                if trait_path is None:
+                    continue
+
+                search_result = match_in_region(
+                    frame=frame, path=trait_path, search_region=slot_region, precision=self.precision
+                )
+                if search_result:
+                    shop.setdefault(self._get_slot(frame=frame, search_result=search_result), {}).setdefault(
+                        trait, search_result
+                    )
+
+        return shop
+
+
+SHOP_READER = ShopReader()
@@ -0,0 +1,175 @@
+"""
+Module holding the match telemetry, which records how every template matches into fixed-size histograms.
+"""
+
+import json
+import os
+import threading
+import time
+
+from loguru import logger
+import numpy
+
+# Match scores of TM_CCOEFF_NORMED lie between -1 and 1, the interesting part is between 0.5 and 1.
+SCORE_BIN_EDGES = numpy.concatenate(([-1.0, 0.0], numpy.linspace(0.5, 1.0, 11)))
+# Latencies in milliseconds, roughly doubling per bin.
+LATENCY_BIN_EDGES = numpy.array([0.0, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, numpy.inf])
+
+
+class TemplateTelemetry:
+    """
+    Keeps the match statistics of a single template in histograms, so memory stays the same however long it runs.
+    """
+
+    def __init__(self, path: str):
+        """
+        Init method to start with empty statistics.
+
+        Args:
+            path: The path of the template.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.lowest_hit_score: float | None = None
+        self.highest_miss_score: float | None = None
+        self.totals = {"latency": 0.0, "region_area": 0}
+        self.histograms = {
+            "score": numpy.zeros(len(SCORE_BIN_EDGES) - 1, dtype=numpy.int64),
+            "latency": numpy.zeros(len(LATENCY_BIN_EDGES) - 1, dtype=numpy.int64),
+        }
+
+    def record(self, score: float, latency: float, region_area: int, hit: bool) -> None:
+        """
+        Record a single match.
+
+        Args:
+            score: The best match score.
+            latency: The time the match took, in milliseconds.
+            region_area: The amount of pixels searched.
+            hit: Whether the score reached the precision the match was made with.
+        """
+        if hit:
+            self.hits += 1
+            self.lowest_hit_score = score if self.lowest_hit_score is None else min(self.lowest_hit_score, score)
+        else:
+            self.misses += 1
+            self.highest_miss_score = score if self.highest_miss_score is None else max(self.highest_miss_score, score)
+
+        self.totals["latency"] += latency
+        self.totals["region_area"] += region_area
+        score_bin = numpy.searchsorted(SCORE_BIN_EDGES, score, side="right") - 1
+        self.histograms["score"][min(max(score_bin, 0), len(SCORE_BIN_EDGES) - 2)] += 1
+        latency_bin = numpy.searchsorted(LATENCY_BIN_EDGES, latency, side="right") - 1
+        self.histograms["latency"][min(latency_bin, len(LATENCY_BIN_EDGES) - 2)] += 1
+
+    def to_dict(self) -> dict:
+        """
+        Summarize the statistics.
+
+        Returns:
+            A JSON serializable dictionary of the statistics.
+        """
+        matches = max(self.hits + self.misses, 1)
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "lowest_hit_score": self.lowest_hit_score,
+            "highest_miss_score": self.highest_miss_score,
+            "mean_latency_ms": round(self.totals["latency"] / matches, 3),
+            "total_latency_ms": round(self.totals["latency"], 3),
+            "mean_region_area": round(self.totals["region_area"] / matches),
+            "score_histogram": {
+                "bin_edges": SCORE_BIN_EDGES.round(3).tolist(),
+                "counts": self.histograms["score"].tolist(),
+            },
+            "latency_histogram_ms": {
+                "bin_edges": LATENCY_BIN_EDGES[:-1].tolist(),
+                "counts": self.histograms["latency"].tolist(),
+            },
+        }
+
+
+class MatchTelemetry:
+    """
+    Records the match statistics of every template and periodically writes them to a JSON file.
+    """
+
+    def __init__(self, dump_interval: float = 300.0):
+        """
+        Init method to set how often the statistics are written.
+
+        Args:
+            dump_interval: The minimum time in seconds between two writes. Defaults to 300.0.
+        """
+        self.dump_interval = dump_interval
+        self.output_path: str | None = None
+        self._templates: dict[str, TemplateTelemetry] = {}
+        self._dumped_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(  # pylint: disable=too-many-arguments
+        self, name: str, path: str, score: float, latency: float, region_area: int, hit: bool
+    ) -> None:
+        """
+        Record a single match of a template.
+
+        Args:
+            name: The logical name of the template.
+            path: The path of the template.
+            score: The best match score.
+            latency: The time the match took, in milliseconds.
+            region_area: The amount of pixels searched.
+            hit: Whether the score reached the precision the match was made with.
+        """
+        with self._lock:
+            template_telemetry = self._templates.get(name)
+            if template_telemetry is None:
+                template_telemetry = TemplateTelemetry(path=path)
+                self._templates[name] = template_telemetry
+            template_telemetry.record(score=score, latency=latency, region_area=region_area, hit=hit)
+
+    def get_statistics(self) -> dict[str, dict]:
+        """
+        Summarize the statistics of every template.
+
+        Returns:
+            A dictionary of logical template name to its statistics, most time consuming first.
+        """
+        with self._lock:
+            statistics = {name: template_telemetry.to_dict() for name, template_telemetry in self._templates.items()}
+        return dict(sorted(statistics.items(), key=lambda item: item[1]["total_latency_ms"], reverse=True))
+
+    def dump(self) -> None:
+        """
+        Write the statistics to the output path, if one is set.
+        """
+        self._dumped_at = time.monotonic()
+        if not self.output_path:
+            return
+
+        try:
+            with open(self.output_path, mode="w", encoding="UTF-8") as output_file:
+                json.dump(self.get_statistics(), output_file, indent=2)
+        except OSError as exc:
+            logger.opt(exception=exc).debug(f"Could not write the match telemetry to {self.output_path}")
+
+    def dump_if_due(self) -> None:
+        """
+        Write the statistics if the dump interval passed since the last write.
+        """
+        if time.monotonic() - self._dumped_at >= self.dump_interval:
+            self.dump()
+
+    def set_storage_path(self, storage_path: str) -> None:
+        """
+        Set the directory the statistics are written to.
+
+        Args:
+            storage_path: The base storage path where all of our files should go.
+        """
+        self.output_path = os.path.join(storage_path, "match_telemetry.json")
+
+
+MATCH_TELEMETRY = MatchTelemetry()
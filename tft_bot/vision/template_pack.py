@@ -0,0 +1,123 @@
+"""
+Module holding the template pack, which bundles every template into one file that is memory mapped at start-up.
+"""
+
+from dataclasses import dataclass
+import json
+import os
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import template_pyramid_levels
+from tft_bot.constants import template_regions
+
+TEMPLATE_PACK_PATH = "captures/template_pack.npy"
+TEMPLATE_PACK_INDEX_PATH = "captures/template_pack.json"
+TEMPLATE_PACK_VERSION = 2
+
+
+@dataclass
+class PackedTemplate:
+    """
+    A dataclass holding a template read from the template pack.
+    """
+
+    path: str
+    image: numpy.ndarray
+    modified_at: float
+    mean: float
+    standard_deviation: float
+    region: tuple[int, int, int, int] | None
+    pyramid_levels: int
+
+
+def build_template_pack(
+    sources: dict[str, str], pack_path: str = TEMPLATE_PACK_PATH, index_path: str = TEMPLATE_PACK_INDEX_PATH
+) -> int:
+    """
+    Decode every template and write them into one uncompressed array, with a JSON index describing them.
+
+    Args:
+        sources: A dictionary of logical name to path of the templates to pack.
+        pack_path: The path to write the array to. Defaults to TEMPLATE_PACK_PATH.
+        index_path: The path to write the index to. Defaults to TEMPLATE_PACK_INDEX_PATH.
+
+    Returns:
+        The amount of templates packed.
+    """
+    images = []
+    entries = {}
+    offset = 0
+    for name, path in sources.items():
+        image = cv2.imread(path, 0) if os.path.isfile(path) else None
+        if image is None:
+            logger.warning(f"The image {path} does not exist on the system, it is not packed")
+            continue
+
+        images.append(image.ravel())
+        entries[name] = {
+            "path": path,
+            "offset": offset,
+            "shape": list(image.shape),
+            "modified_at": os.stat(path).st_mtime,
+            "mean": round(float(image.mean()), 3),
+            "standard_deviation": round(float(image.std()), 3),
+            "region": list(template_regions[path]) if path in template_regions else None,
+            "pyramid_levels": template_pyramid_levels.get(path, 0),
+        }
+        offset += image.size
+
+    numpy.save(pack_path, numpy.concatenate(images) if images else numpy.empty(0, dtype=numpy.uint8))
+    with open(index_path, mode="w", encoding="UTF-8") as index_file:
+        json.dump({"version": TEMPLATE_PACK_VERSION, "templates": entries}, index_file, indent=2)
+
+    logger.info(f"Packed {len(entries)} templates into {pack_path}")
+    return len(entries)
+
+
+def load_template_pack(
+    pack_path: str = TEMPLATE_PACK_PATH, index_path: str = TEMPLATE_PACK_INDEX_PATH
+) -> dict[str, PackedTemplate]:
+    """
+    Memory map the template pack, so no template has to be decoded and only the pages of matched templates are read.
+    Processes running from the same pack share those pages, but not the processes of a onefile build,
+    as each of them extracts its own copy of the pack.
+
+    Args:
+        pack_path: The path of the packed array. Defaults to TEMPLATE_PACK_PATH.
+        index_path: The path of the index. Defaults to TEMPLATE_PACK_INDEX_PATH.
+
+    Returns:
+        A dictionary of logical name to packed template, empty if there is no (usable) template pack.
+    """
+    if not os.path.isfile(pack_path) or not os.path.isfile(index_path):
+        return {}
+
+    try:
+        with open(index_path, mode="r", encoding="UTF-8") as index_file:
+            index = json.load(index_file)
+        pack = numpy.load(pack_path, mmap_mode="r")
+    except (OSError, ValueError) as exc:
+        logger.opt(exception=exc).warning(f"The template pack {pack_path} could not be read, decoding images instead")
+        return {}
+
+    if index.get("version") != TEMPLATE_PACK_VERSION:
+        logger.warning(f"The template pack {pack_path} is outdated, decoding images instead")
+        return {}
+
+    packed_templates = {}
+    for name, entry in index["templates"].items():
+        start = entry["offset"]
+        end = start + int(numpy.prod(entry["shape"]))
+        packed_templates[name] = PackedTemplate(
+            path=entry["path"],
+            image=pack[start:end].reshape(entry["shape"]),
+            modified_at=entry["modified_at"],
+            mean=entry["mean"],
+            standard_deviation=entry["standard_deviation"],
+            region=tuple(entry["region"]) if entry["region"] else None,
+            pyramid_levels=entry["pyramid_levels"],
+        )
+    return packed_templates
@@ -0,0 +1,279 @@
+"""
+Module holding the template bank, which decodes every capture once and keeps it in memory.
+If a template pack was built, templates are memory mapped from it instead of decoded.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+import os
+import threading
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.constants import template_pyramid_levels
+from tft_bot.vision.regions import RegionRegistry
+from tft_bot.vision.regions import TEMPLATE_REGIONS
+from tft_bot.vision.scaling import WindowScale
+from tft_bot.vision.template_pack import load_template_pack
+
+# Templates with a lower standard deviation of their gray levels have no shape to match.
+FLAT_STANDARD_DEVIATION = 1.0
+
+
+@dataclass
+class Template:
+    """
+    A dataclass holding a decoded, grayscale template and where it was loaded from.
+    """
+
+    name: str
+    path: str
+    image: numpy.ndarray
+    modified_at: float
+    pyramid_levels: int = 0
+    _downscaled_images: dict[int, numpy.ndarray] = field(default_factory=dict, repr=False)
+    _degraded_templates: dict[WindowScale, "Template"] = field(default_factory=dict, repr=False)
+
+    def get_width(self) -> int:
+        """
+        Get the width of the template.
+
+        Returns:
+            The width as an integer.
+        """
+        return self.image.shape[1]
+
+    def get_height(self) -> int:
+        """
+        Get the height of the template.
+
+        Returns:
+            The height as an integer.
+        """
+        return self.image.shape[0]
+
+    def get_downscaled(self, levels: int) -> numpy.ndarray:
+        """
+        Get the template halved in size a number of times, cached after the first call.
+
+        Args:
+            levels: How often to halve the size, 0 returns the template itself.
+
+        Returns:
+            The downscaled grayscale template.
+        """
+        image = self._downscaled_images.get(levels)
+        if image is None:
+            image = self.image
+            for _ in range(levels):
+                image = cv2.pyrDown(image)
+            self._downscaled_images[levels] = image
+        return image
+
+    def get_degraded(self, scale: WindowScale) -> "Template":
+        """
+        Get the template as a window of a different size shows it, at the reference window size, cached per scale.
+        The template is scaled to the window and back, so it loses the same detail as a frame of the window
+        resized to the reference window size, see FrameSnapshot.get_reference_gray.
+
+        Args:
+            scale: The scale of the window the template is matched against.
+
+        Returns:
+            The degraded template, or the template itself if the window has the reference size.
+        """
+        if scale.is_identity():
+            return self
+
+        degraded_template = self._degraded_templates.get(scale)
+        if degraded_template is None:
+            size = (self.get_width(), self.get_height())
+            scaled_size = (max(scale.scale_x(size[0]), 1), max(scale.scale_y(size[1]), 1))
+            shrinks = scaled_size[0] < size[0]
+            scaled_image = cv2.resize(
+                numpy.asarray(self.image), scaled_size, interpolation=cv2.INTER_AREA if shrinks else cv2.INTER_LINEAR
+            )
+            degraded_template = Template(
+                name=self.name,
+                path=self.path,
+                image=cv2.resize(scaled_image, size, interpolation=cv2.INTER_LINEAR if shrinks else cv2.INTER_AREA),
+                modified_at=self.modified_at,
+                pyramid_levels=self.pyramid_levels,
+            )
+            self._degraded_templates[scale] = degraded_template
+        return degraded_template
+
+
+def _flatten_paths(paths: dict | str, prefix: str) -> dict[str, str]:
+    """
+    Flatten a nested dictionary of image paths into logical names, for example "game.gold.3".
+
+    Args:
+        paths: The (nested) dictionary or a single path.
+        prefix: The logical name of the current nesting level.
+
+    Returns:
+        A dictionary of logical name to path.
+    """
+    if isinstance(paths, str):
+        return {prefix: paths}
+
+    flattened_paths = {}
+    for key, value in paths.items():
+        flattened_paths.update(_flatten_paths(value, f"{prefix}.{key}"))
+
+    return flattened_paths
+
+
+class TemplateBank:
+    """
+    Keeps every template decoded as a grayscale numpy array, keyed by its logical name.
+    A template is decoded again if its file is newer than the loaded one, which also covers images
+    that changed after the template pack was built.
+    """
+
+    def __init__(self, sources: dict[str, str]):
+        """
+        Init method to register the templates the bank knows about.
+
+        Args:
+            sources: A dictionary of logical name to path.
+        """
+        self._sources = dict(sources)
+        self._names_by_path = {path: name for name, path in self._sources.items()}
+        self._templates: dict[str, Template] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_constants(cls) -> "TemplateBank":
+        """
+        Create a template bank holding every game and client capture in CONSTANTS.
+
+        Returns:
+            A new, not yet loaded, template bank.
+        """
+        sources = _flatten_paths(CONSTANTS["game"], "game")
+        sources.update(_flatten_paths(CONSTANTS["client"], "client"))
+        return cls(sources)
+
+    def load(self, region_registry: RegionRegistry = TEMPLATE_REGIONS) -> None:
+        """
+        Load every registered template from the template pack, or decode it if it is not packed.
+        The regions the pack was built with are handed to the region registry.
+        Should be called once at start-up.
+
+        Args:
+            region_registry: The region registry to update with the packed regions. Defaults to TEMPLATE_REGIONS.
+        """
+        packed_templates = load_template_pack()
+        with self._lock:
+            for name, packed_template in packed_templates.items():
+                if self._sources.get(name) != packed_template.path:
+                    continue
+
+                if packed_template.standard_deviation < FLAT_STANDARD_DEVIATION:
+                    logger.warning(
+                        f"The image {packed_template.path} is a flat gray of {packed_template.mean}, "
+                        "it matches any area of that gray"
+                    )
+                self._templates[name] = Template(
+                    name=name,
+                    path=packed_template.path,
+                    image=packed_template.image,
+                    modified_at=packed_template.modified_at,
+                    pyramid_levels=packed_template.pyramid_levels,
+                )
+                region_registry.set_region(path=packed_template.path, region=packed_template.region)
+
+        for name in self._sources:
+            self.get(name)
+
+        logger.debug(f"Loaded {len(self._templates)} of {len(self._sources)} templates into memory")
+
+    def get_sources(self) -> dict[str, str]:
+        """
+        Get every registered template.
+
+        Returns:
+            A dictionary of logical name to path.
+        """
+        return dict(self._sources)
+
+    def get(self, name: str) -> Template | None:
+        """
+        Get a template by its logical name, decoding it if it is not loaded or its file changed.
+
+        Args:
+            name: The logical name of the template, for example "game.gold.3".
+
+        Returns:
+            The template or None if the name is unknown or the file could not be read.
+        """
+        path = self._sources.get(name)
+        if path is None:
+            return None
+
+        try:
+            modified_at = os.stat(path).st_mtime
+        except OSError:
+            modified_at = None
+
+        template = self._templates.get(name)
+        # Packed templates are kept if their file is missing, for example in a build that only ships the pack.
+        if template is not None and (modified_at is None or modified_at <= template.modified_at):
+            return template
+
+        with self._lock:
+            return self._load(name=name, path=path, modified_at=modified_at)
+
+    def get_by_path(self, path: str) -> Template | None:
+        """
+        Get a template by its path. Unknown paths are registered with the path as their logical name.
+
+        Args:
+            path: The relative or absolute path to the image.
+
+        Returns:
+            The template or None if the file could not be read.
+        """
+        name = self._names_by_path.get(path)
+        if name is None:
+            name = path
+            self._sources[name] = path
+            self._names_by_path[path] = name
+
+        return self.get(name)
+
+    def _load(self, name: str, path: str, modified_at: float | None) -> Template | None:
+        """
+        Decode a template from disk and store it.
+
+        Args:
+            name: The logical name of the template.
+            path: The path to decode the template from.
+            modified_at: The modification time of the file, None if it does not exist.
+
+        Returns:
+            The template or None if the file could not be read.
+        """
+        image = cv2.imread(path, 0) if modified_at is not None else None
+        if image is None:
+            logger.warning(f"The image {path} does not exist on the system or we do not have permission to read it")
+            self._templates.pop(name, None)
+            return None
+
+        template = Template(
+            name=name,
+            path=path,
+            image=image,
+            modified_at=modified_at,
+            pyramid_levels=template_pyramid_levels.get(path, 0),
+        )
+        self._templates[name] = template
+        return template
+
+
+TEMPLATES = TemplateBank.from_constants()
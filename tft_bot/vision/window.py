@@ -0,0 +1,238 @@
+"""
+Module holding the window backends and a cache for window geometry, so handle lookups stay out of the hot path.
+"""
+
+from dataclasses import dataclass
+import threading
+import time
+
+from tft_bot.vision.geometry import BoundingBox
+
+try:
+    import win32gui
+except ImportError:
+    win32gui = None
+
+
+class WindowBackend:
+    """
+    Blueprint class to implement window lookups on.
+    """
+
+    def find_window(self, window_title: str) -> int | None:
+        """
+        Find the handle of a window.
+
+        Args:
+            window_title: The title of the window.
+
+        Returns:
+            The handle of the window or None if no window exists.
+        """
+        raise NotImplementedError
+
+    def is_window(self, window_handle: int) -> bool:
+        """
+        Check if a window handle is still valid.
+
+        Args:
+            window_handle: The handle to check.
+
+        Returns:
+            True if the handle still points to a window, False if not.
+        """
+        raise NotImplementedError
+
+    def get_window_rect(self, window_handle: int) -> BoundingBox | None:
+        """
+        Get the absolute screen area of a window.
+
+        Args:
+            window_handle: The handle of the window.
+
+        Returns:
+            The bounding box of the window or None if the handle is not valid anymore.
+        """
+        raise NotImplementedError
+
+
+class Win32WindowBackend(WindowBackend):
+    """
+    Looks up windows with the win32 API.
+    """
+
+    def find_window(self, window_title: str) -> int | None:
+        return win32gui.FindWindowEx(0, 0, 0, window_title) or None
+
+    def is_window(self, window_handle: int) -> bool:
+        return bool(win32gui.IsWindow(window_handle))
+
+    def get_window_rect(self, window_handle: int) -> BoundingBox | None:
+        try:
+            return BoundingBox(*win32gui.GetWindowRect(window_handle))
+        except win32gui.error:
+            return None
+
+
+class StaticWindowBackend(WindowBackend):
+    """
+    Reports fixed windows, useful to replay recorded frames on systems without the win32 API.
+    """
+
+    def __init__(self, windows: dict[str, BoundingBox]):
+        """
+        Init method to set the windows that exist.
+
+        Args:
+            windows: A dictionary of window title to its absolute screen area.
+        """
+        self._window_titles = list(windows)
+        self._windows = dict(windows)
+
+    def set_window(self, window_title: str, bounding_box: BoundingBox | None) -> None:
+        """
+        Add, move or remove a window.
+
+        Args:
+            window_title: The title of the window.
+            bounding_box: The new absolute screen area of the window, None to remove it.
+        """
+        if bounding_box is None:
+            self._windows.pop(window_title, None)
+            return
+
+        if window_title not in self._window_titles:
+            self._window_titles.append(window_title)
+        self._windows[window_title] = bounding_box
+
+    def find_window(self, window_title: str) -> int | None:
+        if window_title not in self._windows:
+            return None
+        return self._window_titles.index(window_title) + 1
+
+    def is_window(self, window_handle: int) -> bool:
+        return 0 < window_handle <= len(self._window_titles) and self._window_titles[window_handle - 1] in self._windows
+
+    def get_window_rect(self, window_handle: int) -> BoundingBox | None:
+        if not self.is_window(window_handle):
+            return None
+        bounding_box = self._windows[self._window_titles[window_handle - 1]]
+        return BoundingBox(*bounding_box.to_tuple())
+
+
+@dataclass
+class _WindowGeometry:
+    """
+    A dataclass holding a cached window lookup.
+    """
+
+    window_handle: int
+    bounding_box: BoundingBox
+    fetched_at: float
+
+
+class WindowGeometryCache:
+    """
+    Caches window handles and bounding boxes by window title.
+    An entry is refreshed after a short time to live, when its handle is not valid anymore, or when invalidated.
+    """
+
+    def __init__(self, backend: WindowBackend, time_to_live: float = 1.0):
+        """
+        Init method to set the backend windows are looked up with.
+
+        Args:
+            backend: The backend to look up windows with.
+            time_to_live: The time in seconds a bounding box is re-used for. Defaults to 1.0.
+        """
+        self.backend = backend
+        self.time_to_live = time_to_live
+        self._geometries: dict[str, _WindowGeometry] = {}
+        self._lock = threading.Lock()
+
+    def get_bounding_box(self, window_title: str) -> BoundingBox | None:
+        """
+        Get the bounding box of a window, from the cache if it is recent enough.
+
+        Args:
+            window_title: The title of the window.
+
+        Returns:
+            A copy of the bounding box, or None if no window exists.
+        """
+        with self._lock:
+            geometry = self._geometries.get(window_title)
+            now = time.monotonic()
+            if geometry is None or now - geometry.fetched_at > self.time_to_live:
+                geometry = self._refresh(window_title=window_title, geometry=geometry, now=now)
+
+        if geometry is None:
+            return None
+        return BoundingBox(*geometry.bounding_box.to_tuple())
+
+    def invalidate(self, window_title: str | None = None) -> None:
+        """
+        Drop cached geometry, so it is looked up again on the next access.
+
+        Args:
+            window_title: The title of the window to drop. Defaults to dropping all windows.
+        """
+        with self._lock:
+            if window_title is None:
+                self._geometries.clear()
+            else:
+                self._geometries.pop(window_title, None)
+
+    def _refresh(self, window_title: str, geometry: _WindowGeometry | None, now: float) -> _WindowGeometry | None:
+        """
+        Look up a window again, re-using the known handle as long as it is valid.
+
+        Args:
+            window_title: The title of the window.
+            geometry: The previously cached geometry, if there is any.
+            now: The current monotonic time.
+
+        Returns:
+            The refreshed geometry or None if no window exists.
+        """
+        window_handle = geometry.window_handle if geometry else None
+        if window_handle is None or not self.backend.is_window(window_handle):
+            window_handle = self.backend.find_window(window_title)
+
+        bounding_box = self.backend.get_window_rect(window_handle) if window_handle else None
+        if bounding_box is None:
+            self._geometries.pop(window_title, None)
+            return None
+
+        geometry = _WindowGeometry(window_handle=window_handle, bounding_box=bounding_box, fetched_at=now)
+        self._geometries[window_title] = geometry
+        return geometry
+
+
+_WINDOW_GEOMETRY = WindowGeometryCache(backend=Win32WindowBackend())
+
+
+def get_window_geometry() -> WindowGeometryCache:
+    """
+    Get the window geometry cache windows are currently looked up with.
+
+    Returns:
+        The active window geometry cache.
+    """
+    return _WINDOW_GEOMETRY
+
+
+def set_window_backend(backend: WindowBackend) -> WindowBackend:
+    """
+    Replace the backend windows are looked up with, for example to replay recorded frames.
+
+    Args:
+        backend: The backend to use from now on.
+
+    Returns:
+        The previously active backend.
+    """
+    previous_backend = _WINDOW_GEOMETRY.backend
+    _WINDOW_GEOMETRY.backend = backend
+    _WINDOW_GEOMETRY.invalidate()
+    return previous_backend